@@ -1,23 +1,97 @@
 """
-Flask API server for Geospatial Intelligence System
+ASGI API server for Geospatial Intelligence System
+
+Quart keeps the Flask-style routing/request API but runs on an event loop,
+so hundreds of in-flight external calls (OpenCage, OpenWeather, Overpass,
+Earth Engine, Gemini) can be multiplexed instead of blocking one worker
+thread each. Blocking system calls are dispatched via asyncio.to_thread.
+
+Run with: uvicorn api_server:app --workers 4
 """
 
-from flask import Flask, request, jsonify
-from flask_cors import CORS
+import asyncio
+
+from quart import Quart, Response, request, jsonify
+from quart.json.provider import DefaultJSONProvider
+from quart_cors import cors
+from cachetools import TTLCache
+from cachetools.keys import hashkey
+from pydantic import BaseModel, BeforeValidator, Field, ValidationError
 from geospatial_intelligence import GeospatialIntelligenceSystem
+import gzip
 import os
+import orjson
+import threading
 from dotenv import load_dotenv
-from datetime import datetime, timedelta
-import json
+from functools import wraps
+from typing import Annotated, Optional
+
+# Brotli compression (optional - gzip is always available)
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
 
 load_dotenv()
 
-app = Flask(__name__)
-CORS(app)  # Enable CORS for React frontend
 
-# Cache for locality lists (7 days TTL)
-# Structure: { city_name: { 'localities': [...], 'cached_at': datetime } }
-app.locality_list_cache = {}
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson (C-speed, handles numpy scalars natively)."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+app = Quart(__name__)
+app.json = ORJSONProvider(app)  # Both jsonify and request.get_json use this
+app = cors(app)  # Enable CORS for React frontend
+
+# Redis client (optional - only if REDIS_URL is provided)
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+LOCALITY_CACHE_TTL = 7 * 86400
+
+# Cache for locality lists, keyed by lowercased city name.
+# TTLCache evicts entries after 7 days and bounds memory to 500 cities,
+# so no manual cached_at bookkeeping is needed on reads.
+app.locality_list_cache = TTLCache(maxsize=500, ttl=LOCALITY_CACHE_TTL)
+
+# When REDIS_URL is set, locality entries are shared across workers in
+# Redis instead, so N workers pay for one Overpass fetch per city rather
+# than one each (and keep raw_data off every worker heap).
+redis_client = None
+if REDIS_AVAILABLE and os.getenv('REDIS_URL'):
+    redis_client = redis.Redis.from_url(os.getenv('REDIS_URL'))
+
+
+def _locality_cache_get(cache_key: str):
+    """Fetch a cached locality entry from Redis if configured, else in-process."""
+    if redis_client is not None:
+        try:
+            cached = redis_client.get(f'localities:{cache_key}')
+            return orjson.loads(cached) if cached else None
+        except redis.RedisError:
+            pass  # Fall back to the local cache if Redis is unreachable
+    return app.locality_list_cache.get(cache_key)
+
+
+def _locality_cache_set(cache_key: str, entry: dict):
+    """Store a locality entry in Redis if configured, else in-process."""
+    if redis_client is not None:
+        try:
+            redis_client.setex(f'localities:{cache_key}', LOCALITY_CACHE_TTL, orjson.dumps(entry))
+            return
+        except redis.RedisError:
+            pass
+    app.locality_list_cache[cache_key] = entry
 
 # Initialize system
 opencage_key = os.getenv('OPENCAGE_API_KEY')
@@ -32,8 +106,8 @@ if not opencage_key or not openweather_key:
     raise ValueError("API keys must be set in environment variables")
 
 system = GeospatialIntelligenceSystem(
-    opencage_key, 
-    openweather_key, 
+    opencage_key,
+    openweather_key,
     earthengine_project,
     supabase_url,
     supabase_key,
@@ -42,26 +116,189 @@ system = GeospatialIntelligenceSystem(
 )
 
 
+# Don't compress tiny payloads - the headers outweigh the savings
+COMPRESS_MIN_SIZE = 500
+
+
+@app.after_request
+async def compress_response(response):
+    """Compress large responses with brotli (preferred) or gzip.
+
+    Locality lists, Sentinel-2 results and time-series payloads can run to
+    hundreds of KB of JSON; compression cuts them 5-10x for clients that
+    advertise support.
+    """
+    accept_encoding = request.headers.get('Accept-Encoding', '')
+    if (response.status_code != 200
+            or 'Content-Encoding' in response.headers
+            or response.mimetype == 'application/x-ndjson'):  # streamed, don't buffer
+        return response
+
+    body = await response.get_data()
+    if len(body) < COMPRESS_MIN_SIZE:
+        return response
+
+    if BROTLI_AVAILABLE and 'br' in accept_encoding:
+        compressed = brotli.compress(body, quality=4)
+        encoding = 'br'
+    elif 'gzip' in accept_encoding:
+        compressed = gzip.compress(body, compresslevel=6)
+        encoding = 'gzip'
+    else:
+        return response
+
+    await response.set_data(compressed)
+    response.headers['Content-Encoding'] = encoding
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
+
+# Memo for the deterministic EE/Gemini pipelines: dashboards typically fire
+# several analyses for the same (location, radius, dates) in quick
+# succession, and each would otherwise redo the full Earth Engine round-trip.
+_analysis_cache = TTLCache(maxsize=1024, ttl=3600)
+
+# cachetools caches are not thread-safe, and these wrappers run on
+# concurrent asyncio.to_thread workers (/analyze-all fires five at once)
+_analysis_cache_lock = threading.Lock()
+
+
+def _cached_analysis(fn):
+    """Memoize a keyword-only system analysis call in the shared TTL cache."""
+    @wraps(fn)
+    def wrapper(**kwargs):
+        key = hashkey(fn.__name__, *(kwargs[k] for k in sorted(kwargs)))
+        with _analysis_cache_lock:
+            try:
+                return _analysis_cache[key]
+            except KeyError:
+                pass
+        result = fn(**kwargs)
+        with _analysis_cache_lock:
+            _analysis_cache[key] = result
+        return result
+    return wrapper
+
+
+_cached_sentinel2 = _cached_analysis(system.analyze_sentinel2)
+_cached_detect_features = _cached_analysis(system.detect_physical_features)
+_cached_crop_recommendations = _cached_analysis(system.get_crop_recommendations)
+_cached_urbanisation_risk = _cached_analysis(system.calculate_urbanisation_risk)
+_cached_ai_insights = _cached_analysis(system.get_ai_insights)
+_cached_carbon_footprint = _cached_analysis(system.calculate_carbon_footprint)
+_cached_economic_impact = _cached_analysis(system.calculate_economic_impact)
+
+
+# ---------------------------------------------------------------------------
+# Request models
+#
+# The location-based endpoints all share the same body shape; validating it
+# once in pydantic-core replaces the hand-rolled key/float/range checks that
+# were duplicated across every handler.
+# ---------------------------------------------------------------------------
+
+def _strip_str(value):
+    return value.strip() if isinstance(value, str) else value
+
+
+# Whitespace is trimmed during validation, so handlers never call .strip()
+StrippedStr = Annotated[str, BeforeValidator(_strip_str)]
+
+
+class LocationRequest(BaseModel):
+    """Common body for the location-based analysis endpoints."""
+    location: StrippedStr
+    buffer_radius_km: float = Field(2.0, gt=0, le=10)
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+
+
+class Sentinel2Request(LocationRequest):
+    cloud_cover_threshold: float = 10.0
+
+
+class PopulationRequest(LocationRequest):
+    population_per_km2: Optional[float] = None
+
+
+class AIInsightsRequest(PopulationRequest):
+    use_satellite_data: bool = False
+
+
+class TimeSeriesRequest(LocationRequest):
+    interval_years: int = Field(1, ge=1, le=5)
+
+
+class EconomicImpactRequest(LocationRequest):
+    population: Optional[float] = None
+
+
+class AnalyzeAllRequest(PopulationRequest):
+    population: Optional[float] = None
+
+
+def validate_body(model):
+    """Parse and validate the JSON body into `model`, returning 400 on failure.
+
+    The validated model is passed to the handler as its first argument.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        async def wrapper(*args, **kwargs):
+            data = await request.get_json(silent=True)
+            if data is None:
+                return jsonify({'error': 'JSON body is required'}), 400
+            try:
+                body = model.model_validate(data)
+            except ValidationError as e:
+                messages = '; '.join(
+                    f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}"
+                    for err in e.errors()
+                )
+                return jsonify({'error': messages}), 400
+            return await fn(body, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+MAX_POLYGON_VERTICES = 1000
+
+
+def _count_vertices(geometry: dict) -> int:
+    """Count polygon vertices, stopping as soon as the limit is exceeded."""
+    if geometry['type'] == 'Polygon':
+        rings = geometry['coordinates']
+    else:  # MultiPolygon
+        rings = (ring for polygon in geometry['coordinates'] for ring in polygon)
+
+    total = 0
+    for ring in rings:
+        total += len(ring)
+        if total > MAX_POLYGON_VERTICES:
+            break  # Already over the limit; no need to scan the rest
+    return total
+
+
 @app.route('/analyze-city', methods=['POST'])
-def analyze_city():
+async def analyze_city():
     """Analyze the entire city boundary"""
     try:
-        data = request.get_json()
+        data = await request.get_json()
         if not data or 'city' not in data:
             return jsonify({'error': 'City parameter is required'}), 400
 
         city_name = data['city'].strip()
-        result = system.analyze_location(city_name)
+        result = await asyncio.to_thread(system.analyze_location, city_name)
         return jsonify(result), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
 @app.route('/analyze-polygon', methods=['POST'])
-def analyze_polygon():
+async def analyze_polygon():
     """Analyze a user-drawn custom polygon"""
     try:
-        data = request.get_json()
+        data = await request.get_json()
         if not data or 'geometry' not in data:
             return jsonify({'error': 'Geometry parameter is required'}), 400
 
@@ -75,56 +312,47 @@ def analyze_polygon():
             return jsonify({'error': f'Unsupported geometry type: {geometry["type"]}. Only Polygon and MultiPolygon are supported.'}), 400
 
         # Check vertex count to avoid massive requests
-        vertex_count = 0
         try:
-            if geometry['type'] == 'Polygon':
-                for ring in geometry['coordinates']:
-                    vertex_count += len(ring)
-            elif geometry['type'] == 'MultiPolygon':
-                for polygon in geometry['coordinates']:
-                    for ring in polygon:
-                        vertex_count += len(ring)
+            vertex_count = _count_vertices(geometry)
         except (KeyError, TypeError):
             return jsonify({'error': 'Invalid coordinate structure in GeoJSON'}), 400
 
-        if vertex_count > 1000:
-            return jsonify({'error': 'Polygon has too many vertices (limit 1000)'}), 400
+        if vertex_count > MAX_POLYGON_VERTICES:
+            return jsonify({'error': f'Polygon has too many vertices (limit {MAX_POLYGON_VERTICES})'}), 400
 
-        result = system.analyze_polygon(geometry)
+        result = await asyncio.to_thread(system.analyze_polygon, geometry)
         return jsonify(result), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
 @app.route('/localities', methods=['POST'])
-def get_localities():
+async def get_localities():
     """Get list of localities for a city (fast, names only)"""
     try:
-        data = request.get_json()
-        
+        data = await request.get_json()
+
         if not data or 'city' not in data:
             return jsonify({'error': 'City parameter is required'}), 400
-        
+
         city_name = data['city'].strip()
+        cache_key = city_name.lower()
         radius_km = data.get('radius_km', 8)  # Default 8km (reduced to avoid Overpass API overload)
-        
-        # Check cache first (7 days TTL)
-        if city_name in app.locality_list_cache:
-            cached_data = app.locality_list_cache[city_name]
-            cached_at = cached_data.get('cached_at')
-            if cached_at:
-                age = datetime.now() - cached_at
-                if age.days < 7:
-                    # Return cached data
-                    return jsonify({
-                        'city': city_name,
-                        'localities': cached_data['localities'],
-                        'cached': True
-                    }), 200
-        
+
+        # Check cache first (entries expire after 7 days)
+        cached_data = _locality_cache_get(cache_key)
+        if cached_data:
+            return jsonify({
+                'city': city_name,
+                'localities': cached_data['localities'],
+                'cached': True
+            }), 200
+
         # Fetch localities (names and centers only, no polygons)
-        localities = system.geocoding.get_localities(city_name, radius_km)
-        
+        localities = await asyncio.to_thread(
+            system.geocoding.get_localities, city_name, radius_km
+        )
+
         # Build response with names only
         locality_list = []
         for loc in localities:
@@ -134,124 +362,234 @@ def get_localities():
                 'lon': loc.get('lon'),
                 'place_type': loc.get('place_type', 'unknown')
             })
-        
-        # Cache the locality list for 7 days
-        app.locality_list_cache[city_name] = {
+
+        # Cache the locality list for 7 days. name_index gives /analyze an
+        # O(1) case-insensitive lookup instead of scanning raw_data.
+        _locality_cache_set(cache_key, {
             'localities': locality_list,
             'raw_data': localities,  # Store raw data for geometry fetching
-            'cached_at': datetime.now()
-        }
-        
+            'name_index': {loc['name'].strip().lower(): loc for loc in localities}
+        })
+
         return jsonify({
             'city': city_name,
             'localities': locality_list,
             'cached': False
         }), 200
-        
+
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
 @app.route('/analyze', methods=['POST'])
-def analyze():
+async def analyze():
     """Analyze a locality (fetches geometry on-demand)"""
     try:
-        data = request.get_json()
-        
+        data = await request.get_json()
+
         if not data or 'city' not in data or 'locality' not in data:
             return jsonify({'error': 'City and locality parameters are required'}), 400
-        
+
         city_name = data['city'].strip()
         locality_name = data['locality'].strip()
         start_date = data.get('start_date')
         end_date = data.get('end_date')
-        
-        # Step 1: Find locality in cached list
+
+        # Step 1: Find locality in cached list (case-insensitive O(1) lookup)
         locality_info = None
-        if city_name in app.locality_list_cache:
-            cached_data = app.locality_list_cache[city_name]
-            raw_data = cached_data.get('raw_data', [])
-            
-            # Find matching locality (case-insensitive)
-            for loc in raw_data:
-                if loc['name'].strip().lower() == locality_name.lower():
-                    locality_info = loc
-                    break
-        
+        cached_data = _locality_cache_get(city_name.lower())
+        if cached_data:
+            name_index = cached_data.get('name_index', {})
+            locality_info = name_index.get(locality_name.lower())
+
         if not locality_info:
             # Locality not found in cache - user needs to fetch localities first
             available = []
-            if city_name in app.locality_list_cache:
-                cached_data = app.locality_list_cache[city_name]
+            if cached_data:
                 available = [loc['name'] for loc in cached_data.get('localities', [])]
-            
+
             error_msg = f'Locality "{locality_name}" not found. Please fetch localities first by clicking "Find Localities".'
             if available:
                 error_msg += f' Available localities: {", ".join(available[:10])}...'
             return jsonify({'error': error_msg}), 404
-        
+
         # Step 2: Fetch geometry on-demand for this ONE locality
-        locality_polygon, locality_bbox = system.geocoding.get_locality_geometry(
+        locality_polygon, locality_bbox = await asyncio.to_thread(
+            system.geocoding.get_locality_geometry,
             locality_info['name'],
             locality_info.get('lat', 0),
-            locality_info.get('lon', 0)
+            locality_info.get('lon', 0),
+            locality_info.get('osm_id'),
+            locality_info.get('osm_type')
         )
-        
+
         # Step 3: Run analysis
-        result = system.analyze_locality(
+        result = await asyncio.to_thread(
+            system.analyze_locality,
             city_name, locality_name, locality_polygon, locality_bbox,
             start_date, end_date
         )
         return jsonify(result), 200
-        
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/analyze-batch', methods=['POST'])
+async def analyze_batch():
+    """
+    Analyze many localities of one city in a single request
+
+    Accepts:
+    - city: City name (localities must have been fetched via /localities first)
+    - localities: List of locality names
+    - start_date: Optional start date (YYYY-MM-DD)
+    - end_date: Optional end date (YYYY-MM-DD)
+
+    Returns:
+    - {'city': ..., 'results': [{'locality': name, 'result': ...} or
+      {'locality': name, 'error': ...}]}
+
+    Geometry fetches and analyses run concurrently (bounded fan-out), so
+    total wall time is close to the slowest locality rather than the sum.
+    """
+    try:
+        data = await request.get_json()
+
+        if not data or 'city' not in data or 'localities' not in data:
+            return jsonify({'error': 'City and localities parameters are required'}), 400
+
+        city_name = data['city'].strip()
+        locality_names = data['localities']
+        start_date = data.get('start_date')
+        end_date = data.get('end_date')
+
+        if not isinstance(locality_names, list) or not locality_names:
+            return jsonify({'error': 'localities must be a non-empty list of names'}), 400
+
+        cached_data = _locality_cache_get(city_name.lower())
+        if not cached_data:
+            return jsonify({
+                'error': f'No cached localities for "{city_name}". Please fetch localities first.'
+            }), 404
+
+        name_index = cached_data.get('name_index', {})
+        semaphore = asyncio.Semaphore(16)  # Bound concurrent Overpass/EE fan-out
+
+        def _analyze_one(locality_name, locality_info):
+            locality_polygon, locality_bbox = system.geocoding.get_locality_geometry(
+                locality_info['name'],
+                locality_info.get('lat', 0),
+                locality_info.get('lon', 0),
+                osm_id=locality_info.get('osm_id'),
+                osm_type=locality_info.get('osm_type')
+            )
+            return system.analyze_locality(
+                city_name, locality_name, locality_polygon, locality_bbox,
+                start_date, end_date
+            )
+
+        async def _run_one(locality_name):
+            locality_info = name_index.get(locality_name.strip().lower())
+            if not locality_info:
+                return {'locality': locality_name, 'error': f'Locality "{locality_name}" not found'}
+            async with semaphore:
+                try:
+                    result = await asyncio.to_thread(_analyze_one, locality_name, locality_info)
+                    return {'locality': locality_name, 'result': result}
+                except Exception as e:
+                    return {'locality': locality_name, 'error': str(e)}
+
+        results = await asyncio.gather(*(_run_one(name) for name in locality_names))
+
+        return jsonify({'city': city_name, 'results': results}), 200
+
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/analyze-all', methods=['POST'])
+@validate_body(AnalyzeAllRequest)
+async def analyze_all(body: AnalyzeAllRequest):
+    """
+    Run the five independent analyses for one location in a single request
+
+    Accepts:
+    - location: City name or coordinates (lat,lon)
+    - buffer_radius_km: Optional buffer radius in km (default 2.0)
+    - start_date: Optional start date (YYYY-MM-DD)
+    - end_date: Optional end date (YYYY-MM-DD)
+    - population_per_km2: Optional population density per km²
+    - population: Optional population count
+
+    Returns:
+    - {'sentinel2': ..., 'features': ..., 'urbanisation_risk': ...,
+      'carbon_footprint': ..., 'economic_impact': ...} where each value is
+      {'result': ...} or {'error': ...}
+
+    The analyses do independent EE/Gemini I/O, so running them
+    concurrently cuts wall time from their sum to roughly the slowest
+    one, and saves four HTTP round-trips from the dashboard.
+    """
+    common = {
+        'location': body.location,
+        'buffer_radius_km': body.buffer_radius_km,
+        'start_date': body.start_date,
+        'end_date': body.end_date,
+    }
+    tasks = {
+        'sentinel2': (_cached_sentinel2, common),
+        'features': (_cached_detect_features, common),
+        'urbanisation_risk': (
+            _cached_urbanisation_risk,
+            {**common, 'population_per_km2': body.population_per_km2},
+        ),
+        'carbon_footprint': (_cached_carbon_footprint, common),
+        'economic_impact': (_cached_economic_impact, {**common, 'population': body.population}),
+    }
+
+    async def _run(name, fn, kwargs):
+        try:
+            return name, {'result': await asyncio.to_thread(fn, **kwargs)}
+        except Exception as e:
+            return name, {'error': str(e)}
+
+    results = dict(await asyncio.gather(
+        *(_run(name, fn, kwargs) for name, (fn, kwargs) in tasks.items())
+    ))
+
+    return jsonify(results), 200
+
+
 @app.route('/analyze-sentinel2', methods=['POST'])
-def analyze_sentinel2():
+@validate_body(Sentinel2Request)
+async def analyze_sentinel2(body: Sentinel2Request):
     """
     Analyze land cover using Sentinel-2 SR with spectral indices
-    
+
     Accepts:
     - location: City name or coordinates (lat,lon)
     - buffer_radius_km: Optional buffer radius in km (default 2.0)
     - start_date: Optional start date (YYYY-MM-DD)
     - end_date: Optional end date (YYYY-MM-DD)
     - cloud_cover_threshold: Optional cloud cover threshold (default 10.0)
-    
+
     Returns:
     - Clean JSON with land cover percentages, warnings, and methodology
     """
     try:
-        data = request.get_json()
-        
-        if not data or 'location' not in data:
-            return jsonify({'error': 'Location parameter is required'}), 400
-        
-        location = data['location'].strip()
-        buffer_radius_km = float(data.get('buffer_radius_km', 2.0))
-        start_date = data.get('start_date')
-        end_date = data.get('end_date')
-        cloud_cover_threshold = float(data.get('cloud_cover_threshold', 10.0))
-        
-        # Validate buffer radius
-        if buffer_radius_km <= 0 or buffer_radius_km > 10:
-            return jsonify({
-                'error': 'Buffer radius must be between 0 and 10 km'
-            }), 400
-        
         # Run Sentinel-2 analysis
-        result = system.analyze_sentinel2(
-            location=location,
-            buffer_radius_km=buffer_radius_km,
-            start_date=start_date,
-            end_date=end_date,
-            cloud_cover_threshold=cloud_cover_threshold
+        result = await asyncio.to_thread(
+            _cached_sentinel2,
+            location=body.location,
+            buffer_radius_km=body.buffer_radius_km,
+            start_date=body.start_date,
+            end_date=body.end_date,
+            cloud_cover_threshold=body.cloud_cover_threshold
         )
-        
+
         return jsonify(result), 200
-        
+
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
     except RuntimeError as e:
@@ -261,46 +599,32 @@ def analyze_sentinel2():
 
 
 @app.route('/detect-features', methods=['POST'])
-def detect_features():
+@validate_body(LocationRequest)
+async def detect_features(body: LocationRequest):
     """
     Detect and mark physical features in satellite images
-    
+
     Accepts:
     - location: City name or coordinates (lat,lon)
     - buffer_radius_km: Optional buffer radius in km (default 2.0)
     - start_date: Optional start date (YYYY-MM-DD)
     - end_date: Optional end date (YYYY-MM-DD)
-    
+
     Returns:
     - Dictionary with detected features (water bodies, vegetation, urban areas, agricultural fields)
     """
     try:
-        data = request.get_json()
-        
-        if not data or 'location' not in data:
-            return jsonify({'error': 'Location parameter is required'}), 400
-        
-        location = data['location'].strip()
-        buffer_radius_km = float(data.get('buffer_radius_km', 2.0))
-        start_date = data.get('start_date')
-        end_date = data.get('end_date')
-        
-        # Validate buffer radius
-        if buffer_radius_km <= 0 or buffer_radius_km > 10:
-            return jsonify({
-                'error': 'Buffer radius must be between 0 and 10 km'
-            }), 400
-        
         # Detect physical features
-        result = system.detect_physical_features(
-            location=location,
-            buffer_radius_km=buffer_radius_km,
-            start_date=start_date,
-            end_date=end_date
+        result = await asyncio.to_thread(
+            _cached_detect_features,
+            location=body.location,
+            buffer_radius_km=body.buffer_radius_km,
+            start_date=body.start_date,
+            end_date=body.end_date
         )
-        
+
         return jsonify(result), 200
-        
+
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
     except RuntimeError as e:
@@ -310,49 +634,34 @@ def detect_features():
 
 
 @app.route('/crop-recommendations', methods=['POST'])
-def crop_recommendations():
+@validate_body(PopulationRequest)
+async def crop_recommendations(body: PopulationRequest):
     """
     Get crop suitability recommendations for a region using Gemini API
-    
+
     Accepts:
     - location: City name or coordinates (lat,lon)
     - buffer_radius_km: Optional buffer radius in km (default 2.0)
     - start_date: Optional start date (YYYY-MM-DD)
     - end_date: Optional end date (YYYY-MM-DD)
     - population_per_km2: Optional population density per km²
-    
+
     Returns:
     - Dictionary with crop recommendations from Gemini API
     """
     try:
-        data = request.get_json()
-        
-        if not data or 'location' not in data:
-            return jsonify({'error': 'Location parameter is required'}), 400
-        
-        location = data['location'].strip()
-        buffer_radius_km = float(data.get('buffer_radius_km', 2.0))
-        start_date = data.get('start_date')
-        end_date = data.get('end_date')
-        population_per_km2 = data.get('population_per_km2')
-        
-        # Validate buffer radius
-        if buffer_radius_km <= 0 or buffer_radius_km > 10:
-            return jsonify({
-                'error': 'Buffer radius must be between 0 and 10 km'
-            }), 400
-        
         # Get crop recommendations
-        result = system.get_crop_recommendations(
-            location=location,
-            buffer_radius_km=buffer_radius_km,
-            start_date=start_date,
-            end_date=end_date,
-            population_per_km2=population_per_km2
+        result = await asyncio.to_thread(
+            _cached_crop_recommendations,
+            location=body.location,
+            buffer_radius_km=body.buffer_radius_km,
+            start_date=body.start_date,
+            end_date=body.end_date,
+            population_per_km2=body.population_per_km2
         )
-        
+
         return jsonify(result), 200
-        
+
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
     except RuntimeError as e:
@@ -362,49 +671,34 @@ def crop_recommendations():
 
 
 @app.route('/urbanisation-risk', methods=['POST'])
-def urbanisation_risk():
+@validate_body(PopulationRequest)
+async def urbanisation_risk(body: PopulationRequest):
     """
     Calculate Urbanisation Risk Score (URS) for a region
-    
+
     Accepts:
     - location: City name or coordinates (lat,lon)
     - buffer_radius_km: Optional buffer radius in km (default 2.0)
     - start_date: Optional start date (YYYY-MM-DD)
     - end_date: Optional end date (YYYY-MM-DD)
     - population_per_km2: Optional population density per km²
-    
+
     Returns:
     - Dictionary with URS score, risk level, and breakdown
     """
     try:
-        data = request.get_json()
-        
-        if not data or 'location' not in data:
-            return jsonify({'error': 'Location parameter is required'}), 400
-        
-        location = data['location'].strip()
-        buffer_radius_km = float(data.get('buffer_radius_km', 2.0))
-        start_date = data.get('start_date')
-        end_date = data.get('end_date')
-        population_per_km2 = data.get('population_per_km2')
-        
-        # Validate buffer radius
-        if buffer_radius_km <= 0 or buffer_radius_km > 10:
-            return jsonify({
-                'error': 'Buffer radius must be between 0 and 10 km'
-            }), 400
-        
         # Calculate urbanisation risk
-        result = system.calculate_urbanisation_risk(
-            location=location,
-            buffer_radius_km=buffer_radius_km,
-            start_date=start_date,
-            end_date=end_date,
-            population_per_km2=population_per_km2
+        result = await asyncio.to_thread(
+            _cached_urbanisation_risk,
+            location=body.location,
+            buffer_radius_km=body.buffer_radius_km,
+            start_date=body.start_date,
+            end_date=body.end_date,
+            population_per_km2=body.population_per_km2
         )
-        
+
         return jsonify(result), 200
-        
+
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
     except RuntimeError as e:
@@ -414,10 +708,11 @@ def urbanisation_risk():
 
 
 @app.route('/ai-insights', methods=['POST'])
-def ai_insights():
+@validate_body(AIInsightsRequest)
+async def ai_insights(body: AIInsightsRequest):
     """
     Get AI-powered insights using Gemini Flash
-    
+
     Accepts:
     - location: City name or coordinates (lat,lon)
     - use_satellite_data: Optional boolean (default False) - if False, uses Gemini directly without Sentinel-2
@@ -425,37 +720,23 @@ def ai_insights():
     - start_date: Optional start date (YYYY-MM-DD, only used if use_satellite_data=True)
     - end_date: Optional end date (YYYY-MM-DD, only used if use_satellite_data=True)
     - population_per_km2: Optional population density per km²
-    
+
     Returns:
     - Dictionary with AI-generated insights
     """
     try:
-        data = request.get_json()
-        
-        if not data or 'location' not in data:
-            return jsonify({'error': 'Location parameter is required'}), 400
-        
-        location = data['location'].strip()
-        use_satellite_data = data.get('use_satellite_data', False)  # Default to False - direct Gemini analysis
-        buffer_radius_km = float(data.get('buffer_radius_km', 2.0))
-        start_date = data.get('start_date')
-        end_date = data.get('end_date')
-        population_per_km2 = data.get('population_per_km2')
-        
-        if buffer_radius_km <= 0 or buffer_radius_km > 10:
-            return jsonify({'error': 'Buffer radius must be between 0 and 10 km'}), 400
-        
-        result = system.get_ai_insights(
-            location=location,
-            buffer_radius_km=buffer_radius_km,
-            start_date=start_date,
-            end_date=end_date,
-            population_per_km2=population_per_km2,
-            use_satellite_data=use_satellite_data
+        result = await asyncio.to_thread(
+            _cached_ai_insights,
+            location=body.location,
+            buffer_radius_km=body.buffer_radius_km,
+            start_date=body.start_date,
+            end_date=body.end_date,
+            population_per_km2=body.population_per_km2,
+            use_satellite_data=body.use_satellite_data
         )
-        
+
         return jsonify(result), 200
-        
+
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
     except RuntimeError as e:
@@ -465,93 +746,86 @@ def ai_insights():
 
 
 @app.route('/time-series', methods=['POST'])
-def time_series():
+@validate_body(TimeSeriesRequest)
+async def time_series(body: TimeSeriesRequest):
     """
     Analyze land cover changes over time
-    
+
     Accepts:
     - location: City name or coordinates (lat,lon)
     - buffer_radius_km: Optional buffer radius in km (default 2.0)
     - start_date: Optional start date (YYYY-MM-DD), defaults to 5 years ago
     - end_date: Optional end date (YYYY-MM-DD), defaults to now
     - interval_years: Analysis interval in years (default 1)
-    
+
     Returns:
-    - Dictionary with time-series data
+    - NDJSON stream: one line per interval ({'year', 'date', 'land_cover',
+      'satellite_date'}), then a final summary line with 'changes'
+
+    Streaming keeps memory constant regardless of the time range and gets
+    the first interval to the client as soon as it is computed.
     """
-    try:
-        data = request.get_json()
-        
-        if not data or 'location' not in data:
-            return jsonify({'error': 'Location parameter is required'}), 400
-        
-        location = data['location'].strip()
-        buffer_radius_km = float(data.get('buffer_radius_km', 2.0))
-        start_date = data.get('start_date')
-        end_date = data.get('end_date')
-        interval_years = int(data.get('interval_years', 1))
-        
-        if buffer_radius_km <= 0 or buffer_radius_km > 10:
-            return jsonify({'error': 'Buffer radius must be between 0 and 10 km'}), 400
-        
-        if interval_years < 1 or interval_years > 5:
-            return jsonify({'error': 'Interval years must be between 1 and 5'}), 400
-        
-        result = system.analyze_time_series(
-            location=location,
-            buffer_radius_km=buffer_radius_km,
-            start_date=start_date,
-            end_date=end_date,
-            interval_years=interval_years
-        )
-        
-        return jsonify(result), 200
-        
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except RuntimeError as e:
-        return jsonify({'error': str(e)}), 500
-    except Exception as e:
-        return jsonify({'error': f'Unexpected error: {str(e)}'}), 500
+    location = body.location
+    gen = system.iter_time_series(
+        location=location,
+        buffer_radius_km=body.buffer_radius_km,
+        start_date=body.start_date,
+        end_date=body.end_date,
+        interval_years=body.interval_years
+    )
+
+    async def stream_ndjson():
+        intervals = []
+        sentinel = object()
+        try:
+            while True:
+                # The generator blocks on Earth Engine; pull each interval
+                # off the event loop on a worker thread.
+                item = await asyncio.to_thread(next, gen, sentinel)
+                if item is sentinel:
+                    break
+                intervals.append(item)
+                yield orjson.dumps(item) + b'\n'
+
+            summary = {
+                'location': location,
+                'changes': system.summarize_time_series_changes(intervals),
+                'interval_years': body.interval_years
+            }
+            yield orjson.dumps(summary) + b'\n'
+        except Exception as e:
+            # Headers are already sent; report the failure in-band
+            yield orjson.dumps({'error': str(e)}) + b'\n'
+
+    return Response(stream_ndjson(), mimetype='application/x-ndjson')
 
 
 @app.route('/carbon-footprint', methods=['POST'])
-def carbon_footprint():
+@validate_body(LocationRequest)
+async def carbon_footprint(body: LocationRequest):
     """
     Calculate carbon footprint and sequestration potential
-    
+
     Accepts:
     - location: City name or coordinates (lat,lon)
     - buffer_radius_km: Optional buffer radius in km (default 2.0)
     - start_date: Optional start date (YYYY-MM-DD)
     - end_date: Optional end date (YYYY-MM-DD)
-    
+
     Returns:
     - Dictionary with carbon calculations in rupees
     """
     try:
-        data = request.get_json()
-        
-        if not data or 'location' not in data:
-            return jsonify({'error': 'Location parameter is required'}), 400
-        
-        location = data['location'].strip()
-        buffer_radius_km = float(data.get('buffer_radius_km', 2.0))
-        start_date = data.get('start_date')
-        end_date = data.get('end_date')
-        
-        if buffer_radius_km <= 0 or buffer_radius_km > 10:
-            return jsonify({'error': 'Buffer radius must be between 0 and 10 km'}), 400
-        
-        result = system.calculate_carbon_footprint(
-            location=location,
-            buffer_radius_km=buffer_radius_km,
-            start_date=start_date,
-            end_date=end_date
+        result = await asyncio.to_thread(
+            _cached_carbon_footprint,
+            location=body.location,
+            buffer_radius_km=body.buffer_radius_km,
+            start_date=body.start_date,
+            end_date=body.end_date
         )
-        
+
         return jsonify(result), 200
-        
+
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
     except RuntimeError as e:
@@ -561,45 +835,33 @@ def carbon_footprint():
 
 
 @app.route('/economic-impact', methods=['POST'])
-def economic_impact():
+@validate_body(EconomicImpactRequest)
+async def economic_impact(body: EconomicImpactRequest):
     """
     Calculate economic impact in Indian Rupees
-    
+
     Accepts:
     - location: City name or coordinates (lat,lon)
     - buffer_radius_km: Optional buffer radius in km (default 2.0)
     - start_date: Optional start date (YYYY-MM-DD)
     - end_date: Optional end date (YYYY-MM-DD)
     - population: Optional population count
-    
+
     Returns:
     - Dictionary with economic impact calculations in rupees
     """
     try:
-        data = request.get_json()
-        
-        if not data or 'location' not in data:
-            return jsonify({'error': 'Location parameter is required'}), 400
-        
-        location = data['location'].strip()
-        buffer_radius_km = float(data.get('buffer_radius_km', 2.0))
-        start_date = data.get('start_date')
-        end_date = data.get('end_date')
-        population = data.get('population')
-        
-        if buffer_radius_km <= 0 or buffer_radius_km > 10:
-            return jsonify({'error': 'Buffer radius must be between 0 and 10 km'}), 400
-        
-        result = system.calculate_economic_impact(
-            location=location,
-            buffer_radius_km=buffer_radius_km,
-            start_date=start_date,
-            end_date=end_date,
-            population=population
+        result = await asyncio.to_thread(
+            _cached_economic_impact,
+            location=body.location,
+            buffer_radius_km=body.buffer_radius_km,
+            start_date=body.start_date,
+            end_date=body.end_date,
+            population=body.population
         )
-        
+
         return jsonify(result), 200
-        
+
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
     except RuntimeError as e:
@@ -608,12 +870,16 @@ def economic_impact():
         return jsonify({'error': f'Unexpected error: {str(e)}'}), 500
 
 
+# Liveness probes hit /health every second; serve pre-serialized bytes so
+# each probe skips jsonify and dict allocation entirely.
+_HEALTH_BODY = b'{"status":"healthy"}'
+
+
 @app.route('/health', methods=['GET'])
-def health():
+async def health():
     """Health check endpoint"""
-    return jsonify({'status': 'healthy'}), 200
+    return Response(_HEALTH_BODY, mimetype='application/json')
 
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000, debug=True)
-
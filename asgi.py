@@ -0,0 +1,19 @@
+"""
+Production entrypoint for the API server.
+
+The app is ASGI (Quart), so gevent monkey-patching does not apply here;
+I/O concurrency comes from the event loop instead. Serve with gunicorn's
+uvicorn worker to get multi-process + async concurrency:
+
+    gunicorn -k uvicorn.workers.UvicornWorker -w $(nproc) -b 0.0.0.0:5000 asgi:app
+
+or directly with uvicorn:
+
+    uvicorn asgi:app --workers 4 --host 0.0.0.0 --port 5000
+
+Never serve production traffic with `python api_server.py` (debug dev server).
+"""
+
+from api_server import app
+
+__all__ = ['app']
@@ -3,19 +3,181 @@ Satellite-based Geospatial Intelligence System
 Real-time land cover classification and climate risk assessment
 """
 
+from __future__ import annotations
+
+import asyncio
+import csv
+import hashlib
+import importlib.util
+import io
 import os
 import json
+import math
+import re
+import sys
+import threading
 import numpy as np
-import ee
+import orjson
 import requests
 import time
 from typing import Dict, Tuple, List, Optional
+from cachetools import TTLCache
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from opencage.geocoder import OpenCageGeocode
+from functools import cached_property, lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import warnings
 warnings.filterwarnings('ignore')
 
+
+def _lazy_import(name: str):
+    """Import a module lazily: loaded on first attribute access.
+
+    earthengine-api alone takes ~500ms to import (protobuf init), which
+    penalizes callers that only need the dataclasses or geocoding helpers.
+    """
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+ee = _lazy_import('ee')
+
+
+def _build_http_session() -> requests.Session:
+    """Build the shared HTTP session with connection pooling and retries.
+
+    All external calls (Nominatim, Overpass, OpenWeather, USGS, NewsAPI)
+    go through this session so TCP+TLS handshakes are paid once per host
+    instead of once per request.
+
+    Deliberately requests/HTTP1.1 rather than an HTTP/2 client: the
+    status-aware urllib3 Retry below and the raw-socket streaming used by
+    the Overpass parser have no httpx equivalent without an async
+    refactor, and keep-alive pooling already amortizes connection setup
+    against these hosts.
+    """
+    session = requests.Session()
+    session.headers['User-Agent'] = 'GeospatialIntelligenceSystem/1.0'
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=50,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 502, 503, 504),
+            allowed_methods=frozenset(['GET', 'POST'])
+        )
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+HTTP_SESSION = _build_http_session()
+
+# Overpass mirrors, queried concurrently with first-success-wins
+OVERPASS_SERVERS = [
+    "https://overpass-api.de/api/interpreter",
+    "https://overpass.kumi.systems/api/interpreter",
+    "https://overpass.openstreetmap.ru/api/interpreter"
+]
+
+# Patterns for pulling an error message out of an Overpass HTML error page,
+# compiled once at import instead of on every failure path
+_HTML_P_RE = re.compile(r'<p[^>]*>(.*?)</p>', re.IGNORECASE | re.DOTALL)
+_HTML_TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+
+# Matches bare "lat,lon" input, e.g. "28.6139, 77.2090"
+_COORD_RE = re.compile(r'^\s*(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)\s*$')
+
+
+def _post_overpass_any(overpass_query: str, timeout: int,
+                       stream: bool = False) -> Tuple[Optional[requests.Response], Optional[str]]:
+    """POST a query to all Overpass mirrors concurrently, first success wins.
+
+    Firing the mirrors in parallel collapses worst-case latency from the sum
+    of the per-server timeouts to the first mirror that answers; the
+    executor is shut down without waiting, so laggard requests are simply
+    abandoned and their threads wind down on their own timeouts.
+
+    Args:
+        stream: When True, return the winning response unread so the caller
+            can parse the body incrementally; success is then judged on
+            status code alone since reading the body would buffer it
+
+    Returns:
+        Tuple of (response, last_error); response is None if every mirror failed
+    """
+    def _fetch(server_url):
+        return HTTP_SESSION.post(server_url, data=overpass_query,
+                                 timeout=timeout, stream=stream)
+
+    def _close_late_response(finished):
+        # A laggard mirror can still deliver a streamed 200 after the
+        # winner returned; close it so its pooled connection goes back to
+        # HTTP_SESSION instead of leaking until GC
+        try:
+            late_response = finished.result()
+        except Exception:
+            return
+        if late_response is not None:
+            late_response.close()
+
+    last_error = None
+    # No `with` block: its __exit__ is shutdown(wait=True), which would make
+    # the winner block until the slowest mirror finishes its full timeout
+    executor = ThreadPoolExecutor(max_workers=len(OVERPASS_SERVERS))
+    try:
+        futures = {executor.submit(_fetch, url): url for url in OVERPASS_SERVERS}
+        for future in as_completed(futures):
+            server_url = futures[future]
+            try:
+                response = future.result()
+            except requests.exceptions.Timeout:
+                last_error = f"Server {server_url} timed out"
+                continue
+            except requests.exceptions.ConnectionError as e:
+                last_error = f"Server {server_url} connection error: {str(e)}"
+                continue
+            except Exception as e:
+                last_error = f"Server {server_url} error: {str(e)}"
+                continue
+
+            if response.status_code == 200 and (stream or (response.text and response.text.strip())):
+                if stream:
+                    # Streamed bodies are only released when read or closed
+                    # (non-stream laggards buffer fully and release on
+                    # their own); already-finished futures fire immediately
+                    # and close() is idempotent
+                    for other in futures:
+                        if other is not future:
+                            other.add_done_callback(_close_late_response)
+                return response, last_error
+
+            if response.status_code == 200:
+                last_error = f"Server {server_url} returned empty response"
+            elif response.status_code == 504:
+                last_error = f"Server {server_url} timed out (504)"
+            elif response.status_code == 429:
+                last_error = f"Server {server_url} rate limited (429)"
+            else:
+                last_error = (f"Server {server_url} returned status {response.status_code}: "
+                              f"{response.text[:100] if response.text else 'No response body'}")
+            if stream:
+                response.close()
+
+        return None, last_error
+    finally:
+        executor.shutdown(wait=False)
+
 # Supabase client (optional - only if credentials are provided)
 try:
     from supabase import create_client, Client
@@ -23,8 +185,257 @@ try:
 except ImportError:
     SUPABASE_AVAILABLE = False
 
+# On-disk cache for geocoding/Overpass lookups (optional)
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+# JIT-compiled distance filter (optional)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Incremental JSON parsing for large Overpass payloads (optional)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# R-tree spatial index for repeated point-in-bbox lookups (optional)
+try:
+    from rtree import index as rtree_index
+    RTREE_AVAILABLE = True
+except ImportError:
+    RTREE_AVAILABLE = False
+
+# S2 cell coverings for fallback tile grids (optional)
+try:
+    import s2sphere
+    S2SPHERE_AVAILABLE = True
+except ImportError:
+    S2SPHERE_AVAILABLE = False
+
+_EARTH_RADIUS_KM = 6371.0
+
+
+def _parse_label_histogram(label_hist: Dict) -> Dict[int, int]:
+    """Parse an EE frequency histogram {label_str: count} into int counts.
+
+    One NumPy pass over the keys and values replaces the per-entry
+    int(float(...)) loops; labels outside the valid Dynamic World range
+    (0-7 — the -1 key marks masked pixels) and non-positive counts are
+    dropped.
+    """
+    if not label_hist:
+        return {}
+    try:
+        keys = (np.fromiter(label_hist.keys(), dtype='U8', count=len(label_hist))
+                .astype(np.float64).astype(np.int64))
+        vals = (np.fromiter(label_hist.values(), dtype=np.float64, count=len(label_hist))
+                .astype(np.int64))
+    except (ValueError, TypeError):
+        # Malformed histogram: tolerant per-entry parse so one bad label
+        # doesn't drop the rest
+        parsed = {}
+        for k, v in label_hist.items():
+            try:
+                label = int(float(k))
+                count = int(float(v))
+            except (ValueError, TypeError):
+                continue
+            if 0 <= label <= 7 and count > 0:
+                parsed[label] = count
+        return parsed
+
+    mask = (keys >= 0) & (keys <= 7) & (vals > 0)
+    return dict(zip(keys[mask].tolist(), vals[mask].tolist()))
+
 
-@dataclass
+@lru_cache(maxsize=64)
+def _grid_params(min_lat: float, max_lat: float,
+                 tile_km: float = 2.0) -> Tuple[float, float]:
+    """Tile size in degrees for a lat band (cached — trig repeats per AOI).
+
+    Approximate conversion: 1 degree latitude ~ 111 km; 1 degree longitude
+    ~ 111 km * cos(latitude), taken at the band's average latitude.
+    """
+    avg_lat = (min_lat + max_lat) / 2
+    tile_size_lat = tile_km / 111.0
+    tile_size_lon = tile_km / (111.0 * abs(math.cos(math.radians(avg_lat))))
+    return tile_size_lat, tile_size_lon
+
+
+def _haversine_mask_numpy(lats: np.ndarray, lons: np.ndarray,
+                          center_lat: float, center_lon: float,
+                          radius_km: float) -> np.ndarray:
+    """Vectorized great-circle radius filter (NumPy fallback path)."""
+    lat1 = np.radians(lats)
+    lat2 = math.radians(center_lat)
+    dlat = lat1 - lat2
+    dlon = np.radians(lons) - math.radians(center_lon)
+    a = np.sin(dlat / 2.0) ** 2 + np.cos(lat1) * math.cos(lat2) * np.sin(dlon / 2.0) ** 2
+    return 2.0 * _EARTH_RADIUS_KM * np.arcsin(np.sqrt(a)) <= radius_km
+
+
+def _adaptive_tile_km(bbox: 'BoundingBox') -> float:
+    """Tile edge (km) targeting ~500 tiles; the 2 km floor keeps city-sized
+    AOIs on the current grid, while state-sized AOIs no longer explode into
+    tens of thousands of cells."""
+    avg_lat = (bbox.min_lat + bbox.max_lat) / 2
+    lat_km = (bbox.max_lat - bbox.min_lat) * 111.0
+    lon_km = (bbox.max_lon - bbox.min_lon) * 111.0 * abs(math.cos(math.radians(avg_lat)))
+    return max(2.0, math.sqrt(lat_km * lon_km / 500.0))
+
+
+def _s2_covering_rings(bbox: 'BoundingBox', level: int = 12) -> List[List[Tuple[float, float]]]:
+    """Cover a bounding box with level-12 S2 cells (~2 km edge, uniform area).
+
+    S2 cells tile the sphere exactly — no gaps, no overlap — and their area
+    does not drift with latitude the way degree-based rectangles do, so the
+    grid stays honest near high latitudes. Returns one (lon, lat) vertex
+    ring per cell. Requires s2sphere.
+    """
+    rect = s2sphere.LatLngRect.from_point_pair(
+        s2sphere.LatLng.from_degrees(bbox.min_lat, bbox.min_lon),
+        s2sphere.LatLng.from_degrees(bbox.max_lat, bbox.max_lon))
+    coverer = s2sphere.RegionCoverer()
+    coverer.min_level = level
+    coverer.max_level = level
+    coverer.max_cells = 10000
+    rings = []
+    for cell_id in coverer.get_covering(rect):
+        cell = s2sphere.Cell(cell_id)
+        ring = []
+        for k in range(4):
+            lat_lng = s2sphere.LatLng.from_point(cell.get_vertex(k))
+            ring.append((lat_lng.lng().degrees, lat_lng.lat().degrees))
+        rings.append(ring)
+    return rings
+
+
+def _grid_corners_numpy(min_lat: float, max_lat: float,
+                        min_lon: float, max_lon: float,
+                        tile_size_lat: float, tile_size_lon: float) -> np.ndarray:
+    """(N, 4) array of [x1, y1, x2, y2] tile corners (NumPy fallback path)."""
+    lons = np.arange(min_lon, max_lon, tile_size_lon)
+    lats = np.arange(min_lat, max_lat, tile_size_lat)
+    lon_grid, lat_grid = np.meshgrid(lons, lats)
+    x1 = lon_grid.ravel()
+    y1 = lat_grid.ravel()
+    x2 = np.minimum(x1 + tile_size_lon, max_lon)
+    y2 = np.minimum(y1 + tile_size_lat, max_lat)
+    return np.stack([x1, y1, x2, y2], axis=1)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _grid_corners(min_lat, max_lat, min_lon, max_lon,
+                      tile_size_lat, tile_size_lon):  # pragma: no cover
+        lons = np.arange(min_lon, max_lon, tile_size_lon)
+        lats = np.arange(min_lat, max_lat, tile_size_lat)
+        out = np.empty((lats.size * lons.size, 4), dtype=np.float64)
+        idx = 0
+        for i in range(lats.size):
+            y1 = lats[i]
+            y2 = min(y1 + tile_size_lat, max_lat)
+            for j in range(lons.size):
+                x1 = lons[j]
+                out[idx, 0] = x1
+                out[idx, 1] = y1
+                out[idx, 2] = min(x1 + tile_size_lon, max_lon)
+                out[idx, 3] = y2
+                idx += 1
+        return out
+else:
+    _grid_corners = _grid_corners_numpy
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _label_tree_patches(is_tree):  # pragma: no cover
+        # Two-pass connected-components labeling (4-connectivity) with
+        # union-find; the neighbor traversal compiles to a tight loop
+        h, w = is_tree.shape
+        labels = np.zeros((h, w), dtype=np.int64)
+        parent = np.zeros(h * w + 1, dtype=np.int64)
+        next_label = 1
+        for i in range(h):
+            for j in range(w):
+                if not is_tree[i, j]:
+                    continue
+                up = labels[i - 1, j] if i > 0 else 0
+                left = labels[i, j - 1] if j > 0 else 0
+                if up == 0 and left == 0:
+                    labels[i, j] = next_label
+                    parent[next_label] = next_label
+                    next_label += 1
+                elif up == 0:
+                    labels[i, j] = left
+                elif left == 0:
+                    labels[i, j] = up
+                else:
+                    root_up = up
+                    while parent[root_up] != root_up:
+                        root_up = parent[root_up]
+                    root_left = left
+                    while parent[root_left] != root_left:
+                        root_left = parent[root_left]
+                    root = root_up if root_up < root_left else root_left
+                    parent[root_up] = root
+                    parent[root_left] = root
+                    labels[i, j] = root
+        for i in range(h):
+            for j in range(w):
+                label = labels[i, j]
+                if label != 0:
+                    while parent[label] != label:
+                        label = parent[label]
+                    labels[i, j] = label
+        return labels
+else:
+    _label_tree_patches = None
+
+
+def _valid_forest_mask(landcover: np.ndarray, min_px: int) -> Optional[np.ndarray]:
+    """Per-pixel mask of tree pixels inside contiguous patches >= min_px.
+
+    True contiguity needs connected-components labeling — a heavy pixel
+    loop that is only viable JIT-compiled, so this returns None when numba
+    is unavailable and callers keep the total-count proxy.
+    """
+    if _label_tree_patches is None:
+        return None
+    labels = _label_tree_patches(landcover == 1)
+    sizes = np.bincount(labels.ravel())
+    sizes[0] = 0  # background
+    return sizes[labels] >= min_px
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _haversine_mask(lats, lons, center_lat, center_lon, radius_km):  # pragma: no cover
+        n = lats.shape[0]
+        mask = np.empty(n, dtype=np.bool_)
+        lat2 = math.radians(center_lat)
+        lon2 = math.radians(center_lon)
+        cos_lat2 = math.cos(lat2)
+        for i in range(n):
+            lat1 = math.radians(lats[i])
+            dlat = lat1 - lat2
+            dlon = math.radians(lons[i]) - lon2
+            a = math.sin(dlat / 2.0) ** 2 + math.cos(lat1) * cos_lat2 * math.sin(dlon / 2.0) ** 2
+            mask[i] = 2.0 * _EARTH_RADIUS_KM * math.asin(math.sqrt(a)) <= radius_km
+        return mask
+else:
+    _haversine_mask = _haversine_mask_numpy
+
+
+@dataclass(slots=True, frozen=True)
 class BoundingBox:
     """Bounding box coordinates"""
     min_lon: float
@@ -33,7 +444,7 @@ class BoundingBox:
     max_lat: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LandCoverResult:
     """Land cover classification results"""
     urban: float
@@ -43,7 +454,7 @@ class LandCoverResult:
     total_pixels: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WeatherData:
     """Weather data from OpenWeather API"""
     temperature: float
@@ -54,7 +465,7 @@ class WeatherData:
     coordinates: Tuple[float, float]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AirQualityData:
     """Air quality data from OpenWeather Air Pollution API"""
     aqi: int  # Air Quality Index (1-5)
@@ -68,15 +479,84 @@ class AirQualityData:
     coordinates: Tuple[float, float]
 
 
+# One OpenCage client per API key, shared across GeocodingService instances so
+# per-request service construction doesn't rebuild the HTTP client each time
+_OPENCAGE_CLIENTS: Dict[str, 'OpenCageGeocode'] = {}
+
+
+def _get_opencage_client(api_key: str) -> 'OpenCageGeocode':
+    """Return the shared OpenCage client for this key, creating it once."""
+    client = _OPENCAGE_CLIENTS.get(api_key)
+    if client is None:
+        # Deferred import: keeps the opencage client library off the module
+        # import path for callers that never geocode
+        from opencage.geocoder import OpenCageGeocode
+        client = _OPENCAGE_CLIENTS[api_key] = OpenCageGeocode(api_key)
+    return client
+
+
 class GeocodingService:
     """Handle geocoding and city boundary fetching"""
-    
+
+    # Geocoding and locality lookups for the same place repeat often and are
+    # dominated by network latency, so cached answers stay valid for a day.
+    GEO_CACHE_TTL = 86400
+
+    # Locality/boundary geometries change rarely; the raw OSM payloads are
+    # cached for a week (ee.Geometry objects are rebuilt from them on hit)
+    GEOMETRY_CACHE_TTL = 7 * 86400
+
     def __init__(self, api_key: str):
         if not api_key:
             raise ValueError("OpenCage API key is required")
-        self.geocoder = OpenCageGeocode(api_key)
-        self.nominatim_url = "https://nominatim.openstreetmap.org/search"
+        self.geocoder = _get_opencage_client(api_key)
         self.nominatim_url = "https://nominatim.openstreetmap.org/search"
+
+        # In-memory memo for geocode results (fast path within a process)
+        self._geocode_memo = {}
+
+        # Persistent cross-process cache (optional - only if diskcache installed)
+        self._disk_cache = None
+        if DISKCACHE_AVAILABLE:
+            try:
+                self._disk_cache = diskcache.Cache(
+                    os.path.join(os.path.expanduser('~'), '.sia_geocache')
+                )
+            except Exception as e:
+                print(f"Warning: disk cache unavailable: {e}")
+
+    def _cache_get(self, key: str):
+        """Read a value from the persistent cache (None on miss or error)"""
+        if self._disk_cache is not None:
+            try:
+                return self._disk_cache.get(key)
+            except Exception:
+                return None
+        return None
+
+    def _cache_set(self, key: str, value, expire: Optional[int] = None):
+        """Write a value to the persistent cache (default: the standard TTL)"""
+        if self._disk_cache is not None:
+            try:
+                self._disk_cache.set(key, value, expire=expire or self.GEO_CACHE_TTL)
+            except Exception:
+                pass
+
+    def _geocode_cached(self, location: str):
+        """Geocode via OpenCage with in-memory and on-disk caching"""
+        key = f"geocode:{location.strip().lower()}"
+        result = self._geocode_memo.get(key)
+        if result is not None:
+            return result
+
+        result = self._cache_get(key)
+        if result is None:
+            result = self.geocoder.geocode(location)
+            if result:
+                self._cache_set(key, result)
+        if result:
+            self._geocode_memo[key] = result
+        return result
     
     def get_city_boundary_polygon(self, location: str) -> Tuple[ee.Geometry, BoundingBox, Tuple[float, float]]:
         """
@@ -91,15 +571,18 @@ class GeocodingService:
         """
         try:
             # First, geocode to get coordinates for search
-            if ',' in location:
+            # _COORD_RE only matches a bare "lat,lon" string, so names like
+            # "Paris, France" correctly take the geocoding branch instead of
+            # blowing up in float()
+            coord_match = _COORD_RE.match(location)
+            if coord_match:
                 # If coordinates provided, use them directly
-                coords = location.split(',')
-                lat, lon = float(coords[0].strip()), float(coords[1].strip())
+                lat, lon = float(coord_match.group(1)), float(coord_match.group(2))
                 center = (lat, lon)
                 query = location
             else:
                 # Geocode city name to get coordinates
-                results = self.geocoder.geocode(location)
+                results = self._geocode_cached(location)
                 if not results:
                     raise ValueError(f"Location '{location}' not found")
                 
@@ -136,11 +619,10 @@ class GeocodingService:
                 'namedetails': 1
             }
             
-            response = requests.get(self.nominatim_url, params=params, timeout=15, 
-                                   headers={'User-Agent': 'GeospatialIntelligenceSystem/1.0'})
+            response = HTTP_SESSION.get(self.nominatim_url, params=params, timeout=15)
                 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 if data.get('features'):
                     # Look for admin_level=8 in extratags
                     for feature in data['features']:
@@ -162,76 +644,76 @@ class GeocodingService:
                         
                         # Found admin_level=8 boundary
                         if geometry_data and geometry_data.get('type') == 'Polygon':
-                            coordinates = geometry_data['coordinates'][0]
-                            ee_coords = [[coord[0], coord[1]] for coord in coordinates]
-                            polygon = ee.Geometry.Polygon(ee_coords)
-                            
-                            lons = [coord[0] for coord in coordinates]
-                            lats = [coord[1] for coord in coordinates]
+                            # Single C-level pass over the vertices instead of
+                            # four Python list comprehensions + min/max scans
+                            arr = np.asarray(geometry_data['coordinates'][0], dtype=np.float64)[:, :2]
+                            polygon = ee.Geometry.Polygon(
+                                arr.tolist(), proj='EPSG:4326', geodesic=False)
+
                             bbox = BoundingBox(
-                                min_lon=min(lons),
-                                min_lat=min(lats),
-                                max_lon=max(lons),
-                                max_lat=max(lats)
+                                min_lon=float(arr[:, 0].min()),
+                                min_lat=float(arr[:, 1].min()),
+                                max_lon=float(arr[:, 0].max()),
+                                max_lat=float(arr[:, 1].max())
                             )
-                            
-                            polygon = EarthEngineService.preprocess_polygon(polygon)
+
+                            # Small polygons don't need simplification
+                            polygon = EarthEngineService.preprocess_polygon(
+                                polygon, skip_preprocess=len(arr) < 100)
                             return polygon, bbox, center
-                        
+
                         elif geometry_data and geometry_data.get('type') == 'MultiPolygon':
-                            multi_polygon_coords = []
-                            all_lons = []
-                            all_lats = []
-                            
-                            for polygon_coords in geometry_data['coordinates']:
-                                outer_ring = polygon_coords[0]
-                                multi_polygon_coords.append([[coord[0], coord[1]] for coord in outer_ring])
-                                all_lons.extend([coord[0] for coord in outer_ring])
-                                all_lats.extend([coord[1] for coord in outer_ring])
-                            
-                            polygon = ee.Geometry.MultiPolygon(multi_polygon_coords)
+                            rings = [
+                                np.asarray(polygon_coords[0], dtype=np.float64)[:, :2]
+                                for polygon_coords in geometry_data['coordinates']
+                            ]
+                            all_coords = np.concatenate(rings)
+
+                            polygon = ee.Geometry.MultiPolygon(
+                                [ring.tolist() for ring in rings],
+                                proj='EPSG:4326', geodesic=False)
                             bbox = BoundingBox(
-                                min_lon=min(all_lons),
-                                min_lat=min(all_lats),
-                                max_lon=max(all_lons),
-                                max_lat=max(all_lats)
+                                min_lon=float(all_coords[:, 0].min()),
+                                min_lat=float(all_coords[:, 1].min()),
+                                max_lon=float(all_coords[:, 0].max()),
+                                max_lat=float(all_coords[:, 1].max())
                             )
-                            
-                            polygon = EarthEngineService.preprocess_polygon(polygon)
+
+                            polygon = EarthEngineService.preprocess_polygon(
+                                polygon, skip_preprocess=len(all_coords) < 100)
                             return polygon, bbox, center
             
             # Ultimate fallback: use a larger bounding box (10km radius) to ensure we get Dynamic World data
             # This is better than a tiny box that might not have coverage
-            radius_degrees = 0.09  # ~10km radius (0.09 degrees ≈ 10km)
-            bbox = BoundingBox(
-                min_lon=lon - radius_degrees,
-                min_lat=lat - radius_degrees,
-                max_lon=lon + radius_degrees,
-                max_lat=lat + radius_degrees
-            )
-            polygon = ee.Geometry.Rectangle([
-                bbox.min_lon, bbox.min_lat,
-                bbox.max_lon, bbox.max_lat
-            ])
-            polygon = EarthEngineService.preprocess_polygon(polygon)
-            return polygon, bbox, center
-            
+            return (*self._fallback_rect(round(lat, 3), round(lon, 3)), center)
+
         except Exception as e:
             # Ultimate fallback: use a larger bounding box (10km radius)
-            radius_degrees = 0.09  # ~10km radius
-            bbox = BoundingBox(
-                min_lon=lon - radius_degrees,
-                min_lat=lat - radius_degrees,
-                max_lon=lon + radius_degrees,
-                max_lat=lat + radius_degrees
-            )
-            polygon = ee.Geometry.Rectangle([
-                bbox.min_lon, bbox.min_lat,
-                bbox.max_lon, bbox.max_lat
-            ])
-            polygon = EarthEngineService.preprocess_polygon(polygon)
-            return polygon, bbox, center
-    
+            return (*self._fallback_rect(round(lat, 3), round(lon, 3)), center)
+
+    @lru_cache(maxsize=256)
+    def _fallback_rect(self, lat_r: float, lon_r: float, radius_degrees: float = 0.09) -> Tuple[ee.Geometry, BoundingBox]:
+        """
+        Build the ultimate-fallback AOI: a ~10km-radius rectangle around the center.
+
+        Memoized on rounded coordinates because ee.Geometry.Rectangle plus
+        preprocess_polygon cost an Earth Engine round-trip, and failed boundary
+        lookups for the same city hit this path repeatedly.
+        """
+        bbox = BoundingBox(
+            min_lon=lon_r - radius_degrees,
+            min_lat=lat_r - radius_degrees,
+            max_lon=lon_r + radius_degrees,
+            max_lat=lat_r + radius_degrees
+        )
+        polygon = ee.Geometry.Rectangle([
+            bbox.min_lon, bbox.min_lat,
+            bbox.max_lon, bbox.max_lat
+        ], proj='EPSG:4326', geodesic=False)
+        # A rectangle is already simple and valid — no preprocessing needed
+        polygon = EarthEngineService.preprocess_polygon(polygon, skip_preprocess=True)
+        return polygon, bbox
+
     def _get_boundary_from_overpass(self, query: str, center: Tuple[float, float], lat: float, lon: float) -> Tuple[Optional[ee.Geometry], Optional[BoundingBox]]:
         """
         Fetch admin_level=8 administrative boundary from Overpass API
@@ -248,84 +730,111 @@ class GeocodingService:
             # Search ONLY for admin_level=8 boundaries
             # Reject admin_level=6, admin_level=4, and place=region
             # Search by name and also by area around coordinates for better matching
+            # 'out geom' (no (._;>;) recursion) inlines member geometry on the
+            # relation so the polygon can be assembled locally without a second
+            # round-trip to Nominatim
             overpass_query = f"""
             [out:json][timeout:25];
             (
               relation["admin_level"="8"]["boundary"="administrative"]["name"~"{query}",i];
               relation["admin_level"="8"]["boundary"="administrative"](around:5000,{lat},{lon});
             );
-            (._;>;);
             out geom;
             """
-            
-            response = requests.post(overpass_url, data=overpass_query, timeout=30,
-                                   headers={'User-Agent': 'GeospatialIntelligenceSystem/1.0'})
-            
+
+            response = HTTP_SESSION.post(overpass_url, data=overpass_query, timeout=30)
+
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 if data.get('elements'):
                     # Find admin_level=8 relation
                     for element in data['elements']:
                         if element.get('type') == 'relation':
                             tags = element.get('tags', {})
-                            
+
                             # Verify it's admin_level=8 and reject others
                             admin_level = tags.get('admin_level')
                             place = tags.get('place', '').lower()
-                            
+
                             # Reject admin_level 6, 4, and place=region
                             if admin_level in ['6', '4'] or place == 'region':
                                 continue
-                            
+
                             # ONLY accept admin_level=8
                             if admin_level != '8':
                                 continue
-                            
-                            # Extract geometry from relation
-                            # With 'out geom', Overpass returns geometry directly
-                            # Try Nominatim lookup first (most reliable for getting full polygon)
+
+                            # Stitch the outer ring from the relation's member
+                            # geometries — saves the Nominatim round-trip
+                            ring = self._assemble_outer_ring(element)
+                            if ring is not None:
+                                arr = np.asarray(ring, dtype=np.float64)
+                                polygon = ee.Geometry.Polygon(
+                                    ring, proj='EPSG:4326', geodesic=False)
+                                bbox = BoundingBox(
+                                    min_lon=float(arr[:, 0].min()),
+                                    min_lat=float(arr[:, 1].min()),
+                                    max_lon=float(arr[:, 0].max()),
+                                    max_lat=float(arr[:, 1].max())
+                                )
+                                return polygon, bbox
+
+                            # Assembly failed (disjoint ways, multiple outer
+                            # rings): fall back to Nominatim lookup by OSM ID
                             osm_id = element.get('id')
                             if osm_id:
-                                # Try to get polygon via Nominatim lookup with OSM ID
-                                nominatim_lookup_url = f"https://nominatim.openstreetmap.org/lookup"
-                                lookup_params = {
-                                    'osm_ids': f"R{osm_id}",
-                                    'format': 'geojson',
-                                    'polygon_geojson': 1
-                                }
-                                
-                                lookup_response = requests.get(nominatim_lookup_url, params=lookup_params, timeout=15,
-                                                              headers={'User-Agent': 'GeospatialIntelligenceSystem/1.0'})
-                                
-                                if lookup_response.status_code == 200:
-                                    lookup_data = lookup_response.json()
-                                    if lookup_data.get('features'):
-                                        feature = lookup_data['features'][0]
-                                        geometry_data = feature.get('geometry')
-                                        
-                                        if geometry_data and geometry_data.get('type') == 'Polygon':
-                                            coordinates = geometry_data['coordinates'][0]
-                                            ee_coords = [[coord[0], coord[1]] for coord in coordinates]
-                                            polygon = ee.Geometry.Polygon(ee_coords)
-                                            
-                                            lons = [coord[0] for coord in coordinates]
-                                            lats = [coord[1] for coord in coordinates]
-                                            bbox = BoundingBox(
-                                                min_lon=min(lons),
-                                                min_lat=min(lats),
-                                                max_lon=max(lons),
-                                                max_lat=max(lats)
-                                            )
-                                            
-                                            return polygon, bbox
-            
+                                polygon, bbox = self._get_geometry_from_nominatim_lookup(f"R{osm_id}")
+                                if polygon is not None:
+                                    return polygon, bbox
+
             # No admin_level=8 boundary found
             return None, None
-             
+
         except Exception as e:
             # Return None to trigger fallback
             return None, None
-    
+
+    @staticmethod
+    def _assemble_outer_ring(element: Dict) -> Optional[List[List[float]]]:
+        """
+        Stitch a relation's role=outer way geometries into one closed ring.
+
+        Overpass 'out geom' returns each member way as an ordered list of
+        {lat, lon} points, but the ways themselves arrive in arbitrary order
+        and direction. Greedily match segment endpoints to grow the ring.
+
+        Returns:
+            Closed [[lon, lat], ...] ring, or None if the members don't form
+            a single closed ring (e.g. multiple outer rings or broken data) —
+            the caller should fall back to Nominatim in that case.
+        """
+        segments = [
+            [(p['lon'], p['lat']) for p in member['geometry']]
+            for member in element.get('members', [])
+            if member.get('role') == 'outer' and member.get('geometry')
+        ]
+        if not segments:
+            return None
+
+        ring = segments.pop(0)
+        while segments:
+            tail = ring[-1]
+            for i, seg in enumerate(segments):
+                if seg[0] == tail:
+                    ring.extend(seg[1:])
+                    break
+                if seg[-1] == tail:
+                    ring.extend(reversed(seg[:-1]))
+                    break
+            else:
+                return None  # no segment continues the ring
+            segments.pop(i)
+
+        # A valid closed ring needs at least a triangle plus the closing point
+        if len(ring) < 4 or ring[0] != ring[-1]:
+            return None
+        return [list(point) for point in ring]
+
     def get_aoi_polygon(self, location: str, buffer_radius_km: float = 2.0) -> Tuple[ee.Geometry, BoundingBox, Tuple[float, float], str]:
         """
         STEP 1 — INPUT HANDLING
@@ -345,29 +854,26 @@ class GeocodingService:
         """
         try:
             # Parse input: coordinates or city name
-            # Smart detection: Only treat as coordinates if both parts are numeric
+            # Smart detection: only treat as coordinates if the whole string
+            # matches "lat,lon" — regex short-circuits city names without the
+            # exception-driven float() probing
             is_coordinates = False
-            if ',' in location:
-                parts = location.split(',')
-                if len(parts) == 2:
-                    # Check if both parts can be parsed as floats (coordinates)
-                    try:
-                        lat_test = float(parts[0].strip())
-                        lon_test = float(parts[1].strip())
-                        # Validate coordinate ranges
-                        if -90 <= lat_test <= 90 and -180 <= lon_test <= 180:
-                            is_coordinates = True
-                            lat = lat_test
-                            lon = lon_test
-                            center = (lat, lon)
-                            location_name = f"{lat:.4f},{lon:.4f}"
-                    except ValueError:
-                        # Not coordinates, treat as location name
-                        is_coordinates = False
-            
+            coord_match = _COORD_RE.match(location)
+            if coord_match:
+                lat_test = float(coord_match.group(1))
+                lon_test = float(coord_match.group(2))
+                # Validate coordinate ranges
+                if -90 <= lat_test <= 90 and -180 <= lon_test <= 180:
+                    is_coordinates = True
+                    lat = lat_test
+                    lon = lon_test
+                    center = (lat, lon)
+                    location_name = f"{lat:.4f},{lon:.4f}"
+
+
             if not is_coordinates:
                 # City name provided - geocode to get center
-                results = self.geocoder.geocode(location)
+                results = self._geocode_cached(location)
                 if not results:
                     raise ValueError(f"Location '{location}' not found")
                 
@@ -380,15 +886,16 @@ class GeocodingService:
             buffer_radius_meters = buffer_radius_km * 1000
             point = ee.Geometry.Point(lon, lat)
             aoi_polygon = point.buffer(buffer_radius_meters)
-            
-            # Preprocess polygon
-            aoi_polygon = EarthEngineService.preprocess_polygon(aoi_polygon)
+
+            # A fresh point buffer is already simple and valid
+            aoi_polygon = EarthEngineService.preprocess_polygon(aoi_polygon, skip_preprocess=True)
             
             # Calculate bounding box
             # Approximate: 1 degree latitude ≈ 111 km
             # 1 degree longitude ≈ 111 km * cos(latitude)
+            # Scalar math here; NumPy dispatch on 0-d values is ~10x slower
             radius_degrees_lat = buffer_radius_km / 111.0
-            radius_degrees_lon = buffer_radius_km / (111.0 * abs(np.cos(np.radians(lat))))
+            radius_degrees_lon = buffer_radius_km / (111.0 * abs(math.cos(math.radians(lat))))
             
             bbox = BoundingBox(
                 min_lon=lon - radius_degrees_lon,
@@ -398,7 +905,7 @@ class GeocodingService:
             )
             
             # Validate AOI size (reject AOI > 50 km²)
-            aoi_area = np.pi * (buffer_radius_km ** 2)  # Area in km²
+            aoi_area = math.pi * buffer_radius_km * buffer_radius_km  # Area in km²
             if aoi_area > 50.0:
                 raise ValueError(
                     f"AOI area ({aoi_area:.2f} km²) exceeds maximum allowed size (50 km²). "
@@ -421,7 +928,7 @@ class GeocodingService:
             Tuple of (lat, lon) coordinates
         """
         try:
-            results = self.geocoder.geocode(city_name)
+            results = self._geocode_cached(city_name)
             if not results:
                 raise ValueError(f"City '{city_name}' not found")
             
@@ -431,40 +938,52 @@ class GeocodingService:
         except Exception as e:
             raise ValueError(f"Failed to get city center: {str(e)}")
     
-    def get_localities(self, city_name: str, radius_km: int = 8) -> List[Dict]:
+    # Field layout of the structured array returned by get_localities(return_arrays=True)
+    _LOCALITY_DTYPE = np.dtype([
+        ('name', object), ('lat', np.float64), ('lon', np.float64),
+        ('place_type', object), ('osm_id', object), ('osm_type', object)
+    ])
+
+    def get_localities(self, city_name: str, radius_km: int = 8, return_arrays: bool = False) -> List[Dict]:
         """
         Fetch locality names and centers only (fast, no polygons)
-        
+
         Uses radius-based Overpass query to get only:
         - name
         - center coordinates
         - place type
-        
+
         Does NOT fetch full polygons at this stage.
-        
+
         Args:
             city_name: Name of the city
             radius_km: Search radius in kilometers (default 8km, reduced to avoid API overload)
-            
+            return_arrays: Return a NumPy record array instead of a list of
+                dicts, so consumers can run vectorized distance/bbox filters
+                over .lat/.lon columns without per-item Python access
+
         Returns:
             List of dictionaries with 'name', 'lat', 'lon', 'place_type', 'osm_id', 'osm_type'
             Example: [
                 { 'name': 'Gachibowli', 'lat': 17.42, 'lon': 78.35, 'place_type': 'suburb', 'osm_id': 12345, 'osm_type': 'way' },
                 ...
             ]
+            With return_arrays=True: np.recarray with those same fields.
         """
         try:
+            # Serve repeated queries for the same city/radius from disk
+            locality_cache_key = f"localities:{city_name.strip().lower()}:{radius_km}"
+            cached_localities = self._cache_get(locality_cache_key)
+            if cached_localities is not None:
+                if return_arrays:
+                    return self._localities_to_recarray(cached_localities)
+                return cached_localities
+
             # Step 1: Get city center coordinates using OpenCage
             lat, lon = self.get_city_center(city_name)
             
             # Step 2: Use Overpass API with radius-based query
             # Only fetch names and centers, NOT full polygons
-            overpass_servers = [
-                "https://overpass-api.de/api/interpreter",
-                "https://overpass.kumi.systems/api/interpreter",
-                "https://overpass.openstreetmap.ru/api/interpreter"
-            ]
-            
             # Query pattern: Simplified radius-based query
             # Reduced complexity to avoid API overload
             # Includes: place=suburb|neighbourhood AND boundary=administrative with admin_level=9|10 (wards)
@@ -472,63 +991,21 @@ class GeocodingService:
             
             # Use shorter timeout and simpler query for better reliability
             timeout_seconds = min(30, max(15, radius_km * 2))  # Adaptive timeout based on radius
-            overpass_query = f"""[out:json][timeout:{timeout_seconds}];
+            # CSV output: we only need name/center/place/admin_level, and the
+            # tabular response is 5-10x smaller than JSON with full tags.
+            # Tab separator because locality names can contain commas.
+            overpass_query = f"""[out:csv(::id,::type,::lat,::lon,name,"name:en",alt_name,place,boundary,admin_level;true;"\t")][timeout:{timeout_seconds}];
 (
   node["place"~"suburb|neighbourhood"](around:{radius_meters},{lat},{lon});
   way["place"~"suburb|neighbourhood"](around:{radius_meters},{lat},{lon});
   relation["place"~"suburb|neighbourhood"](around:{radius_meters},{lat},{lon});
   relation["boundary"="administrative"]["admin_level"~"9|10"](around:{radius_meters},{lat},{lon});
 );
-out tags center;"""
-            
-            response = None
-            last_error = None
-            
-            # Try each server until one works, with delays between retries
-            for idx, server_url in enumerate(overpass_servers):
-                try:
-                    # Add small delay between server attempts (except first)
-                    if idx > 0:
-                        time.sleep(1)  # 1 second delay between servers
-                    
-                    response = requests.post(server_url, data=overpass_query, timeout=timeout_seconds + 10,
-                                           headers={'User-Agent': 'GeospatialIntelligenceSystem/1.0'})
-                    if response.status_code == 200:
-                        # Check if response has content
-                        if response.text and response.text.strip():
-                            break
-                        else:
-                            # Empty response, try next server
-                            last_error = f"Server {server_url} returned empty response"
-                            response = None
-                            continue
-                    elif response.status_code == 504:
-                        # Timeout - try next server
-                        last_error = f"Server {server_url} timed out (504)"
-                        response = None
-                        continue
-                    elif response.status_code == 429:
-                        # Rate limited - try next server
-                        last_error = f"Server {server_url} rate limited (429)"
-                        response = None
-                        continue
-                    else:
-                        last_error = f"Server {server_url} returned status {response.status_code}: {response.text[:100] if response.text else 'No response body'}"
-                        response = None
-                        continue
-                except requests.exceptions.Timeout:
-                    last_error = f"Server {server_url} timed out"
-                    response = None
-                    continue
-                except requests.exceptions.ConnectionError as e:
-                    last_error = f"Server {server_url} connection error: {str(e)}"
-                    response = None
-                    continue
-                except Exception as e:
-                    last_error = f"Server {server_url} error: {str(e)}"
-                    response = None
-                    continue
-            
+out center;"""
+
+            # Query all mirrors concurrently; first success wins
+            response, last_error = _post_overpass_any(overpass_query, timeout_seconds + 10)
+
             if response is None:
                 # Suggest smaller radius if current radius is large
                 suggested_radius = max(5, radius_km // 2) if radius_km > 10 else radius_km
@@ -553,16 +1030,15 @@ out tags center;"""
             if not response_text:
                 raise RuntimeError("Overpass API returned empty response. The server may be overloaded or the query timed out.")
             
-            # Check if response is HTML/XML (error page) instead of JSON
+            # Check if response is HTML/XML (error page) instead of CSV
             if response_text.startswith('<?xml') or response_text.startswith('<!DOCTYPE') or response_text.startswith('<html'):
                 # Extract error message from HTML if possible
-                import re
-                error_match = re.search(r'<p[^>]*>(.*?)</p>', response_text, re.IGNORECASE | re.DOTALL)
+                error_match = _HTML_P_RE.search(response_text)
                 if error_match:
                     error_msg = error_match.group(1).strip()[:200]
                 else:
                     # Try to find title or h1
-                    title_match = re.search(r'<title[^>]*>(.*?)</title>', response_text, re.IGNORECASE | re.DOTALL)
+                    title_match = _HTML_TITLE_RE.search(response_text)
                     if title_match:
                         error_msg = title_match.group(1).strip()[:200]
                     else:
@@ -574,189 +1050,222 @@ out tags center;"""
                     f"Try reducing the search radius (currently {radius_km}km) or try again later."
                 )
             
-            # Try to parse as JSON
-            try:
-                data = response.json()
-            except json.JSONDecodeError as e:
-                # Log the actual response for debugging
-                error_msg = f"Failed to parse Overpass API response as JSON: {str(e)}"
-                if response_text:
-                    # Show first 200 chars of response for debugging
-                    preview = response_text[:200] if len(response_text) > 200 else response_text
-                    error_msg += f"\nResponse preview: {preview}"
-                raise RuntimeError(error_msg)
-            
-            # Check for errors in Overpass response
-            if 'remark' in data and 'runtime' not in data:
-                raise RuntimeError(f"Overpass API error: {data.get('remark', 'Unknown error')}")
-            
-            # Check if response indicates an error
-            if 'error' in data:
-                error_info = data.get('error', {})
-                if isinstance(error_info, dict):
-                    error_msg = error_info.get('message', 'Unknown Overpass API error')
-                else:
-                    error_msg = str(error_info)
-                raise RuntimeError(f"Overpass API error: {error_msg}")
-            
-            localities = []
-            seen_names = set()  # Deduplicate by name
-            
-            if data.get('elements'):
-                for element in data['elements']:
-                    tags = element.get('tags', {})
-                    
-                    # Get locality name
-                    name = tags.get('name') or tags.get('name:en') or tags.get('alt_name')
-                    if not name:
-                        continue
-                    
-                    # Deduplicate by name (case-insensitive)
-                    name_lower = name.lower()
-                    if name_lower in seen_names:
-                        continue
-                    seen_names.add(name_lower)
-                    
-                    # Get place type or boundary type
-                    place_type = tags.get('place', 'unknown')
-                    if place_type == 'unknown':
-                        # Check if it's an administrative boundary
-                        if tags.get('boundary') == 'administrative':
-                            admin_level = tags.get('admin_level', '')
-                            place_type = f'ward_{admin_level}' if admin_level else 'administrative'
-                    
-                    # Get center coordinates
-                    center = element.get('center')
-                    if center:
-                        center_lat = center.get('lat')
-                        center_lon = center.get('lon')
+            # Parse tab-separated CSV (first row is the header)
+            rows = csv.reader(io.StringIO(response_text), delimiter='\t')
+            next(rows, None)  # skip header
+
+            # Deduplicate by casefolded name: one dict doubles as the seen-set
+            # and the ordered result container (one hash lookup per row
+            # instead of a set probe plus an add)
+            localities_by_name: Dict[str, Dict] = {}
+
+            for row in rows:
+                if len(row) != 10:
+                    continue  # malformed row
+                (osm_id, osm_type, lat_str, lon_str, name, name_en,
+                 alt_name, place_type, boundary, admin_level) = row
+
+                # Fail fast: a large share of rows are anonymous or
+                # centerless elements, so run the cheap skip checks before
+                # any dedup/formatting work
+                name = name or name_en or alt_name
+                if not name:
+                    continue
+
+                # Center coordinates (::lat/::lon carry the center for
+                # ways/relations with 'out center')
+                if not lat_str or not lon_str:
+                    continue  # Skip if no coordinates
+
+                # Deduplicate by name (case-insensitive)
+                name_key = name.casefold()
+                if name_key in localities_by_name:
+                    continue
+
+                # Get place type or boundary type
+                if not place_type:
+                    # Check if it's an administrative boundary
+                    if boundary == 'administrative':
+                        place_type = f'ward_{admin_level}' if admin_level else 'administrative'
                     else:
-                        # Fallback: use lat/lon if available
-                        center_lat = element.get('lat')
-                        center_lon = element.get('lon')
-                    
-                    if center_lat is None or center_lon is None:
-                        continue  # Skip if no coordinates
-                    
-                    # Get OSM ID and type for later geometry fetching
-                    osm_id = element.get('id')
-                    osm_type = element.get('type')  # 'node', 'way', or 'relation'
-                    
-                    localities.append({
-                        'name': name,
-                        'lat': center_lat,
-                        'lon': center_lon,
-                        'place_type': place_type,
-                        'osm_id': osm_id,
-                        'osm_type': osm_type
-                    })
-            
+                        place_type = 'unknown'
+
+                localities_by_name[name_key] = {
+                    'name': name,
+                    'lat': float(lat_str),
+                    'lon': float(lon_str),
+                    'place_type': place_type,
+                    'osm_id': int(osm_id) if osm_id else None,
+                    'osm_type': osm_type  # 'node', 'way', or 'relation'
+                }
+
             # Sort alphabetically by name
-            localities.sort(key=lambda x: x['name'].lower())
-            
+            localities = sorted(localities_by_name.values(), key=lambda x: x['name'].lower())
+
+            self._cache_set(locality_cache_key, localities)
+            if return_arrays:
+                return self._localities_to_recarray(localities)
             return localities
-            
+
         except Exception as e:
             raise ValueError(f"Failed to fetch localities: {str(e)}")
-    
-    def get_locality_geometry(self, locality_name: str, lat: float, lon: float) -> Tuple[ee.Geometry, BoundingBox]:
+
+    @classmethod
+    def _localities_to_recarray(cls, localities: List[Dict]) -> np.recarray:
+        """Convert a list of locality dicts to a column-wise record array."""
+        rec = np.empty(len(localities), dtype=cls._LOCALITY_DTYPE)
+        for field in cls._LOCALITY_DTYPE.names:
+            rec[field] = [loc[field] for loc in localities]
+        return rec.view(np.recarray)
+
+    @staticmethod
+    def filter_localities_by_radius(localities: np.recarray, center_lat: float,
+                                    center_lon: float, radius_km: float) -> np.recarray:
         """
-        Fetch full geometry for a single locality (called on-demand when user selects it)
-        
-        Queries Overpass AGAIN for the selected locality name and fetches full geometry.
-        Supports relation (multipolygon) and way (polygon).
-        
-        Args:
-            locality_name: Name of the locality
-            lat: Latitude of locality center (for fallback)
-            lon: Longitude of locality center (for fallback)
-            
-        Returns:
+        Keep only localities within radius_km of the center (great-circle).
+
+        Expects the record array from get_localities(return_arrays=True).
+        The distance loop runs through the numba-compiled kernel when numba
+        is installed, otherwise through the vectorized NumPy fallback.
+        """
+        mask = _haversine_mask(
+            np.ascontiguousarray(localities.lat),
+            np.ascontiguousarray(localities.lon),
+            float(center_lat), float(center_lon), float(radius_km)
+        )
+        return localities[mask]
+
+    @staticmethod
+    def build_locality_index(localities: List[Dict]):
+        """
+        Build an R-tree over locality centers for repeated bbox queries.
+
+        Returns None when rtree is not installed; find_localities_in_bbox
+        then falls back to a vectorized linear scan, which is fine for the
+        few hundred localities a single city produces.
+        """
+        if not RTREE_AVAILABLE:
+            return None
+        idx = rtree_index.Index()
+        for i, locality in enumerate(localities):
+            lon, lat = locality['lon'], locality['lat']
+            idx.insert(i, (lon, lat, lon, lat))
+        return idx
+
+    @staticmethod
+    def find_localities_in_bbox(localities: List[Dict], bbox: BoundingBox,
+                                spatial_index=None) -> List[Dict]:
+        """
+        Return the localities whose center falls inside the bounding box.
+
+        Pass the index from build_locality_index to answer each query in
+        O(log N) instead of rescanning every locality; repeated AOI
+        membership tests over the same list amortize the build cost.
+        """
+        if spatial_index is not None:
+            hits = spatial_index.intersection(
+                (bbox.min_lon, bbox.min_lat, bbox.max_lon, bbox.max_lat))
+            return [localities[i] for i in sorted(hits)]
+
+        if not localities:
+            return []
+        lats = np.fromiter((loc['lat'] for loc in localities),
+                           dtype=np.float64, count=len(localities))
+        lons = np.fromiter((loc['lon'] for loc in localities),
+                           dtype=np.float64, count=len(localities))
+        mask = ((lats >= bbox.min_lat) & (lats <= bbox.max_lat) &
+                (lons >= bbox.min_lon) & (lons <= bbox.max_lon))
+        return [loc for loc, inside in zip(localities, mask) if inside]
+
+    def get_locality_geometry(self, locality_name: str, lat: float, lon: float,
+                              osm_id: Optional[int] = None,
+                              osm_type: Optional[str] = None) -> Tuple[ee.Geometry, BoundingBox]:
+        """
+        Fetch full geometry for a single locality (called on-demand when user selects it)
+
+        When the locality listing already produced an osm_id/osm_type pair,
+        the geometry is resolved by ID through Nominatim lookup — skipping
+        the Overpass by-name search entirely. The name-based Overpass query
+        remains the fallback.
+
+        Args:
+            locality_name: Name of the locality
+            lat: Latitude of locality center (for fallback)
+            lon: Longitude of locality center (for fallback)
+            osm_id: OSM element ID from get_localities, if known
+            osm_type: 'way' or 'relation' ('node' carries no polygon)
+
+        Returns:
             Tuple of (polygon, bbox)
             If geometry unavailable, returns approximate 500m buffer around center
         """
         try:
-            # Query Overpass AGAIN for the selected locality name
-            overpass_servers = [
-                "https://overpass-api.de/api/interpreter",
-                "https://overpass.kumi.systems/api/interpreter",
-                "https://overpass.openstreetmap.ru/api/interpreter"
-            ]
-            
-            # Query pattern: search by name around center
-            overpass_query = f"""[out:json][timeout:25];
+            # The ID lookup is exact and one round-trip; the by-name
+            # Overpass search is string-matched over a 5 km radius
+            if osm_id and osm_type in ('way', 'relation'):
+                geometry, bbox = self._get_geometry_from_nominatim_lookup(
+                    f"{osm_type[0].upper()}{osm_id}")
+                if geometry is not None:
+                    return geometry, bbox
+            # Serve repeat selections of the same locality from disk — users
+            # re-run analyses on the same place far more often than the
+            # underlying OSM geometry changes
+            geometry_cache_key = f"locgeom:{locality_name.casefold()}:{round(lat, 4)}:{round(lon, 4)}"
+            data = None
+            cached_body = self._cache_get(geometry_cache_key)
+            if cached_body is not None:
+                try:
+                    data = orjson.loads(cached_body)
+                except orjson.JSONDecodeError:
+                    data = None
+
+            if data is None:
+                # Query Overpass AGAIN for the selected locality name
+                # Query pattern: search by name around center
+                # Only the first match is ever used, so ask the server to stop
+                # after one ('out geom 1') — common street/locality names can
+                # otherwise match dozens of elements with full geometry.
+                # maxsize caps server-side memory for the query.
+                overpass_query = f"""[out:json][timeout:25][maxsize:64000000];
 (
   relation["name"="{locality_name}"](around:5000,{lat},{lon});
   way["name"="{locality_name}"](around:5000,{lat},{lon});
 );
-out geom;"""
-            
-            response = None
-            last_error = None
-            
-            # Try each server until one works
-            for server_url in overpass_servers:
+out geom 1;"""
+
+                # Query all mirrors concurrently; first success wins
+                response, last_error = _post_overpass_any(overpass_query, 30)
+
+                # If all servers failed, use fallback
+                if response is None or response.status_code != 200:
+                    return self._create_fallback_geometry(lat, lon, "Locality geometry unavailable. Using approximate area.")
+
+                # Parse response
+                response_text = response.text.strip() if response.text else ""
+                if not response_text:
+                    return self._create_fallback_geometry(lat, lon, "Locality geometry unavailable. Using approximate area.")
+
+                # Check if response is HTML/XML (error page)
+                if response_text.startswith('<?xml') or response_text.startswith('<!DOCTYPE') or response_text.startswith('<html'):
+                    return self._create_fallback_geometry(lat, lon, "Locality geometry unavailable. Using approximate area.")
+
+                # Parse JSON
                 try:
-                    response = requests.post(server_url, data=overpass_query, timeout=30,
-                                            headers={'User-Agent': 'GeospatialIntelligenceSystem/1.0'})
-                    if response.status_code == 200:
-                        if response.text and response.text.strip():
-                            break
-                        else:
-                            last_error = f"Server {server_url} returned empty response"
-                            response = None
-                            continue
-                    elif response.status_code == 504:
-                        last_error = f"Server {server_url} timed out (504)"
-                        response = None
-                        continue
-                    elif response.status_code == 429:
-                        last_error = f"Server {server_url} rate limited (429)"
-                        response = None
-                        continue
-                    else:
-                        last_error = f"Server {server_url} returned status {response.status_code}"
-                        response = None
-                        continue
-                except requests.exceptions.Timeout:
-                    last_error = f"Server {server_url} timed out"
-                    response = None
-                    continue
-                except requests.exceptions.ConnectionError as e:
-                    last_error = f"Server {server_url} connection error: {str(e)}"
-                    response = None
-                    continue
-                except Exception as e:
-                    last_error = f"Server {server_url} error: {str(e)}"
-                    response = None
-                    continue
-            
-            # If all servers failed, use fallback
-            if response is None or response.status_code != 200:
-                return self._create_fallback_geometry(lat, lon, "Locality geometry unavailable. Using approximate area.")
-            
-            # Parse response
-            response_text = response.text.strip() if response.text else ""
-            if not response_text:
-                return self._create_fallback_geometry(lat, lon, "Locality geometry unavailable. Using approximate area.")
-            
-            # Check if response is HTML/XML (error page)
-            if response_text.startswith('<?xml') or response_text.startswith('<!DOCTYPE') or response_text.startswith('<html'):
-                return self._create_fallback_geometry(lat, lon, "Locality geometry unavailable. Using approximate area.")
-            
-            # Parse JSON
-            try:
-                data = response.json()
-            except json.JSONDecodeError:
-                return self._create_fallback_geometry(lat, lon, "Locality geometry unavailable. Using approximate area.")
-            
-            # Check for errors
-            if 'remark' in data and 'runtime' not in data:
-                return self._create_fallback_geometry(lat, lon, "Locality geometry unavailable. Using approximate area.")
-            
-            if 'error' in data:
-                return self._create_fallback_geometry(lat, lon, "Locality geometry unavailable. Using approximate area.")
-            
+                    data = orjson.loads(response.content)
+                except orjson.JSONDecodeError:
+                    return self._create_fallback_geometry(lat, lon, "Locality geometry unavailable. Using approximate area.")
+
+                # Check for errors
+                if 'remark' in data and 'runtime' not in data:
+                    return self._create_fallback_geometry(lat, lon, "Locality geometry unavailable. Using approximate area.")
+
+                if 'error' in data:
+                    return self._create_fallback_geometry(lat, lon, "Locality geometry unavailable. Using approximate area.")
+
+                # Only validated payloads are cached (raw bytes, not
+                # ee.Geometry — that is rebuilt below on every hit)
+                self._cache_set(geometry_cache_key, response.content, expire=self.GEOMETRY_CACHE_TTL)
+
             # Process elements to extract geometry
             geometry = None
             bbox = None
@@ -778,18 +1287,18 @@ out geom;"""
                         if 'geometry' in element:
                             coords = element['geometry']
                             if coords and len(coords) >= 3:
-                                # Convert to Earth Engine format
+                                # Convert to Earth Engine format (Overpass 'out
+                                # geom' returns {'lat','lon'} dicts, so one
+                                # rebuild is unavoidable — reuse it for the bbox)
                                 ee_coords = [[point['lon'], point['lat']] for point in coords]
                                 geometry = ee.Geometry.Polygon([ee_coords])
-                                
-                                # Calculate bounding box
-                                lons = [point['lon'] for point in coords]
-                                lats = [point['lat'] for point in coords]
+
+                                arr = np.asarray(ee_coords, dtype=np.float64)
                                 bbox = BoundingBox(
-                                    min_lon=min(lons),
-                                    min_lat=min(lats),
-                                    max_lon=max(lons),
-                                    max_lat=max(lats)
+                                    min_lon=float(arr[:, 0].min()),
+                                    min_lat=float(arr[:, 1].min()),
+                                    max_lon=float(arr[:, 0].max()),
+                                    max_lat=float(arr[:, 1].max())
                                 )
                                 break  # Found valid geometry
             
@@ -803,7 +1312,87 @@ out geom;"""
         except Exception as e:
             # On any error, use fallback
             return self._create_fallback_geometry(lat, lon, f"Locality geometry unavailable. Using approximate area. Error: {str(e)}")
-    
+
+    def get_locality_geometries_batch(self, localities: List[Dict]) -> Dict[str, Tuple[ee.Geometry, BoundingBox]]:
+        """
+        Fetch geometries for several localities with ONE Overpass query.
+
+        Multi-locality workflows (e.g. batch analysis of a whole city) were
+        firing one Overpass POST per locality; a single union query over all
+        names collapses N round-trips into one. Localities the batch response
+        does not cover fall back to the per-locality path, which also handles
+        relation lookups and the buffer-square fallback.
+
+        Args:
+            localities: Dicts with at least 'name', 'lat', 'lon'
+                        (the shape returned by get_localities)
+
+        Returns:
+            Dict mapping each locality name to its (polygon, bbox)
+        """
+        results: Dict[str, Tuple[ee.Geometry, BoundingBox]] = {}
+        if not localities:
+            return results
+
+        wanted = {loc['name'].casefold(): loc for loc in localities}
+
+        clauses = []
+        for loc in localities:
+            name = loc['name'].replace('\\', '\\\\').replace('"', '\\"')
+            clauses.append(f'  relation["name"="{name}"](around:5000,{loc["lat"]},{loc["lon"]});')
+            clauses.append(f'  way["name"="{name}"](around:5000,{loc["lat"]},{loc["lon"]});')
+        overpass_query = (
+            '[out:json][timeout:40];\n(\n' + '\n'.join(clauses) + '\n);\nout geom;'
+        )
+
+        response, _last_error = _post_overpass_any(overpass_query, 45)
+        if response is not None and response.status_code == 200:
+            try:
+                data = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                data = {}
+
+            for element in data.get('elements', []):
+                name = element.get('tags', {}).get('name')
+                if not name:
+                    continue
+                key = name.casefold()
+                loc = wanted.get(key)
+                if loc is None or loc['name'] in results:
+                    continue
+
+                geometry = None
+                bbox = None
+                if element.get('type') == 'way' and element.get('geometry'):
+                    coords = element['geometry']
+                    if len(coords) >= 3:
+                        ee_coords = [[point['lon'], point['lat']] for point in coords]
+                        geometry = ee.Geometry.Polygon([ee_coords])
+                        arr = np.asarray(ee_coords, dtype=np.float64)
+                elif element.get('type') == 'relation':
+                    ring = self._assemble_outer_ring(element)
+                    if ring is not None:
+                        geometry = ee.Geometry.Polygon(ring, proj='EPSG:4326', geodesic=False)
+                        arr = np.asarray(ring, dtype=np.float64)
+
+                if geometry is not None:
+                    bbox = BoundingBox(
+                        min_lon=float(arr[:, 0].min()),
+                        min_lat=float(arr[:, 1].min()),
+                        max_lon=float(arr[:, 0].max()),
+                        max_lat=float(arr[:, 1].max())
+                    )
+                    results[loc['name']] = (geometry, bbox)
+
+        # Per-locality fallback for anything the batch didn't resolve
+        for loc in wanted.values():
+            if loc['name'] not in results:
+                results[loc['name']] = self.get_locality_geometry(
+                    loc['name'], loc['lat'], loc['lon'],
+                    osm_id=loc.get('osm_id'), osm_type=loc.get('osm_type'))
+
+        return results
+
     def _create_fallback_geometry(self, lat: float, lon: float, message: str = None) -> Tuple[ee.Geometry, BoundingBox]:
         """
         Create fallback geometry: 800m × 800m square AOI centered on locality (MAX 1km)
@@ -828,7 +1417,7 @@ out geom;"""
         # Account for latitude: 1 degree lat ≈ 111km, 1 degree lon ≈ 111km * cos(lat)
         radius_km = 0.4  # 0.4km = half of 800m
         radius_degrees_lat = radius_km / 111.0
-        radius_degrees_lon = radius_km / (111.0 * abs(np.cos(np.radians(lat))))
+        radius_degrees_lon = radius_km / (111.0 * abs(math.cos(math.radians(lat))))
         
         bbox = BoundingBox(
             min_lon=lon - radius_degrees_lon,
@@ -845,11 +1434,12 @@ out geom;"""
         geometry = ee.Geometry.Rectangle([
             bbox.min_lon, bbox.min_lat,
             bbox.max_lon, bbox.max_lat
-        ])
-        
+        ], proj='EPSG:4326', geodesic=False)
+
         return geometry, bbox
     
-    def get_osm_urban_context(self, polygon: ee.Geometry, bbox: BoundingBox) -> Dict:
+    def get_osm_urban_context(self, polygon: ee.Geometry, bbox: BoundingBox,
+                              geometry_required: bool = True) -> Dict:
         """
         Get OSM urban context data for India-specific urban likelihood scoring.
         
@@ -862,9 +1452,14 @@ out geom;"""
         Args:
             polygon: Earth Engine polygon geometry for the locality
             bbox: Bounding box for the locality
+            geometry_required: When False, fetch tags only ('out tags') and
+                return just the road/building counts — the geometry payload
+                is 10-50x the size of the tags and only needed for the
+                length/area densities
             
         Returns:
             Dictionary with urban context metrics for likelihood scoring
+            (counts only when geometry_required=False)
         """
         try:
             # Get bounding box coordinates
@@ -874,34 +1469,23 @@ out geom;"""
             # Calculate AOI area in km²
             avg_lat = (min_lat + max_lat) / 2
             lat_size_km = (max_lat - min_lat) * 111.0
-            lon_size_km = (max_lon - min_lon) * 111.0 * abs(np.cos(np.radians(avg_lat)))
+            lon_size_km = (max_lon - min_lon) * 111.0 * abs(math.cos(math.radians(avg_lat)))
             aoi_area_km2 = lat_size_km * lon_size_km
             
-            overpass_servers = [
-                "https://overpass-api.de/api/interpreter",
-                "https://overpass.kumi.systems/api/interpreter",
-                "https://overpass.openstreetmap.ru/api/interpreter"
-            ]
-            
             # Query for roads and buildings with geometry to calculate lengths/areas
+            out_mode = 'out geom;' if geometry_required else 'out tags;'
             overpass_query = f"""[out:json][timeout:25];
 (
   way["highway"]({min_lat},{min_lon},{max_lat},{max_lon});
   way["building"]({min_lat},{min_lon},{max_lat},{max_lon});
 );
-out geom;"""
-            
-            response = None
-            last_error = None
-            
-            for server in overpass_servers:
-                try:
-                    response = requests.post(server, data={'data': overpass_query}, timeout=30)
-                    if response.status_code == 200:
-                        break
-                except Exception as e:
-                    last_error = str(e)
-                    continue
+{out_mode}"""
+
+            # Query all mirrors concurrently; first success wins — a hung
+            # primary no longer serializes into sum-of-timeouts latency.
+            # Leave the body on the socket when ijson can stream-parse it.
+            response, last_error = _post_overpass_any(overpass_query, 30,
+                                                      stream=IJSON_AVAILABLE)
             
             if response is None or response.status_code != 200:
                 # Return default values if OSM query fails
@@ -918,55 +1502,94 @@ out geom;"""
                     'error': f"OSM query failed: {last_error}" if last_error else "OSM query failed"
                 }
             
-            data = response.json()
-            
+            if IJSON_AVAILABLE:
+                # Parse elements one at a time straight off the socket:
+                # dense urban AOIs return 100+ MB payloads, and buffering
+                # them peaks RSS at several times the payload size
+                response.raw.decode_content = True
+                elements = ijson.items(response.raw, 'elements.item')
+            else:
+                elements = orjson.loads(response.content).get('elements', [])
+
             # Calculate road length and building area
             road_length_m = 0.0
             building_area_m2 = 0.0
             road_count = 0
             building_count = 0
-            
-            if 'elements' in data:
-                for element in data['elements']:
+            road_points = []  # per-way Nx2 arrays, measured in one pass below
+
+            if not geometry_required:
+                # Counting-only pass: no geometry arrived, just tally tags
+                for element in elements:
                     if element.get('type') == 'way':
                         tags = element.get('tags', {})
-                        geometry = element.get('geometry', [])
-                        
-                        if len(geometry) < 2:
-                            continue
-                        
-                        coords = [(p['lon'], p['lat']) for p in geometry]
-                        
                         if 'highway' in tags:
-                            # Calculate road length using Haversine formula
-                            from math import radians, sin, cos, sqrt, atan2
-                            R = 6371000  # Earth radius in meters
-                            for i in range(len(coords) - 1):
-                                lon1, lat1 = coords[i]
-                                lon2, lat2 = coords[i + 1]
-                                dlat = radians(lat2 - lat1)
-                                dlon = radians(lon2 - lon1)
-                                a = sin(dlat/2)**2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon/2)**2
-                                c = 2 * atan2(sqrt(a), sqrt(1-a))
-                                road_length_m += R * c
                             road_count += 1
-                            
                         elif 'building' in tags:
-                            # Calculate building area using shoelace formula
-                            if len(coords) >= 3:
-                                area = 0.0
-                                for i in range(len(coords)):
-                                    j = (i + 1) % len(coords)
-                                    area += coords[i][0] * coords[j][1]
-                                    area -= coords[j][0] * coords[i][1]
-                                area = abs(area) / 2.0
-                                # Convert to m² (approximate)
-                                lat_center = sum(p['lat'] for p in geometry) / len(geometry)
-                                lat_factor = 111000.0 * np.cos(np.radians(lat_center))
-                                lon_factor = 111000.0
-                                building_area_m2 += area * lat_factor * lon_factor
                             building_count += 1
-            
+                return {
+                    'has_roads': road_count > 0,
+                    'has_buildings': building_count > 0,
+                    'road_count': road_count,
+                    'building_count': building_count
+                }
+
+            for element in elements:
+                if element.get('type') == 'way':
+                    tags = element.get('tags', {})
+                    geometry = element.get('geometry', [])
+
+                    if len(geometry) < 2:
+                        continue
+
+                    pts = np.asarray([(p['lon'], p['lat']) for p in geometry],
+                                     dtype=np.float64)
+                    # Drop consecutive duplicate vertices — common in OSM
+                    # ways, and each one costs a trig evaluation for zero
+                    # contribution to length or area
+                    keep = np.concatenate(
+                        ([True], np.any(np.diff(pts, axis=0) != 0, axis=1)))
+                    pts = pts[keep]
+
+                    if 'highway' in tags:
+                        # Defer the length math: collect vertices and run
+                        # one vectorized Haversine over all roads at once
+                        if len(pts) >= 2:
+                            road_points.append(pts)
+                        road_count += 1
+
+                    elif 'building' in tags:
+                        # Calculate building area using shoelace formula
+                        # (vectorized: np.roll pairs each vertex with its
+                        # successor, wrapping the last back to the first)
+                        if len(pts) >= 3:
+                            x = pts[:, 0]
+                            y = pts[:, 1]
+                            area = 0.5 * abs(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+                            # Convert to m² (approximate)
+                            lat_factor = 111000.0 * math.cos(math.radians(y.mean()))
+                            lon_factor = 111000.0
+                            building_area_m2 += area * lat_factor * lon_factor
+                        building_count += 1
+
+            if road_points:
+                # Single Haversine kernel over every road vertex: dense urban
+                # tiles carry thousands of segments, and the per-segment
+                # Python loop was the CPU hot spot of this method
+                pts = np.concatenate(road_points)
+                lat = np.radians(pts[:, 1])
+                lon = np.radians(pts[:, 0])
+                dlat = np.diff(lat)
+                dlon = np.diff(lon)
+                a = np.sin(dlat / 2) ** 2 + np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(dlon / 2) ** 2
+                segment_m = 2 * 6371000.0 * np.arcsin(np.sqrt(a))
+                # Zero the synthetic segments that join the end of one way to
+                # the start of the next in the concatenated array
+                if len(road_points) > 1:
+                    way_ends = np.cumsum([len(p) for p in road_points[:-1]]) - 1
+                    segment_m[way_ends] = 0.0
+                road_length_m = float(segment_m.sum())
+
             road_length_km = road_length_m / 1000.0
             building_area_km2 = building_area_m2 / 1e6
             road_density = road_length_km / aoi_area_km2 if aoi_area_km2 > 0 else 0.0
@@ -1028,59 +1651,68 @@ out geom;"""
             Tuple of (geometry, bbox) or (None, None) if not found
         """
         try:
-            nominatim_lookup_url = "https://nominatim.openstreetmap.org/lookup"
-            lookup_params = {
-                'osm_ids': osm_id,
-                'format': 'geojson',
-                'polygon_geojson': 1
-            }
-            
-            lookup_response = requests.get(nominatim_lookup_url, params=lookup_params, timeout=15,
-                                          headers={'User-Agent': 'GeospatialIntelligenceSystem/1.0'})
-            
-            if lookup_response.status_code == 200:
-                lookup_data = lookup_response.json()
-                if lookup_data.get('features'):
-                    feature = lookup_data['features'][0]
-                    geometry_data = feature.get('geometry')
-                    
-                    if geometry_data and geometry_data.get('type') == 'Polygon':
-                        coordinates = geometry_data['coordinates'][0]
-                        ee_coords = [[coord[0], coord[1]] for coord in coordinates]
-                        polygon = ee.Geometry.Polygon(ee_coords)
-                        
-                        lons = [coord[0] for coord in coordinates]
-                        lats = [coord[1] for coord in coordinates]
-                        bbox = BoundingBox(
-                            min_lon=min(lons),
-                            min_lat=min(lats),
-                            max_lon=max(lons),
-                            max_lat=max(lats)
-                        )
-                        
-                        return polygon, bbox
-                    
-                    elif geometry_data and geometry_data.get('type') == 'MultiPolygon':
-                        multi_polygon_coords = []
-                        all_lons = []
-                        all_lats = []
-                        
-                        for polygon_coords in geometry_data['coordinates']:
-                            outer_ring = polygon_coords[0]
-                            multi_polygon_coords.append([[coord[0], coord[1]] for coord in outer_ring])
-                            all_lons.extend([coord[0] for coord in outer_ring])
-                            all_lats.extend([coord[1] for coord in outer_ring])
-                        
-                        polygon = ee.Geometry.MultiPolygon(multi_polygon_coords)
-                        bbox = BoundingBox(
-                            min_lon=min(all_lons),
-                            min_lat=min(all_lats),
-                            max_lon=max(all_lons),
-                            max_lat=max(all_lats)
-                        )
-                        
-                        return polygon, bbox
-            
+            # OSM IDs are stable, so the raw GeoJSON payload caches well
+            lookup_cache_key = f"nomlookup:{osm_id}"
+            cached_body = self._cache_get(lookup_cache_key)
+            if cached_body is not None:
+                lookup_data = orjson.loads(cached_body)
+            else:
+                nominatim_lookup_url = "https://nominatim.openstreetmap.org/lookup"
+                lookup_params = {
+                    'osm_ids': osm_id,
+                    'format': 'geojson',
+                    'polygon_geojson': 1
+                }
+
+                lookup_response = HTTP_SESSION.get(nominatim_lookup_url, params=lookup_params, timeout=15)
+
+                if lookup_response.status_code != 200:
+                    return None, None
+                lookup_data = orjson.loads(lookup_response.content)
+                self._cache_set(lookup_cache_key, lookup_response.content, expire=self.GEOMETRY_CACHE_TTL)
+
+            if lookup_data.get('features'):
+                feature = lookup_data['features'][0]
+                geometry_data = feature.get('geometry')
+                
+                if geometry_data and geometry_data.get('type') == 'Polygon':
+                    # GeoJSON coordinates are already [[lon, lat], ...] —
+                    # hand the ring to ee.Geometry directly instead of
+                    # rebuilding it pair by pair
+                    coordinates = geometry_data['coordinates'][0]
+                    polygon = ee.Geometry.Polygon(coordinates)
+
+                    arr = np.asarray(coordinates, dtype=np.float64)[:, :2]
+                    mins = arr.min(axis=0)
+                    maxs = arr.max(axis=0)
+                    bbox = BoundingBox(
+                        min_lon=float(mins[0]),
+                        min_lat=float(mins[1]),
+                        max_lon=float(maxs[0]),
+                        max_lat=float(maxs[1])
+                    )
+
+                    return polygon, bbox
+
+                elif geometry_data and geometry_data.get('type') == 'MultiPolygon':
+                    outer_rings = [p[0] for p in geometry_data['coordinates']]
+                    polygon = ee.Geometry.MultiPolygon(outer_rings)
+
+                    all_coords = np.concatenate([
+                        np.asarray(ring, dtype=np.float64)[:, :2]
+                        for ring in outer_rings
+                    ])
+                    mins = all_coords.min(axis=0)
+                    maxs = all_coords.max(axis=0)
+                    bbox = BoundingBox(
+                        min_lon=float(mins[0]),
+                        min_lat=float(mins[1]),
+                        max_lon=float(maxs[0]),
+                        max_lat=float(maxs[1])
+                    )
+
+                    return polygon, bbox
+
             return None, None
         except Exception as e:
             return None, None
@@ -1105,16 +1737,21 @@ class EarthEngineService:
             Tuple of (is_valid, error_message)
         """
         try:
+            # One getInfo for both checks — each round-trip is 200-500ms
+            info = ee.Dictionary({
+                'area': geom.area(),
+                'valid': geom.isValid()
+            }).getInfo()
+
             # Check area
-            area = geom.area().getInfo()
+            area = info['area']
             if area < 1e6:  # Less than 1 km²
                 return False, f"Geometry area too small: {area:.0f} m² (minimum 1 km²)"
-            
+
             # Check validity
-            is_valid = geom.isValid().getInfo()
-            if not is_valid:
+            if not info['valid']:
                 return False, "Geometry is invalid (self-intersections or other topology errors)"
-            
+
             return True, None
             
         except Exception as e:
@@ -1138,30 +1775,35 @@ class EarthEngineService:
         return buffer_geom
     
     @staticmethod
-    def preprocess_polygon(raw_polygon: ee.Geometry) -> ee.Geometry:
+    def preprocess_polygon(raw_polygon: ee.Geometry, skip_preprocess: bool = False) -> ee.Geometry:
         """
         Preprocess OSM polygon before using in Google Earth Engine
-        
+
         Production-grade preprocessing to reduce vertex count and fix topology:
         1. Simplify with 200m tolerance to reduce vertex count
         2. Buffer with 1 meter to fix invalid topology
-        3. Transform to EPSG:4326 with scale 1
-        
+
         Args:
             raw_polygon: Raw Earth Engine geometry from OSM
-            
+            skip_preprocess: Return the geometry untouched. Use for geometries
+                that are already simple and valid (rectangles, buffers, small
+                polygons) so Earth Engine does not pay simplify/buffer/transform
+                compute on every later operation.
+
         Returns:
             Preprocessed Earth Engine geometry ready for Earth Engine operations
         """
+        if skip_preprocess:
+            return raw_polygon
+
         # Step 1: Simplify with 200m tolerance to reduce vertex count
         geometry = raw_polygon.simplify(maxError=200)
         
         # Step 2: Buffer with 1 meter to fix invalid topology (self-intersections, etc.)
+        # (no transform step: OSM inputs are already WGS84, and the old
+        # .transform('EPSG:4326', 1) was a no-op the server still evaluated)
         geometry = geometry.buffer(1)
-        
-        # Step 3: Transform to EPSG:4326 with scale 1
-        geometry = geometry.transform('EPSG:4326', 1)
-        
+
         return geometry
     
     @staticmethod
@@ -1182,15 +1824,20 @@ class EarthEngineService:
             Fixed 1km × 1km square AOI centered on centroid
         """
         geom = ee.Geometry(raw_polygon)
-        
+
+        # Centroid and bounds in a single getInfo round-trip (each one is
+        # 200-500ms of latency per locality)
+        info = ee.Dictionary({
+            'centroid': geom.centroid().coordinates(),
+            'bounds': geom.bounds().coordinates()
+        }).getInfo()
+
         # Get centroid
-        centroid = geom.centroid()
-        centroid_coords = centroid.getInfo()['coordinates']
+        centroid_coords = info['centroid']
         cent_lon, cent_lat = centroid_coords[0], centroid_coords[1]
-        
+
         # Check if original polygon is too large (> 1.2 km) - reject it
-        bbox = geom.bounds()
-        bbox_coords = bbox.getInfo()['coordinates'][0]
+        bbox_coords = info['bounds'][0]
         lons = [c[0] for c in bbox_coords]
         lats = [c[1] for c in bbox_coords]
         min_lon, max_lon = min(lons), max(lons)
@@ -1199,7 +1846,7 @@ class EarthEngineService:
         # Calculate original polygon size
         avg_lat = (min_lat + max_lat) / 2
         lat_size_km = (max_lat - min_lat) * 111.0
-        lon_size_km = (max_lon - min_lon) * 111.0 * abs(np.cos(np.radians(avg_lat)))
+        lon_size_km = (max_lon - min_lon) * 111.0 * abs(math.cos(math.radians(avg_lat)))
         aoi_size_km = max(lat_size_km, lon_size_km)
         
         if aoi_size_km > 1.2:
@@ -1209,41 +1856,89 @@ class EarthEngineService:
         # 0.5 km radius = 1km × 1km square
         radius_km = 0.5
         radius_degrees_lat = radius_km / 111.0
-        radius_degrees_lon = radius_km / (111.0 * abs(np.cos(np.radians(cent_lat))))
+        radius_degrees_lon = radius_km / (111.0 * abs(math.cos(math.radians(cent_lat))))
         
-        # Create 1km × 1km square AOI
+        # Create 1km × 1km square AOI — built planar in WGS84 directly, so
+        # no transform pass is needed
         aoi_box = ee.Geometry.Rectangle([
             cent_lon - radius_degrees_lon,
             cent_lat - radius_degrees_lat,
             cent_lon + radius_degrees_lon,
             cent_lat + radius_degrees_lat
-        ])
-        
-        # Transform to EPSG:4326
-        aoi_box = aoi_box.transform('EPSG:4326', 1)
-        
+        ], proj='EPSG:4326', geodesic=False)
+
         return aoi_box
     
+    # High-volume endpoint: the tiled reduceRegion workload fires many small
+    # concurrent requests, which the standard endpoint caps at ~6 in flight
+    # per client; high-volume raises that to ~40
+    _EE_HIGH_VOLUME_URL = 'https://earthengine-highvolume.googleapis.com'
+
+    # Reduction results for a fixed (image, polygon, scale) are deterministic,
+    # but composites built from rolling date windows change daily — one day
+    # keeps repeat analyses free without serving stale imagery
+    RESULT_CACHE_TTL = 86400
+
+    # Process-wide instances keyed by project: ee.Initialize is a ~500ms
+    # network handshake that request handlers must not repeat
+    _instances: Dict[Optional[str], 'EarthEngineService'] = {}
+
+    @classmethod
+    def instance(cls, project: Optional[str] = None) -> 'EarthEngineService':
+        """Return the shared service for this project, initializing once."""
+        service = cls._instances.get(project)
+        if service is None:
+            service = cls._instances[project] = cls(project=project)
+        return service
+
     def __init__(self, project: Optional[str] = None):
         """
         Initialize Earth Engine service
-        
+
         Args:
-            project: Optional Google Cloud project ID. Can also be set via 
+            project: Optional Google Cloud project ID. Can also be set via
                     EARTHENGINE_PROJECT environment variable.
         """
+        # Deferred tile FeatureCollections, content-keyed on the clip
+        # geometry plus bbox — rebuilt grids are identical for repeat
+        # analyses of the same AOI. Bounded FIFO, like the bounds memo.
+        self._tiles_fc_cache: Dict[str, ee.FeatureCollection] = {}
+
+        # Fetched bounds keyed by a hash of the serialized geometry —
+        # content-addressed like the result cache, so a recycled object
+        # address can never alias a different polygon. Bounded FIFO.
+        self._bounds_cache: Dict[str, BoundingBox] = {}
+
+        # Persistent cache for reduction results (optional - only if
+        # diskcache installed): re-analyzing the same AOI with the same
+        # parameters is the typical dev workflow, and the inputs are
+        # deterministic
+        self._disk_cache = None
+        if DISKCACHE_AVAILABLE:
+            try:
+                self._disk_cache = diskcache.Cache(
+                    os.path.join(os.path.expanduser('~'), '.sia_eecache')
+                )
+            except Exception as e:
+                print(f"Warning: EE result cache unavailable: {e}")
+
         try:
             # Get project from parameter or environment variable
             if not project:
                 import os
                 project = os.getenv('EARTHENGINE_PROJECT')
-            
+
+            # Skip the handshake entirely if this process already holds
+            # Earth Engine credentials (e.g. another instance initialized)
+            if getattr(ee.data, '_credentials', None) is not None:
+                return
+
             # Initialize Earth Engine
             try:
                 if project:
-                    ee.Initialize(project=project)
+                    ee.Initialize(project=project, opt_url=self._EE_HIGH_VOLUME_URL)
                 else:
-                    ee.Initialize()
+                    ee.Initialize(opt_url=self._EE_HIGH_VOLUME_URL)
             except Exception as init_error:
                 error_msg = str(init_error).lower()
                 
@@ -1264,9 +1959,9 @@ class EarthEngineService:
                     try:
                         ee.Authenticate()
                         if project:
-                            ee.Initialize(project=project)
+                            ee.Initialize(project=project, opt_url=self._EE_HIGH_VOLUME_URL)
                         else:
-                            ee.Initialize()
+                            ee.Initialize(opt_url=self._EE_HIGH_VOLUME_URL)
                     except Exception as auth_error:
                         raise RuntimeError(
                             f"Failed to authenticate Google Earth Engine.\n"
@@ -1322,19 +2017,23 @@ class EarthEngineService:
         # Filter by fixed date range
         collection = collection.filterDate(fixed_start_date, fixed_end_date)
         
-        # Check if collection has images
-        collection_size = collection.size().getInfo()
-        if collection_size == 0:
+        # One getInfo for the size check and the reporting date — the
+        # separate sort/first/get probe cost an extra round-trip
+        info = ee.Dictionary({
+            'size': collection.size(),
+            'latest': collection.aggregate_max('system:time_start')
+        }).getInfo()
+
+        if info['size'] == 0:
             raise RuntimeError(f"No Dynamic World image available for {fixed_start_date} to {fixed_end_date}")
-        
+
         # Use median composite of the fixed season window
         # This ensures consistency across all cities
         dw_image = collection.select('label').median()
-        
-        # Get the most recent date from the collection for reporting
+
+        # Most recent date from the collection for reporting
         try:
-            recent_image = collection.sort('system:time_start', False).first()
-            date_info = recent_image.get('system:time_start').getInfo()
+            date_info = info.get('latest')
             if date_info:
                 date_obj = datetime.fromtimestamp(date_info / 1000)
                 date_string = date_obj.strftime('%Y-%m-%d')
@@ -1349,53 +2048,70 @@ class EarthEngineService:
         
         return labels, date_string
     
-    def _create_2km_tiles(self, geometry: ee.Geometry, bbox: BoundingBox) -> List[ee.Geometry]:
+    def _create_2km_tiles(self, geometry: ee.Geometry, bbox: BoundingBox) -> ee.FeatureCollection:
         """
-        Create 2km × 2km grid tiles from bounding box and intersect with geometry
-        
+        Create a FeatureCollection of 2km × 2km grid tiles clipped to geometry
+
+        The intersection with the city boundary and the sliver-area filter both
+        run server-side as part of whatever reduction consumes the collection —
+        no per-tile round trips are issued from here.
+
         Args:
             geometry: Earth Engine geometry (city boundary)
             bbox: Bounding box of the geometry
-            
+
         Returns:
-            List of tile geometries (intersected with city boundary)
-        """
-        # Approximate conversion: 1 degree latitude ≈ 111 km
-        # 1 degree longitude ≈ 111 km * cos(latitude)
-        # For 2km tiles: 2/111 ≈ 0.018 degrees
-        
-        # Use average latitude for longitude conversion
-        avg_lat = (bbox.min_lat + bbox.max_lat) / 2
-        lat_degree_to_km = 111.0
-        lon_degree_to_km = 111.0 * abs(np.cos(np.radians(avg_lat)))
-        
-        # 2km in degrees
-        tile_size_lat = 2.0 / lat_degree_to_km  # ~0.018 degrees
-        tile_size_lon = 2.0 / lon_degree_to_km  # ~0.018 degrees (adjusted for latitude)
-        
-        tiles = []
-        current_lat = bbox.min_lat
-        
-        while current_lat < bbox.max_lat:
-            current_lon = bbox.min_lon
-            while current_lon < bbox.max_lon:
-                # Create 2km × 2km tile
-                tile_bbox = ee.Geometry.Rectangle([
-                    current_lon,
-                    current_lat,
-                    min(current_lon + tile_size_lon, bbox.max_lon),
-                    min(current_lat + tile_size_lat, bbox.max_lat)
-                ])
-                
-                # Intersect tile with city geometry (only count pixels inside city boundary)
-                tile = geometry.intersection(tile_bbox)
-                tiles.append(tile)
-                
-                current_lon += tile_size_lon
-            
-            current_lat += tile_size_lat
-        
-        return tiles
+            FeatureCollection of tile features (clipped, slivers dropped)
+        """
+        # Area-by-class and pixel-count run back to back on the same AOI;
+        # rebuilding an identical tile collection each time wastes both
+        # Python time and request serialization. The key must include the
+        # clip geometry: two geometries can share a bbox (a city polygon
+        # and its derived rectangle) but clip to different grids.
+        cache_key = hashlib.sha256(
+            f"{geometry.serialize()}|{bbox}".encode()).hexdigest()
+        cached_fc = self._tiles_fc_cache.get(cache_key)
+        if cached_fc is not None:
+            return cached_fc
+
+        tile_km = _adaptive_tile_km(bbox)
+        if tile_km > 2.0:
+            print(f"Large AOI: using {tile_km:.1f} km tiles to cap the grid at ~500 cells")
+        tile_size_lat, tile_size_lon = _grid_params(bbox.min_lat, bbox.max_lat, tile_km)
+
+        # Corner arithmetic runs through the numba-compiled kernel when
+        # numba is installed, otherwise through the vectorized NumPy
+        # fallback — either way, no interpreted per-cell loop
+        rects = _grid_corners(bbox.min_lat, bbox.max_lat,
+                              bbox.min_lon, bbox.max_lon,
+                              tile_size_lat, tile_size_lon)
+
+        features = [ee.Feature(ee.Geometry.Rectangle(rect))
+                    for rect in rects.tolist()]
+
+        def _clip_to_city(feature):
+            # Interior tiles — the vast majority — sit fully inside the city
+            # polygon, where intersection returns the rectangle unchanged at
+            # a cost that grows with the boundary's vertex count. A contains
+            # test keeps the clip to the O(perimeter) boundary strip.
+            tile_geom = feature.geometry()
+            clipped = ee.Geometry(ee.Algorithms.If(
+                geometry.contains(tile_geom, 1),
+                tile_geom,
+                tile_geom.intersection(geometry, 1)))
+            # maxError=1 m is plenty for sliver rejection and far cheaper
+            # than the default exact computation
+            return ee.Feature(clipped).set('area', clipped.area(1))
+
+        # Clip each tile to the city boundary and drop the sub-meter slivers
+        # that intersection produces along the edges — all deferred ops
+        tiles_fc = (ee.FeatureCollection(features)
+                    .map(_clip_to_city)
+                    .filter(ee.Filter.gt('area', 1)))
+        if len(self._tiles_fc_cache) >= self._GEOM_CACHE_MAX:
+            self._tiles_fc_cache.pop(next(iter(self._tiles_fc_cache)))
+        self._tiles_fc_cache[cache_key] = tiles_fc
+        return tiles_fc
     
     def _merge_histograms(self, histograms: List[Dict]) -> Dict[int, int]:
         """
@@ -1407,18 +2123,14 @@ class EarthEngineService:
         Returns:
             Merged histogram dictionary
         """
-        merged = {}
+        # Counter.update sums in C; the old dict.get loop paid Python-level
+        # lookups per key across potentially hundreds of tiles
+        merged = Counter()
         for hist in histograms:
-            if hist and 'label' in hist:
-                label_hist = hist['label']
-                for label_str, count in label_hist.items():
-                    try:
-                        label = int(float(label_str))
-                        count_val = int(float(count))
-                        merged[label] = merged.get(label, 0) + count_val
-                    except (ValueError, TypeError):
-                        continue
-        return merged
+            label_hist = (hist or {}).get('label')
+            if label_hist:
+                merged.update(_parse_label_histogram(label_hist))
+        return dict(merged)
     
     def count_pixels_by_class_direct(self, image: ee.Image, polygon: ee.Geometry, scale: int = 30) -> Dict[int, int]:
         """
@@ -1454,178 +2166,68 @@ class EarthEngineService:
             )
             
             histogram_dict = histogram.getInfo()
-            
-            # Check if hist is empty
-            if not histogram_dict or 'label' not in histogram_dict:
-                # Try with expanded geometry
-                expanded_geom = polygon.buffer(100)
-                histogram = image.reduceRegion(
-                    reducer=ee.Reducer.frequencyHistogram(),
-                    geometry=expanded_geom,
-                    scale=scale,
-                    maxPixels=1e13,
-                    bestEffort=True
-                )
-                histogram_dict = histogram.getInfo()
-                
-                if not histogram_dict or 'label' not in histogram_dict:
-                    # Return empty dict - let caller handle fallback
-                    return {}
-            
-            label_histogram = histogram_dict.get('label', {})
-            
-            if not label_histogram or len(label_histogram) == 0:
-                # Try with expanded geometry
-                expanded_geom = polygon.buffer(100)
-                histogram = image.reduceRegion(
-                    reducer=ee.Reducer.frequencyHistogram(),
-                    geometry=expanded_geom,
-                    scale=scale,
-                    maxPixels=1e13,
-                    bestEffort=True
-                )
-                histogram_dict = histogram.getInfo()
-                
-                if histogram_dict and 'label' in histogram_dict:
-                    label_histogram = histogram_dict['label']
-                else:
-                    return {}
-            
-            # Step 5: Post-process - Remove key "-1" from histogram (masked pixels)
-            # Convert to integer keys and values, filtering out masked pixels (-1)
-            pixel_counts = {}
-            total_pixels = 0
-            masked_pixels = 0
-            
-            for label_str, count in label_histogram.items():
-                try:
-                    label = int(float(label_str))
-                    count_val = int(float(count))
-                    
-                    # Remove masked pixels (key = -1)
-                    if label == -1:
-                        masked_pixels += count_val
-                        continue
-                    
-                    # Only count valid Dynamic World labels (0-7)
-                    if 0 <= label <= 7 and count_val > 0:
-                        pixel_counts[label] = count_val
-                        total_pixels += count_val
-                except (ValueError, TypeError):
-                    continue
-            
+
+            # One guard covers both empty shapes (missing dict and missing
+            # 'label'); the old expanded-buffer retries almost never helped —
+            # preprocessed AOI polygons are valid — and just doubled the
+            # latency of the error path before the caller's tiled fallback
+            label_histogram = (histogram_dict or {}).get('label') or {}
+            if not label_histogram:
+                # Return empty dict - let caller handle fallback
+                return {}
+
+
+            # Step 5: Post-process - the parser drops the "-1" masked-pixel
+            # key and anything outside the valid Dynamic World labels (0-7)
+            pixel_counts = _parse_label_histogram(label_histogram)
+
             # If all pixels are masked, return empty dict
-            if total_pixels == 0:
+            if not pixel_counts:
                 return {}
-            
+
             return pixel_counts
             
         except Exception as e:
             # Return empty dict on error - let caller handle fallback
             return {}
     
-    def _count_pixels_tiled(self, image: ee.Image, polygon: ee.Geometry, scale: int = 30) -> Dict[int, int]:
+    def _count_pixels_tiled(self, image: ee.Image, polygon: ee.Geometry,
+                            bbox: BoundingBox, scale: int = 30) -> Dict[int, int]:
         """
         Count pixels by subdividing geometry into 2km × 2km tiles
-        
+
         Step 5: If hist is empty, subdivide geom into 2km × 2km tiles,
         run reduceRegion per tile, merge histograms
-        
+
         Args:
             image: Earth Engine image with 'label' band
             polygon: Earth Engine polygon geometry (preprocessed)
+            bbox: Bounding box of the polygon (callers already hold it —
+                re-fetching polygon.bounds() cost a round trip)
             scale: Resolution in meters (default 30m)
-            
+
         Returns:
             Dictionary mapping class labels to pixel counts
         """
-        # Get bounding box of polygon
-        try:
-            bounds = polygon.bounds().getInfo()['coordinates'][0]
-            min_lon, min_lat = bounds[0]
-            max_lon, max_lat = bounds[2]
-        except Exception as e:
-            raise RuntimeError(f"Failed to get polygon bounds: {str(e)}")
-        
-        # Create 2km × 2km tiles
-        # 1 degree latitude ≈ 111 km, so 2km ≈ 0.018 degrees
-        avg_lat = (min_lat + max_lat) / 2
-        lat_degree_to_km = 111.0
-        lon_degree_to_km = 111.0 * abs(np.cos(np.radians(avg_lat)))
-        
-        tile_size_lat = 2.0 / lat_degree_to_km  # ~0.018 degrees
-        tile_size_lon = 2.0 / lon_degree_to_km  # ~0.018 degrees
-        
-        all_pixel_counts = {}
+        tiles = self._build_fallback_tiles(polygon, bbox)
+
+        # The per-tile requests are pure I/O wait, so overlapping them cuts
+        # wall time roughly linearly with worker count; 32 sits safely under
+        # the high-volume endpoint's ~40 concurrent-request limit
+        all_pixel_counts = Counter()
+        total_tiles = len(tiles)
         successful_tiles = 0
         failed_tiles = 0
-        total_tiles = 0
-        current_lat = min_lat
-        
-        while current_lat < max_lat:
-            current_lon = min_lon
-            while current_lon < max_lon:
-                total_tiles += 1
-                # Create tile
-                try:
-                    tile_bbox = ee.Geometry.Rectangle([
-                        current_lon,
-                        current_lat,
-                        min(current_lon + tile_size_lon, max_lon),
-                        min(current_lat + tile_size_lat, max_lat)
-                    ])
-                    
-                    # Intersect tile with polygon
-                    tile = polygon.intersection(tile_bbox)
-                    
-                    # Check if tile has area
-                    try:
-                        tile_area = tile.area().getInfo()
-                        if tile_area < 1e-6:  # Skip very small tiles
-                            current_lon += tile_size_lon
-                            continue
-                    except:
-                        # If area check fails, try anyway
-                        pass
-                    
-                    # Run reduceRegion on tile
-                    # Use lower maxPixels and bestEffort for individual tiles
-                    histogram = image.reduceRegion(
-                        reducer=ee.Reducer.frequencyHistogram(),
-                        geometry=tile,
-                        scale=scale,
-                        maxPixels=1e9,  # Lower for individual tiles
-                        bestEffort=True,
-                        tileScale=2  # Use tileScale for better performance
-                    )
-                    
-                    histogram_dict = histogram.getInfo()
-                    
-                    if histogram_dict and 'label' in histogram_dict:
-                        label_histogram = histogram_dict['label']
-                        if label_histogram and len(label_histogram) > 0:
-                            # Merge into all_pixel_counts
-                            for label_str, count in label_histogram.items():
-                                try:
-                                    label = int(float(label_str))
-                                    count_val = int(float(count))
-                                    all_pixel_counts[label] = all_pixel_counts.get(label, 0) + count_val
-                                except (ValueError, TypeError):
-                                    continue
-                            successful_tiles += 1
-                        else:
-                            failed_tiles += 1
-                    else:
-                        failed_tiles += 1
-                except Exception as e:
-                    # Skip failed tiles but log for debugging
+
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            for label_histogram in executor.map(
+                    lambda tile: self._reduce_tile_histogram(image, tile, scale), tiles):
+                if not label_histogram:
                     failed_tiles += 1
                     continue
-                
-                current_lon += tile_size_lon
-            
-            current_lat += tile_size_lat
-        
+                all_pixel_counts.update(_parse_label_histogram(label_histogram))
+                successful_tiles += 1
+
         if not all_pixel_counts:
             raise RuntimeError(
                 f"Empty histogram after tiling. "
@@ -1633,121 +2235,362 @@ class EarthEngineService:
                 f"Dynamic World may not have data for this locality in the last 30 days. "
                 f"Try expanding the date range or check if the locality geometry is valid."
             )
-        
-        return all_pixel_counts
+
+        return dict(all_pixel_counts)
+
+    async def _count_pixels_tiled_async(self, image: ee.Image, polygon: ee.Geometry,
+                                        bbox: BoundingBox, scale: int = 30) -> Dict[int, int]:
+        """
+        Async twin of _count_pixels_tiled for event-loop callers
+
+        Each blocking per-tile getInfo runs via asyncio.to_thread and the
+        batch is awaited with asyncio.gather; the semaphore applies the same
+        32-in-flight cap as the thread-pool path, but back-pressure is
+        shared with everything else on the loop instead of a private pool.
+        """
+        tiles = self._build_fallback_tiles(polygon, bbox)
+        semaphore = asyncio.Semaphore(32)
+
+        async def _reduce_one(tile):
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._reduce_tile_histogram, image, tile, scale)
+
+        results = await asyncio.gather(*(_reduce_one(tile) for tile in tiles))
+
+        all_pixel_counts = Counter()
+        successful_tiles = 0
+        failed_tiles = 0
+        for label_histogram in results:
+            if not label_histogram:
+                failed_tiles += 1
+                continue
+            all_pixel_counts.update(_parse_label_histogram(label_histogram))
+            successful_tiles += 1
+
+        if not all_pixel_counts:
+            raise RuntimeError(
+                f"Empty histogram after tiling. "
+                f"Total tiles: {len(tiles)}, Successful: {successful_tiles}, Failed: {failed_tiles}. "
+                f"Dynamic World may not have data for this locality in the last 30 days. "
+                f"Try expanding the date range or check if the locality geometry is valid."
+            )
+
+        return dict(all_pixel_counts)
+
+    def _build_fallback_tiles(self, polygon: ee.Geometry, bbox: BoundingBox) -> List[ee.Geometry]:
+        """Build the per-tile 2km grid geometries for the fallback paths.
+
+        All tiles come back up-front so the network phase can overlap
+        requests instead of paying one RTT per tile in sequence.
+
+        City-sized AOIs get a level-12 S2 cell covering when s2sphere is
+        installed: equal-area cells with no latitude skew, clipped to the
+        AOI the same way as grid tiles. Larger AOIs keep the adaptive
+        degree grid, whose tile size grows to cap the cell count.
+        """
+        def _clip_tile(tile: ee.Geometry) -> ee.Geometry:
+            # Interior tiles skip the intersection entirely — contains() is
+            # a cheap predicate, and for typical city AOIs most tiles pass
+            return ee.Geometry(ee.Algorithms.If(
+                polygon.contains(tile, 1),
+                tile,
+                tile.intersection(polygon, 1)
+            ))
+
+        if S2SPHERE_AVAILABLE and _adaptive_tile_km(bbox) <= 2.0:
+            return [
+                _clip_tile(ee.Geometry.Polygon([ring]))
+                for ring in _s2_covering_rings(bbox)
+            ]
+
+        min_lon, min_lat = bbox.min_lon, bbox.min_lat
+        max_lon, max_lat = bbox.max_lon, bbox.max_lat
+        tile_size_lat, tile_size_lon = _grid_params(min_lat, max_lat,
+                                                    _adaptive_tile_km(bbox))
+
+        tiles = []
+        current_lat = min_lat
+
+        while current_lat < max_lat:
+            current_lon = min_lon
+            while current_lon < max_lon:
+                tile_bbox = ee.Geometry.Rectangle([
+                    current_lon,
+                    current_lat,
+                    min(current_lon + tile_size_lon, max_lon),
+                    min(current_lat + tile_size_lat, max_lat)
+                ])
+                # Clip tile against the polygon (boundary tiles only)
+                tiles.append(_clip_tile(tile_bbox))
+                current_lon += tile_size_lon
+
+            current_lat += tile_size_lat
+
+        return tiles
+
+    @staticmethod
+    def _reduce_tile_histogram(image: ee.Image, tile: ee.Geometry, scale: int) -> Optional[Dict]:
+        """Reduce one tile; None signals an empty or failed tile.
+
+        No client-side area probe: sliver tiles simply reduce to an empty
+        histogram, whereas checking tile.area() first doubled the round
+        trips for every tile.
+        """
+        try:
+            # Use lower maxPixels and bestEffort for individual tiles
+            histogram_dict = image.reduceRegion(
+                reducer=ee.Reducer.frequencyHistogram(),
+                geometry=tile,
+                scale=scale,
+                maxPixels=1e9,  # Lower for individual tiles
+                bestEffort=True,
+                tileScale=2  # Use tileScale for better performance
+            ).getInfo()
+
+            if histogram_dict and histogram_dict.get('label'):
+                return histogram_dict['label']
+            return None
+        except Exception:
+            return None
     
+    @staticmethod
+    def _axis_aligned_bounds(polygon: ee.Geometry) -> Optional[List[float]]:
+        """[min_lon, min_lat, max_lon, max_lat] when the polygon is a
+        client-side axis-aligned rectangle, else None.
+
+        Reducing over a polygon makes EE run a point-in-polygon test per
+        pixel; for the bbox-derived AOI rectangles this codebase builds,
+        passing the rectangle itself lets the server clip by bounds alone.
+        toGeoJSON only resolves for geometries constructed from coordinates
+        on the client — which is exactly the rectangle case — so computed
+        geometries fall through to the polygon path untouched.
+        """
+        try:
+            geojson = polygon.toGeoJSON()
+        except Exception:
+            return None
+        if geojson.get('type') != 'Polygon':
+            return None
+        rings = geojson.get('coordinates') or []
+        if len(rings) != 1 or len(rings[0]) != 5:
+            return None
+        ring = rings[0]
+        if ring[0] != ring[4]:
+            return None
+        for start, end in zip(ring[:4], ring[1:5]):
+            if start[0] != end[0] and start[1] != end[1]:
+                return None  # Diagonal edge — not axis-aligned
+        lons = [point[0] for point in ring[:4]]
+        lats = [point[1] for point in ring[:4]]
+        return [min(lons), min(lats), max(lons), max(lats)]
+
+    def _reduce_geometry_for(self, polygon: ee.Geometry) -> ee.Geometry:
+        """The cheapest geometry equivalent to polygon for reductions."""
+        rect_bounds = self._axis_aligned_bounds(polygon)
+        if rect_bounds is not None:
+            return ee.Geometry.Rectangle(rect_bounds, proj='EPSG:4326', geodesic=False)
+        return polygon
+
+    @staticmethod
+    def _result_cache_key(image: ee.Image, polygon: ee.Geometry, scale: int) -> str:
+        """Stable key for a reduction over (image, polygon, scale).
+
+        serialize() renders the client-side expression graph — including the
+        collection filters and date range the composite was built from —
+        without any server round trip, so identical requests hash identically
+        and any change to the inputs changes the key.
+        """
+        payload = f"{image.serialize()}|{polygon.serialize()}|{scale}"
+        return 'eereduce:' + hashlib.sha256(payload.encode()).hexdigest()
+
+    def _result_cache_get(self, key: str):
+        """Read a cached reduction result (None on miss or error)"""
+        if self._disk_cache is not None:
+            try:
+                return self._disk_cache.get(key)
+            except Exception:
+                return None
+        return None
+
+    def _result_cache_set(self, key: str, value):
+        """Persist a reduction result for RESULT_CACHE_TTL"""
+        if self._disk_cache is not None:
+            try:
+                self._disk_cache.set(key, value, expire=self.RESULT_CACHE_TTL)
+            except Exception:
+                pass
+
     def count_pixels_by_class(self, image: ee.Image, polygon: ee.Geometry, bbox: BoundingBox, scale: int = 30) -> Dict[int, int]:
         """
-        Count pixels per land cover class using tiled reduceRegion approach
-        
-        Always uses 2km × 2km tiles to prevent Earth Engine timeouts.
-        Uses scale=30 for 9x faster processing while maintaining accuracy.
-        
+        Count pixels per land cover class, tiling only when EE pushes back
+
+        Tries a direct whole-AOI reduceRegion first — with tileScale=16 and
+        bestEffort EE satisfies small and medium AOIs in one round trip.
+        The 2km tiled path remains the fallback for the large geometries
+        that genuinely hit server limits.
+
         Args:
             image: Earth Engine image with 'label' band
             polygon: Earth Engine polygon geometry (city boundary, preprocessed)
             bbox: Bounding box for area calculation
             scale: Resolution in meters (default 30m - 9x faster than 10m)
-            
+
         Returns:
             Dictionary mapping class labels to pixel counts
         """
-        # Always use tiled approach with 2km × 2km tiles
-        # This prevents timeouts and is more reliable
-        return self._count_pixels_tiled_2km(image, polygon, bbox, scale)
+        cache_key = self._result_cache_key(image, polygon, scale)
+        cached = self._result_cache_get(cache_key)
+        if cached is not None:
+            print("Pixel counts served from result cache")
+            return cached
+
+        image = self._coarsen_labels(image, scale)
+
+        pixel_counts = self._direct_count_attempt(image, polygon, scale)
+        if not pixel_counts:
+            pixel_counts = self._count_pixels_tiled_2km(image, polygon, bbox, scale)
+
+        self._result_cache_set(cache_key, pixel_counts)
+        return pixel_counts
+
+    @staticmethod
+    def _coarsen_labels(image: ee.Image, scale: int) -> ee.Image:
+        """Aggregate the 10m label raster to the reduction scale up front.
+
+        Passing scale=30 to reduceRegion still makes EE read every native
+        10m pixel and aggregate on the fly, per reduction. reduceResolution
+        with a mode reducer materializes the coarse raster once, so every
+        subsequent scan touches ~9x fewer pixels.
+
+        The label image is a median() composite, and composites lose their
+        source projection (EE substitutes the default WGS84 1° one), so the
+        native 10m grid must be declared via setDefaultProjection before
+        reduceResolution has anything meaningful to aggregate.
+        """
+        if scale <= 10:
+            return image
+        return (image
+                .setDefaultProjection(crs='EPSG:4326', scale=10)
+                .reduceResolution(ee.Reducer.mode(), maxPixels=256)
+                .reproject(crs='EPSG:4326', scale=scale))
+
+    async def count_pixels_by_class_async(self, image: ee.Image, polygon: ee.Geometry,
+                                          bbox: BoundingBox, scale: int = 30) -> Dict[int, int]:
+        """
+        Async counterpart of count_pixels_by_class for event-loop callers
+
+        The direct attempt and the batched tile reduction are each a single
+        blocking round trip, so they just move to a worker thread; only the
+        per-tile fallback genuinely fans out, and it runs through
+        _count_pixels_tiled_async so its concurrency is governed by the
+        event loop rather than a private thread pool.
+        """
+        cache_key = self._result_cache_key(image, polygon, scale)
+        cached = self._result_cache_get(cache_key)
+        if cached is not None:
+            print("Pixel counts served from result cache")
+            return cached
+
+        image = self._coarsen_labels(image, scale)
+
+        pixel_counts = await asyncio.to_thread(
+            self._direct_count_attempt, image, polygon, scale)
+        if not pixel_counts:
+            tile_histograms = await asyncio.to_thread(
+                self._batched_tile_histograms, image, polygon, bbox, scale)
+            if tile_histograms is None:
+                pixel_counts = await self._count_pixels_tiled_async(image, polygon, bbox, scale)
+            else:
+                pixel_counts = self._finish_tile_merge(tile_histograms)
+
+        self._result_cache_set(cache_key, pixel_counts)
+        return pixel_counts
+
+    def _direct_count_attempt(self, image: ee.Image, polygon: ee.Geometry, scale: int) -> Dict[int, int]:
+        """Whole-AOI count per class in one request; {} means fall back to tiling.
+
+        Grouping on the label band lets EE count every class in a single
+        masked-scan pass and return integer counts directly, instead of the
+        frequencyHistogram's string-keyed float dict that needed reparsing
+        client-side.
+        """
+        try:
+            stats = image.addBands(ee.Image.constant(1)).reduceRegion(
+                reducer=ee.Reducer.count().group(groupField=0, groupName='class'),
+                geometry=self._reduce_geometry_for(polygon),
+                scale=scale,
+                maxPixels=1e13,
+                bestEffort=True,
+                tileScale=16  # Trades server memory for completing in one request
+            ).getInfo()
+        except ee.EEException:
+            return {}  # Computation too large — caller subdivides
+
+        pixel_counts = {}
+        for group in (stats or {}).get('groups', []):
+            class_id = int(group['class'])
+            count = int(group['count'])
+            # Valid Dynamic World labels only; -1 marks masked pixels
+            if 0 <= class_id <= 7 and count > 0:
+                pixel_counts[class_id] = count
+        return pixel_counts
     
     def _count_pixels_tiled_2km(self, image: ee.Image, geometry: ee.Geometry, bbox: BoundingBox, scale: int) -> Dict[int, int]:
         """
         Count pixels by subdividing into 2km × 2km tiles and merging results
-        
+
+        All tiles are reduced in one server-side pass via reduceRegions, so
+        the whole grid costs a single round trip instead of one per tile —
+        the old per-tile loop was latency-bound, not compute-bound.
+
         Args:
             image: Earth Engine image with 'label' band
             geometry: Earth Engine polygon geometry (city boundary)
             bbox: Bounding box for area calculation
             scale: Resolution in meters (30m recommended)
-            
+
         Returns:
             Dictionary mapping class labels to pixel counts
         """
-        # Create 2km × 2km grid tiles
-        tiles = self._create_2km_tiles(geometry, bbox)
-        
-        if not tiles:
-            raise RuntimeError("Failed to create tiles from city geometry")
-        
-        # Validate that we have tiles
-        if len(tiles) == 0:
-            raise RuntimeError("No tiles created from city geometry")
-        
-        # For very small cities, 1 tile is acceptable - continue processing
-        # The tile processing will handle empty/failed tiles gracefully
-        
-        # Process each tile
-        tile_histograms = []
-        successful_tiles = 0
-        failed_tiles = 0
-        skipped_tiles = 0
-        
-        for i, tile in enumerate(tiles):
-            try:
-                # Check if tile has any area (intersection with city boundary)
-                tile_area = tile.area().getInfo()
-                if tile_area < 1e-6:  # Skip very small tiles (< 1 square meter)
-                    skipped_tiles += 1
-                    continue
-                
-                # Clip dw.select("label") to tile
-                tile_image = image.clip(tile)
-                
-                # Run reduceRegion with frequencyHistogram on this tile
-                tile_histogram = tile_image.reduceRegion(
-                    reducer=ee.Reducer.frequencyHistogram(),
-                    geometry=tile,
-                    scale=scale,
-                    maxPixels=1e8,
-                    bestEffort=True,
-                    tileScale=2  # Lower tileScale for individual tiles
-                )
-                
-                tile_hist_dict = tile_histogram.getInfo()
-                
-                # If tile returns empty, skip it (do not fail the whole job)
-                if tile_hist_dict and 'label' in tile_hist_dict and tile_hist_dict['label']:
-                    if len(tile_hist_dict['label']) > 0:  # Ensure histogram is not empty
-                        tile_histograms.append(tile_hist_dict)
-                        successful_tiles += 1
-                    else:
-                        failed_tiles += 1  # Empty histogram, skip
-                else:
-                    failed_tiles += 1  # No data, skip
-                    
-            except Exception as e:
-                # Skip tiles that fail, continue with others
-                failed_tiles += 1
-                continue
-        
-        # If any tile returns empty, skip it (already done above)
-        # Only fail if ALL tiles are empty
-        if not tile_histograms:
-            raise RuntimeError(
-                f"Failed to get pixel counts from any tiles. "
-                f"Total tiles created: {len(tiles)}, "
-                f"Successful: {successful_tiles}, "
-                f"Failed/empty: {failed_tiles}, "
-                f"Skipped (too small): {skipped_tiles}. "
-                f"Dynamic World may not have data coverage for this location, "
-                f"or the city boundary geometry may be invalid."
+        tile_histograms = self._batched_tile_histograms(image, geometry, bbox, scale)
+        if tile_histograms is None:
+            # Per-tile fallback: slower but each tile fails independently
+            return self._count_pixels_tiled(image, geometry, bbox, scale)
+
+        return self._finish_tile_merge(tile_histograms)
+
+    def _batched_tile_histograms(self, image: ee.Image, geometry: ee.Geometry,
+                                 bbox: BoundingBox, scale: int) -> Optional[List[Dict]]:
+        """Reduce every tile in one reduceRegions graph; None on failure."""
+        tiles_fc = self._create_2km_tiles(geometry, bbox)
+
+        try:
+            # One deferred graph covers every tile; aggregate_array pulls just
+            # the histogram dicts back, not the per-tile geometries
+            histograms_fc = image.reduceRegions(
+                collection=tiles_fc,
+                reducer=ee.Reducer.frequencyHistogram(),
+                scale=scale,
+                tileScale=4
             )
-        
-        # Merge all tile histograms
-        merged_counts = self._merge_histograms(tile_histograms)
-        
+            return histograms_fc.aggregate_array('histogram').getInfo()
+        except Exception as e:
+            print(f"Warning: batched tile reduction failed ({e}), falling back to per-tile requests")
+            return None
+
+    def _finish_tile_merge(self, tile_histograms: List[Dict]) -> Dict[int, int]:
+        """Merge batched tile histograms, failing loudly if nothing remains."""
+        # Merge all tile histograms (empty tiles contribute nothing)
+        merged_counts = self._merge_histograms(
+            [{'label': hist} for hist in tile_histograms if hist])
+
         if not merged_counts:
             raise RuntimeError(
                 "Merged histogram is empty. "
                 "Dynamic World may not have valid classification data for this location."
             )
-        
+
         return merged_counts
     
     def get_sentinel2_sr_composite(self, polygon: ee.Geometry, bbox: BoundingBox,
@@ -1802,18 +2645,22 @@ class EarthEngineService:
         # Sort by date (most recent first)
         collection = collection.sort('system:time_start', False)
         
-        # Check if collection has images
-        collection_size = collection.size().getInfo()
-        if collection_size == 0:
+        # One getInfo for the size check and the reference date — probing
+        # the first image separately cost an extra round-trip
+        info = ee.Dictionary({
+            'size': collection.size(),
+            'latest': collection.aggregate_max('system:time_start')
+        }).getInfo()
+
+        if info['size'] == 0:
             raise RuntimeError(
                 f"No Sentinel-2 images found for the specified area and date range "
                 f"({start_date_str} to {end_date_str}) with cloud cover < {cloud_cover_threshold}%"
             )
-        
-        # Get the most recent image for date reference
-        latest_image = collection.first()
+
+        # Most recent image date for reference
         try:
-            date_info = latest_image.get('system:time_start').getInfo()
+            date_info = info.get('latest')
             if date_info:
                 date_obj = datetime.fromtimestamp(date_info / 1000)
                 date_string = date_obj.strftime('%Y-%m-%d')
@@ -1918,64 +2765,25 @@ class EarthEngineService:
         Returns:
             Image with 'landcover' band (0=Water, 1=Forest, 2=Urban, 3=Vegetation)
         """
-        # Extract spectral indices (NDBI not needed - urban is catch-all)
-        ndvi = image.select('NDVI')
-        mndwi = image.select('MNDWI')
-        
-        # STEP 2 — RELIABLE MASKS FIRST
-        # These are globally reliable and must be extracted first
-        
-        # Water: MNDWI > 0.2 (globally reliable water detection)
-        water_mask = mndwi.gt(0.2)
-        
-        # Forest: NDVI > 0.6 (dense forest, rare in cities)
-        # Stricter than typical (0.5) because in Indian cities, NDVI > 0.5 often
-        # includes parks, trees, and crop patches which are NOT forests
-        forest_mask = ndvi.gt(0.6).And(mndwi.lte(0.2))  # Exclude water
-        
-        # Vegetation: 0.25 <= NDVI <= 0.6 (all vegetation including sparse)
-        # This captures parks, agricultural areas, sparse vegetation, mixed vegetation
-        # Intentionally broad to ensure urban doesn't absorb vegetation
-        vegetation_mask = ndvi.gte(0.25).And(ndvi.lte(0.6)).And(mndwi.lte(0.2))  # Exclude water
-        
-        # Dense Forest: NDVI > 0.6 (rare in cities)
-        # Stricter than typical (0.5) because in Indian cities, NDVI > 0.5 often
-        # includes parks, trees, and crop patches which are NOT forests
-        forest_mask = ndvi.gt(0.6).And(mndwi.lte(0.2))  # Exclude water
-        
-        # STEP 3 — URBAN FALLBACK (CRITICAL)
-        # Urban must be defined as: Any pixel that is NOT water AND NOT forest AND NOT vegetation
-        # This is intentional. This is required. This must NOT use NDBI.
-        # Urban = NOT (Water OR Forest OR Vegetation)
-        urban_mask = (
-            water_mask.Not()           # NOT water
-            .And(forest_mask.Not())     # NOT forest
-            .And(vegetation_mask.Not())  # NOT vegetation
-        )
-        
-        # STEP 5 — CLASS PRIORITY (MANDATORY)
-        # Start with NO CLASS (-1) instead of 0 (Water)
-        # This prevents all pixels from defaulting to Water class
-        landcover = ee.Image(-1)
-        
-        # Apply classes in priority order: Water > Forest > Vegetation > Urban (fallback)
-        # CRITICAL: Urban is applied LAST as the fallback, ensuring it absorbs all remaining pixels
-        # .where() updates pixels where mask is true. Since we start with -1, all masks will apply.
-        # Later applications will overwrite earlier ones, but urban is applied last so it catches
-        # everything that wasn't classified by the reliable classes.
-        landcover = landcover.where(water_mask, 0)      # Water = 0 (highest priority)
-        landcover = landcover.where(forest_mask, 1)     # Forest = 1
-        landcover = landcover.where(vegetation_mask, 3) # Vegetation = 3
-        landcover = landcover.where(urban_mask, 2)      # Urban = 2 (fallback, applied LAST)
-        
-        # CRITICAL: Ensure NO pixel remains unclassified
-        # After assignment, NO pixel should remain with value -1
-        # Mask ONLY -1 pixels if any appear (they should not, but safety check)
-        landcover = landcover.updateMask(landcover.neq(-1))
-        
+        # Single fused expression: the conditional ladder encodes the same
+        # priority order (Water > Forest > Vegetation > Urban fallback) the
+        # old four-.where() chain applied, but emits the class in one kernel
+        # pass instead of rewriting the raster four times. Every pixel
+        # matches exactly one rung — urban is the terminal else — so no
+        # pixel can come out unclassified and no -1 sentinel/mask is needed.
+        landcover = image.expression(
+            "(mndwi > 0.2) ? 0 :"       # Water (globally reliable)
+            "(ndvi > 0.6) ? 1 :"        # Forest (dense only; parks score lower)
+            "(ndvi >= 0.25) ? 3 : 2",   # Vegetation, else Urban (catch-all)
+            {
+                'mndwi': image.select('MNDWI'),
+                'ndvi': image.select('NDVI')
+            }
+        ).rename('landcover')
+
         # Add as band
-        classified = image.addBands(landcover.rename('landcover'))
-        
+        classified = image.addBands(landcover)
+
         return classified
     
     def calculate_area_by_class_pixelarea(self, image: ee.Image, polygon: ee.Geometry, 
@@ -1996,130 +2804,269 @@ class EarthEngineService:
         Returns:
             Dictionary mapping class labels to area in square meters
         """
-        # Select landcover band
-        landcover = image.select('landcover')
-        
-        # Create area image (area per pixel at specified scale)
-        area_image = ee.Image.pixelArea()  # Area in square meters
-        
-        # Calculate area per class by masking area image for each class
-        area_dict = {}
-        
-        # Classes: 0=Water, 1=Forest, 2=Urban, 3=Vegetation (NO bare land - class 4 removed)
-        for class_id in range(4):  # Only 4 classes now
-            try:
-                # Mask area image to only this class
-                class_mask = landcover.eq(class_id)
-                class_area_image = area_image.updateMask(class_mask)
-                
-                # Sum area for this class
-                area_sum = class_area_image.reduceRegion(
-                    reducer=ee.Reducer.sum(),
-                    geometry=polygon,
-                    scale=scale,
-                    maxPixels=1e13,
-                    bestEffort=True
-                )
-                
-                area_value = area_sum.getInfo().get('constant', 0)
-                if area_value > 0:
-                    area_dict[class_id] = float(area_value)
-            except Exception:
-                # Skip this class if calculation fails
-                continue
-        
-        # If no areas calculated, try tiled approach
-        if not area_dict:
-            return self._calculate_area_tiled(image, polygon, scale)
-        
-        return area_dict
-    
+        cache_key = self._result_cache_key(image, polygon, scale)
+        cached = self._result_cache_get(cache_key)
+        if cached is not None:
+            print("Class areas served from result cache")
+            return cached
+
+        # Small AOIs: fetch the raster once and bin classes locally instead
+        # of reducing server-side
+        local_areas = self._calculate_area_local(image, polygon, scale)
+        if local_areas:
+            self._result_cache_set(cache_key, local_areas)
+            return local_areas
+
+        # Select landcover band
+        landcover = image.select('landcover')
+
+        # Grouped reduction: one tile-scan pass sums pixelArea per class
+        # server-side, returned in a single round trip — the per-class loop
+        # cost 4 round trips and scanned the image 4 times
+        # Classes: 0=Water, 1=Forest, 2=Urban, 3=Vegetation (NO bare land - class 4 removed)
+        area_dict = {}
+        try:
+            stats = ee.Image.pixelArea().addBands(landcover).reduceRegion(
+                reducer=ee.Reducer.sum().group(groupField=1, groupName='class'),
+                geometry=self._reduce_geometry_for(polygon),
+                scale=scale,
+                maxPixels=1e13,
+                bestEffort=True,
+                tileScale=4
+            ).getInfo()
+
+            for group in stats.get('groups', []):
+                class_id = int(group['class'])
+                area_value = float(group['sum'])
+                if 0 <= class_id <= 3 and area_value > 0:
+                    area_dict[class_id] = area_value
+        except Exception:
+            area_dict = {}
+
+        # If no areas calculated, try tiled approach
+        if not area_dict:
+            area_dict = self._calculate_area_tiled(image, polygon, scale)
+
+        self._result_cache_set(cache_key, area_dict)
+        return area_dict
+    
+    # Cap for the in-memory geometry caches (bounds and tile grids); the
+    # entries are small, this only guards long-lived processes against
+    # unbounded growth
+    _GEOM_CACHE_MAX = 256
+
+    def _polygon_bounds(self, polygon: ee.Geometry) -> BoundingBox:
+        """Fetch a polygon's bounds once; repeat calls hit the memo.
+
+        Keyed by a content hash of the serialized geometry: id()-based
+        keys alias once an old polygon is garbage-collected and its
+        address reused, which would silently return the wrong bbox.
+        """
+        key = hashlib.sha256(polygon.serialize().encode()).hexdigest()
+        cached = self._bounds_cache.get(key)
+        if cached is not None:
+            return cached
+        try:
+            bounds = polygon.bounds().getInfo()['coordinates'][0]
+            bbox = BoundingBox(
+                min_lon=bounds[0][0],
+                min_lat=bounds[0][1],
+                max_lon=bounds[2][0],
+                max_lat=bounds[2][1]
+            )
+        except Exception as e:
+            raise RuntimeError(f"Failed to get polygon bounds: {str(e)}")
+        if len(self._bounds_cache) >= self._GEOM_CACHE_MAX:
+            # Drop the oldest entry (dicts preserve insertion order)
+            self._bounds_cache.pop(next(iter(self._bounds_cache)))
+        self._bounds_cache[key] = bbox
+        return bbox
+
+    # AOIs below this footprint (km²) are cheaper to pull client-side than
+    # to reduce server-side: one small NPY download replaces the EE
+    # reduction round trips entirely
+    _LOCAL_AREA_THRESHOLD_KM2 = 100.0
+
+    def _fetch_band_array(self, image: ee.Image, band: str, polygon: ee.Geometry,
+                          scale: int) -> Optional[np.ndarray]:
+        """Download one band over the AOI as a local int64 array.
+
+        Only attempted for AOIs under _LOCAL_AREA_THRESHOLD_KM2 — beyond
+        that the download outweighs the server-side reduction it replaces.
+        None on any failure or an oversized AOI.
+
+        Masked pixels are unmasked to -1 before download: the NPY fill
+        value would otherwise be 0, indistinguishable from class 0, while
+        the server-side reductions this replaces skip masked pixels.
+        """
+        try:
+            bbox = self._polygon_bounds(polygon)
+            avg_lat = (bbox.min_lat + bbox.max_lat) / 2
+            lat_km = (bbox.max_lat - bbox.min_lat) * 111.0
+            lon_km = ((bbox.max_lon - bbox.min_lon) * 111.0 *
+                      abs(math.cos(math.radians(avg_lat))))
+            if lat_km * lon_km > self._LOCAL_AREA_THRESHOLD_KM2:
+                return None
+
+            url = image.select(band).unmask(-1).getDownloadURL({
+                'region': polygon,
+                'scale': scale,
+                'format': 'NPY'
+            })
+            response = HTTP_SESSION.get(url, timeout=60)
+            if response.status_code != 200:
+                return None
+
+            arr = np.load(io.BytesIO(response.content))
+            return (arr[band] if arr.dtype.names else arr).astype(np.int64)
+        except Exception as e:
+            print(f"Warning: {band} band download failed ({e})")
+            return None
+
+    def get_label_raster(self, image: ee.Image, polygon: ee.Geometry,
+                         scale: int = 30) -> Optional[np.ndarray]:
+        """Dynamic World label band as a local 2D array for small AOIs.
+
+        Feeds the classifier's connected-components forest patch rule;
+        None (oversized AOI, rasterio missing, or failed download) means
+        callers keep the pixel-count proxy.
+
+        The NPY download covers the polygon's bounding rectangle, so
+        outside-polygon pixels are overwritten with -1 — without that,
+        patch counts would cover the whole bbox while the reducer's pixel
+        counts are polygon-clipped, and the two could disagree.
+        """
+        try:
+            from rasterio import features as rasterio_features
+            from rasterio.transform import from_bounds
+        except ImportError:
+            return None
+
+        labels = self._fetch_band_array(image, 'label', polygon, scale)
+        if labels is None:
+            return None
+
+        try:
+            bbox = self._polygon_bounds(polygon)
+            transform = from_bounds(bbox.min_lon, bbox.min_lat,
+                                    bbox.max_lon, bbox.max_lat,
+                                    labels.shape[1], labels.shape[0])
+            mask = rasterio_features.rasterize(
+                [(polygon.getInfo(), 1)],
+                out_shape=labels.shape,
+                transform=transform
+            ).astype(bool)
+            labels[~mask] = -1
+            return labels
+        except Exception as e:
+            print(f"Warning: label raster masking failed ({e})")
+            return None
+
+    def _calculate_area_local(self, image: ee.Image, polygon: ee.Geometry,
+                              scale: int) -> Optional[Dict[int, float]]:
+        """Local zonal stats for small AOIs; None means use the server path.
+
+        Downloads the landcover band as an NPY array, rasterizes the
+        polygon to a boolean mask at the same transform, and bins classes
+        with np.bincount — a C-level pass over a ~100 kB array instead of
+        a server-side reduction. Any failure (rasterio missing, download
+        error, oversized AOI) falls back silently.
+        """
+        try:
+            from rasterio import features as rasterio_features
+            from rasterio.transform import from_bounds
+        except ImportError:
+            return None
+
+        labels = self._fetch_band_array(image, 'landcover', polygon, scale)
+        if labels is None:
+            return None
+
+        try:
+            bbox = self._polygon_bounds(polygon)
+            transform = from_bounds(bbox.min_lon, bbox.min_lat,
+                                    bbox.max_lon, bbox.max_lat,
+                                    labels.shape[1], labels.shape[0])
+            mask = rasterio_features.rasterize(
+                [(polygon.getInfo(), 1)],
+                out_shape=labels.shape,
+                transform=transform
+            ).astype(bool)
+
+            valid = mask & (labels >= 0) & (labels <= 3)
+            counts = np.bincount(labels[valid].ravel(), minlength=4)
+            # Planar pixel area is fine at this footprint — the curvature
+            # error over <100 km² is far below classification noise
+            return {
+                class_id: float(counts[class_id] * scale * scale)
+                for class_id in range(4) if counts[class_id] > 0
+            }
+        except Exception as e:
+            print(f"Warning: local area calculation failed ({e}), using Earth Engine reduction")
+            return None
+
     def _calculate_area_tiled(self, image: ee.Image, polygon: ee.Geometry, scale: int) -> Dict[int, float]:
         """
         Calculate area by class using tiled approach (fallback for large areas)
-        
+
         Args:
             image: Earth Engine image with 'landcover' band
             polygon: Earth Engine polygon geometry
             scale: Resolution in meters
-        
+
         Returns:
             Dictionary mapping class labels to area in square meters
         """
-        # Get bounding box
-        try:
-            bounds = polygon.bounds().getInfo()['coordinates'][0]
-            min_lon, min_lat = bounds[0]
-            max_lon, max_lat = bounds[2]
-        except Exception as e:
-            raise RuntimeError(f"Failed to get polygon bounds: {str(e)}")
-        
-        # Create 2km × 2km tiles
-        avg_lat = (min_lat + max_lat) / 2
-        lat_degree_to_km = 111.0
-        lon_degree_to_km = 111.0 * abs(np.cos(np.radians(avg_lat)))
-        
-        tile_size_lat = 2.0 / lat_degree_to_km
-        tile_size_lon = 2.0 / lon_degree_to_km
-        
+        bbox = self._polygon_bounds(polygon)
+
         landcover = image.select('landcover')
-        area_image = ee.Image.pixelArea()
-        
-        all_areas = {}
-        current_lat = min_lat
-        
-        while current_lat < max_lat:
-            current_lon = min_lon
-            while current_lon < max_lon:
-                try:
-                    tile_bbox = ee.Geometry.Rectangle([
-                        current_lon,
-                        current_lat,
-                        min(current_lon + tile_size_lon, max_lon),
-                        min(current_lat + tile_size_lat, max_lat)
-                    ])
-                    
-                    tile = polygon.intersection(tile_bbox)
-                    
-                    # Check tile area
-                    try:
-                        tile_area = tile.area().getInfo()
-                        if tile_area < 1e-6:
-                            current_lon += tile_size_lon
-                            continue
-                    except:
-                        pass
-                    
-                    # Calculate area per class for this tile
-                    # Only 4 classes now: 0=Water, 1=Forest, 2=Urban, 3=Vegetation (NO bare land)
-                    for class_id in range(4):
-                        try:
-                            class_mask = landcover.eq(class_id)
-                            class_area_image = area_image.updateMask(class_mask)
-                            
-                            area_sum = class_area_image.reduceRegion(
-                                reducer=ee.Reducer.sum(),
-                                geometry=tile,
-                                scale=scale,
-                                maxPixels=1e9,
-                                bestEffort=True,
-                                tileScale=2
-                            )
-                            
-                            area_value = area_sum.getInfo().get('constant', 0)
-                            if area_value > 0:
-                                all_areas[class_id] = all_areas.get(class_id, 0) + float(area_value)
-                        except Exception:
-                            continue  # Skip this class for this tile
-                
-                except Exception:
-                    pass  # Skip failed tiles
-                
-                current_lon += tile_size_lon
-            
-            current_lat += tile_size_lat
-        
-        return all_areas
+
+        # Same grouped reducer as the whole-AOI path: pixelArea + landcover
+        # reduce in a single pass per tile, partitioned by class server-side,
+        # instead of scanning four separately masked area bands
+        # Only 4 classes now: 0=Water, 1=Forest, 2=Urban, 3=Vegetation (NO bare land)
+        area_per_class_image = ee.Image.pixelArea().addBands(landcover)
+
+        tiles = self._build_fallback_tiles(polygon, bbox)
+
+        def _reduce_one(tile: ee.Geometry) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+            try:
+                # No area probe: sliver tiles just sum to ~0, whereas
+                # checking tile.area() first cost an extra round trip
+                stats = area_per_class_image.reduceRegion(
+                    reducer=ee.Reducer.sum().group(groupField=1, groupName='class'),
+                    geometry=tile,
+                    scale=scale,
+                    maxPixels=1e9,
+                    bestEffort=True,
+                    tileScale=2
+                ).getInfo()
+            except Exception:
+                return None  # Skip failed tiles
+
+            groups = (stats or {}).get('groups', [])
+            if not groups:
+                return None
+            class_ids = np.fromiter((g['class'] for g in groups),
+                                    dtype=np.int64, count=len(groups))
+            sums = np.fromiter((g['sum'] for g in groups),
+                               dtype=np.float64, count=len(groups))
+            keep = (class_ids >= 0) & (class_ids <= 3) & (sums > 0)
+            return class_ids[keep], sums[keep]
+
+        # Per-tile requests are pure I/O wait — same 32-worker overlap as the
+        # pixel-count fallback, sitting under the high-volume endpoint's
+        # ~40 concurrent-request limit. Results accumulate into a fixed
+        # float64 vector in the main thread, so the merge stays lock-free
+        # and allocates no per-tile dicts
+        areas = np.zeros(4, dtype=np.float64)
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            for result in executor.map(_reduce_one, tiles):
+                if result is not None:
+                    np.add.at(areas, result[0], result[1])
+
+        return {class_id: float(areas[class_id])
+                for class_id in range(4) if areas[class_id] > 0}
 
 
 class SpectralIndexClassifier:
@@ -2266,44 +3213,38 @@ class LandCoverClassifier:
         8: 'Snow & ice'
     }
     
+    @staticmethod
+    def _np_default(value):
+        """orjson fallback for the numpy scalars OPT_SERIALIZE_NUMPY misses"""
+        if isinstance(value, np.bool_):
+            return bool(value)
+        if isinstance(value, (np.integer, np.floating)):
+            return float(value)
+        raise TypeError(f"Metadata value of type {type(value)} is not JSON serializable")
+
+    @staticmethod
+    def _serialize_metadata_bytes(metadata: Dict) -> bytes:
+        """
+        Serialize metadata straight to JSON bytes.
+
+        orjson walks the nested structure and converts numpy types in C —
+        the old recursive Python walk did an isinstance ladder per value.
+        Callers that put the result on the wire should use these bytes
+        directly instead of re-encoding.
+        """
+        return orjson.dumps(metadata,
+                            default=LandCoverClassifier._np_default,
+                            option=orjson.OPT_SERIALIZE_NUMPY)
+
     @staticmethod
     def _serialize_metadata(metadata: Dict) -> Dict:
         """
-        Recursively convert metadata to JSON-serializable format.
-        Converts numpy types, numpy booleans, and other non-serializable types to native Python types.
-        """
-        if not isinstance(metadata, dict):
-            if isinstance(metadata, (np.integer, np.floating)):
-                return float(metadata)
-            elif isinstance(metadata, np.bool_):
-                return bool(metadata)
-            return metadata
-        
-        serialized = {}
-        for key, value in metadata.items():
-            if isinstance(value, (np.integer, np.floating)):
-                serialized[key] = float(value)
-            elif isinstance(value, np.bool_):
-                serialized[key] = bool(value)
-            elif isinstance(value, bool):
-                serialized[key] = bool(value)  # Ensure native Python bool
-            elif isinstance(value, (int, float)):
-                serialized[key] = value  # Native types are fine
-            elif isinstance(value, dict):
-                serialized[key] = LandCoverClassifier._serialize_metadata(value)
-            elif isinstance(value, list):
-                serialized[key] = [
-                    LandCoverClassifier._serialize_metadata(item) if isinstance(item, dict) else (
-                        bool(item) if isinstance(item, np.bool_) else (
-                            float(item) if isinstance(item, (np.integer, np.floating)) else item
-                        )
-                    )
-                    for item in value
-                ]
-            else:
-                serialized[key] = value
-        
-        return serialized
+        Convert metadata to a JSON-serializable dict of native Python types.
+
+        Round-trips through _serialize_metadata_bytes for legacy callers
+        that want a dict back rather than bytes.
+        """
+        return orjson.loads(LandCoverClassifier._serialize_metadata_bytes(metadata))
     
     @staticmethod
     def compute_urban_likelihood_score(pixel_counts: Dict[int, int], 
@@ -2395,10 +3336,105 @@ class LandCoverClassifier:
         
         return total_likelihood, score_breakdown
     
-    def aggregate_classes(self, pixel_counts: Dict[int, int], 
-                         osm_context: Dict = None, 
+    # 0.25 km² at 30 m pixels — the minimum contiguous patch for trees to
+    # count as forest
+    MIN_FOREST_PATCH_PX = 278
+
+    # Urban-green floor normalization thresholds (%): applies only to dense
+    # urban cores — urban >= URBAN_MIN, vegetation < VEG_MAX, no forest,
+    # water <= WATER_MAX — raising vegetation to VEG_FLOOR by at most
+    # MAX_DELTA while urban never drops below URBAN_FLOOR
+    _NORM_URBAN_MIN = 85.0
+    _NORM_VEG_MAX = 2.0
+    _NORM_WATER_MAX = 3.0
+    _NORM_VEG_FLOOR = 2.5
+    _NORM_MAX_DELTA = 3.0
+    _NORM_URBAN_FLOOR = 80.0
+
+    def aggregate_classes_batch(self, counts: np.ndarray,
+                                forest_counts: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized class aggregation for a batch of AOIs.
+
+        Applies the same strict mapping as aggregate_classes — forest
+        validity, the agricultural bare-ground rule, and the urban-green
+        floor normalization — as masked NumPy arithmetic over all rows at
+        once, so grid callers pay one array pass instead of N dict walks.
+
+        Args:
+            counts: (N, 9) array of pixel counts indexed by Dynamic World
+                    class id (column 8, snow/ice, is excluded from totals)
+            forest_counts: optional (N,) array of tree pixels confirmed to
+                    sit in contiguous patches >= MIN_FOREST_PATCH_PX;
+                    overrides the total-count forest proxy when provided
+
+        Returns:
+            Tuple of (raw_pct, normalized_pct, total_pixels) where the
+            percentage arrays have shape (N, 4) with columns
+            [urban, forest, vegetation, water]. Rows with zero valid
+            pixels come back all-zero; scalar callers guard for that.
+        """
+        counts = np.atleast_2d(np.asarray(counts, dtype=np.int64))
+
+        water = counts[:, 0]
+        trees = counts[:, 1]
+        grass = counts[:, 2]
+        crops = counts[:, 4]
+        shrub = counts[:, 5]
+        built_area = counts[:, 6]
+        bare_ground = counts[:, 7]
+
+        # Flooded vegetation counts toward the total (it dilutes the other
+        # classes) but maps to none of them; snow/ice is excluded outright
+        total_pixels = counts[:, :8].sum(axis=1)
+
+        # Forest: Trees (1) ONLY if patch area > 0.25 km². The pixel-count
+        # proxy applies unless the caller supplies real patch counts
+        if forest_counts is None:
+            forest_mask = trees * 0.0009 > 0.25
+            forest_count = np.where(forest_mask, trees, 0)
+        else:
+            # Clamp to the reducer's tree count: a supplied patch count can
+            # never legitimately exceed it, and letting it through would
+            # push base_vegetation negative
+            forest_count = np.minimum(
+                np.atleast_1d(np.asarray(forest_counts, dtype=np.int64)), trees)
+        base_vegetation = grass + crops + shrub + (trees - forest_count)
+
+        # Agricultural context: bare ground follows crops into vegetation
+        agricultural = crops > 0
+        vegetation_count = base_vegetation + np.where(agricultural, bare_ground, 0)
+        urban_count = built_area + np.where(agricultural, 0, bare_ground)
+
+        safe_total = np.maximum(total_pixels, 1).astype(np.float64)
+        raw_pct = (np.stack([urban_count, forest_count, vegetation_count, water], axis=1)
+                   / safe_total[:, None]) * 100.0
+
+        # Urban-green floor normalization. The mask is one vectorized pass
+        # over the four threshold conditions; redistribution touches only
+        # the selected rows, and the common all-False case returns without
+        # any further arithmetic
+        normalized_pct = raw_pct.copy()
+        norm_mask = ((raw_pct[:, 0] >= self._NORM_URBAN_MIN) &
+                     (raw_pct[:, 2] < self._NORM_VEG_MAX) &
+                     (raw_pct[:, 1] == 0.0) &
+                     (raw_pct[:, 3] <= self._NORM_WATER_MAX))
+        if norm_mask.any():
+            delta = np.minimum(
+                np.clip(self._NORM_VEG_FLOOR - raw_pct[norm_mask, 2],
+                        0.0, self._NORM_MAX_DELTA),
+                raw_pct[norm_mask, 0] - self._NORM_URBAN_FLOOR)
+            delta = np.maximum(delta, 0.0)
+            normalized_pct[norm_mask, 2] += delta
+            normalized_pct[norm_mask, 0] -= delta
+
+        return raw_pct, normalized_pct, total_pixels
+
+    def aggregate_classes(self, pixel_counts: Dict[int, int],
+                         osm_context: Dict = None,
                          image: ee.Image = None,
-                         polygon: ee.Geometry = None) -> Tuple[LandCoverResult, Dict]:
+                         polygon: ee.Geometry = None,
+                         landcover_array: np.ndarray = None) -> Tuple[LandCoverResult, Dict]:
         """
         Aggregate Dynamic World classes using STRICT, CITY-INVARIANT mapping.
         
@@ -2434,6 +3470,10 @@ class LandCoverClassifier:
             osm_context: Ignored - kept for compatibility only
             image: Optional Earth Engine image for forest patch analysis
             polygon: Optional Earth Engine geometry for forest patch analysis
+            landcover_array: Optional 2D label raster; when provided (and
+                numba is installed) the forest rule uses true
+                connected-components patch sizes instead of the
+                total-count proxy
             
         Returns:
             Tuple of (LandCoverResult, metadata_dict) with:
@@ -2442,110 +3482,70 @@ class LandCoverClassifier:
         """
         if not pixel_counts:
             raise ValueError("No pixel counts provided")
-        
-        # Calculate total pixels (excluding masked pixels with value -1 and snow/ice)
-        total_pixels = sum(v for k, v in pixel_counts.items() if k != -1 and k != 8)
-        
+
+        # Length-9 counts row indexed by class id; masked pixels (-1) drop out
+        counts = np.zeros(9, dtype=np.int64)
+        for class_id, count in pixel_counts.items():
+            if 0 <= class_id <= 8:
+                counts[class_id] = count
+
+        # True contiguity when a label raster is supplied and the JIT
+        # labeler is available; otherwise the pixel-count proxy below
+        forest_counts = None
+        if landcover_array is not None:
+            patch_mask = _valid_forest_mask(
+                np.asarray(landcover_array), self.MIN_FOREST_PATCH_PX)
+            if patch_mask is not None:
+                forest_counts = np.array([int(patch_mask.sum())], dtype=np.int64)
+
+        # The strict mapping and normalization live in the vectorized batch
+        # version; this single-AOI path is a one-row call into it
+        raw, normalized, totals = self.aggregate_classes_batch(counts, forest_counts)
+        total_pixels = int(totals[0])
+
         if total_pixels == 0:
             raise ValueError("No pixels found in the specified area. The location may have no data.")
-        
-        # Get raw counts per Dynamic World class
-        water = pixel_counts.get(0, 0)        # Water
-        trees = pixel_counts.get(1, 0)        # Trees
-        grass = pixel_counts.get(2, 0)       # Grass
-        flooded_veg = pixel_counts.get(3, 0) # Flooded vegetation (EXCLUDED)
-        crops = pixel_counts.get(4, 0)       # Crops
-        shrub = pixel_counts.get(5, 0)       # Shrub & scrub
-        built_area = pixel_counts.get(6, 0)  # Built area
-        bare_ground = pixel_counts.get(7, 0) # Bare ground
-        
-        # STRICT CLASS MAPPING
-        
+
+        # Raw counts per Dynamic World class (for metadata)
+        water = int(counts[0])        # Water
+        trees = int(counts[1])        # Trees
+        grass = int(counts[2])        # Grass
+        flooded_veg = int(counts[3])  # Flooded vegetation (EXCLUDED)
+        crops = int(counts[4])        # Crops
+        shrub = int(counts[5])        # Shrub & scrub
+        built_area = int(counts[6])   # Built area
+        bare_ground = int(counts[7])  # Bare ground
+
         # Forest: Trees (1) ONLY if contiguous patch area > 0.25 km²
         # At scale=30m, each pixel = 30m × 30m = 900 m² = 0.0009 km²
         tree_area_km2 = trees * 0.0009  # Approximate area in km²
-        
-        if tree_area_km2 > 0.25:
-            # Valid forest: Trees (1) only
-            forest_count = trees
-            # Remaining vegetation excludes trees
-            base_vegetation_count = grass + crops + shrub
-        else:
-            # Invalid forest: Classify trees as vegetation
-            forest_count = 0
-            base_vegetation_count = grass + crops + shrub + trees
-        
-        # AGRICULTURAL FIELDS HANDLING:
-        # Harvested/fallow fields are classified as Bare Ground (7) by Dynamic World
-        # If crops are present, count bare ground as vegetation (harvested fields)
-        # This ensures agricultural areas are correctly identified even when harvested
-        if crops > 0:
-            # Agricultural context: bare ground likely represents harvested fields
-            vegetation_count = base_vegetation_count + bare_ground
-            urban_count = built_area  # Only built area counts as urban
+
+        if forest_counts is not None:
+            # Same clamp the batch version applies
+            valid_forest_px = min(int(forest_counts[0]), trees)
         else:
-            # Non-agricultural context: bare ground counts as urban
-            vegetation_count = base_vegetation_count
-            urban_count = built_area + bare_ground
-        
-        # Calculate raw percentages (before normalization)
-        urban_pct_raw = (urban_count / total_pixels) * 100 if total_pixels > 0 else 0.0
-        forest_pct_raw = (forest_count / total_pixels) * 100 if total_pixels > 0 else 0.0
-        vegetation_pct_raw = (vegetation_count / total_pixels) * 100 if total_pixels > 0 else 0.0
-        water_pct_raw = (water / total_pixels) * 100 if total_pixels > 0 else 0.0
-        
-        # PRESENTATION-LEVEL NORMALIZATION: Urban-green floor for dense urban cores
-        # Only applies when vegetation is extremely low in dense urban contexts
-        # This is a presentation adjustment, NOT a pixel reclassification
-        
-        urban_pct = urban_pct_raw
-        forest_pct = forest_pct_raw
-        vegetation_pct = vegetation_pct_raw
-        water_pct = water_pct_raw
-        normalization_applied = False
-        normalization_reason = None
-        normalization_delta = 0.0
-        
-        # Normalization conditions: Dense urban core with extremely low vegetation
-        # ALL conditions must be met:
-        # - Urban percentage ≥ 85% (dense urban core)
-        # - Vegetation percentage < 2% (extremely low green)
-        # - Forest = 0% (no forest present)
-        # - Water ≤ 3% (minimal water)
-        if (urban_pct_raw >= 85.0 and 
-            vegetation_pct_raw < 2.0 and 
-            forest_pct_raw == 0.0 and 
-            water_pct_raw <= 3.0):
-            
-            # Calculate vegetation deficit to reach minimum floor
-            vegetation_floor = 2.5  # Minimum vegetation floor (%)
-            delta = vegetation_floor - vegetation_pct_raw
-            
-            # Apply hard bounds to prevent excessive redistribution
-            max_delta = 3.0  # Maximum vegetation added via normalization (%)
-            if delta > max_delta:
-                delta = max_delta
-            
-            # Ensure urban never drops below 80% (maintain urban character)
-            min_urban = 80.0
-            if urban_pct_raw - delta < min_urban:
-                delta = urban_pct_raw - min_urban
-            
-            # Apply symmetric redistribution only if delta is positive
-            if delta > 0:
-                vegetation_pct = vegetation_pct_raw + delta
-                urban_pct = urban_pct_raw - delta
-                normalization_applied = True
-                normalization_reason = "Urban-green floor normalization for dense urban core"
-                normalization_delta = delta
-        
+            valid_forest_px = trees if tree_area_km2 > 0.25 else 0
+
+        urban_pct_raw, forest_pct_raw, vegetation_pct_raw, water_pct_raw = (
+            float(v) for v in raw[0])
+        urban_pct, forest_pct, vegetation_pct, water_pct = (
+            float(v) for v in normalized[0])
+
+        normalization_delta = vegetation_pct - vegetation_pct_raw
+        normalization_applied = normalization_delta > 0
+        normalization_reason = (
+            "Urban-green floor normalization for dense urban core"
+            if normalization_applied else None)
+
+
         # Metadata: Raw and transparent
         metadata = {
             'year': '2024',
             'season': 'Jan-Mar',
             'total_pixels': total_pixels,
             'tree_area_km2': round(tree_area_km2, 4),
-            'forest_valid': tree_area_km2 > 0.25,
+            'forest_valid': valid_forest_px > 0,
+            'forest_patch_analysis': forest_counts is not None,
             'raw_class_counts': {
                 'water': water,
                 'trees': trees,
@@ -2560,7 +3560,7 @@ class LandCoverClassifier:
                 'grass': grass,
                 'crops': crops,
                 'shrub': shrub,
-                'trees_as_vegetation': trees if tree_area_km2 <= 0.25 else 0,
+                'trees_as_vegetation': trees - valid_forest_px,
                 'bare_ground_as_vegetation': bare_ground if crops > 0 else 0
             },
             'agricultural_context': crops > 0,
@@ -2594,10 +3594,17 @@ class LandCoverClassifier:
 
 class DisasterService:
     """Handle real-time natural disaster data from government and satellite feeds"""
-    
+
+    # USGS feeds change slowly, so repeat queries within 10 minutes are
+    # served from memory. Coordinates are quantized to 0.01° (~1 km) in the
+    # key so near-identical points share an entry. TTLCache is not
+    # thread-safe and get_earthquakes runs on thread pools, hence the lock.
+    _earthquake_cache = TTLCache(maxsize=1024, ttl=600)
+    _earthquake_cache_lock = threading.Lock()
+
     def __init__(self, openweather_key: str):
         self.openweather_key = openweather_key
-    
+
     def get_earthquakes(self, lat: float, lon: float, max_radius_km: int = 500, days: int = 7) -> List[Dict]:
         """
         Fetch live earthquake data from USGS
@@ -2611,9 +3618,15 @@ class DisasterService:
         Returns:
             List of earthquake dictionaries
         """
+        cache_key = (round(lat, 2), round(lon, 2), max_radius_km, days)
+        with self._earthquake_cache_lock:
+            cached_result = self._earthquake_cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result
+
         try:
             from datetime import datetime, timedelta
-            
+
             # Calculate start time (now - days)
             start_time = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%dT%H:%M:%S')
             
@@ -2627,45 +3640,73 @@ class DisasterService:
                 'minmagnitude': 4.0  # Only significant earthquakes
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = HTTP_SESSION.get(url, params=params, timeout=10)
             if response.status_code != 200:
                 return []
             
-            data = response.json()
+            data = orjson.loads(response.content)
             earthquakes = []
+
+            features = [
+                f for f in data.get('features', [])
+                if len(f.get('geometry', {}).get('coordinates', [])) >= 2
+            ]
+
+            if features:
+                # One vectorized Haversine pass over every event, instead of
+                # Python-level trig per feature — USGS returns hundreds
+                coords = np.array(
+                    [f['geometry']['coordinates'][:2] for f in features],
+                    dtype=np.float64)
+                eq_lon = np.radians(coords[:, 0])
+                eq_lat = np.radians(coords[:, 1])
+                lat_rad = math.radians(lat)
+                lon_rad = math.radians(lon)
+
+                a = (np.sin((eq_lat - lat_rad) / 2) ** 2 +
+                     math.cos(lat_rad) * np.cos(eq_lat) *
+                     np.sin((eq_lon - lon_rad) / 2) ** 2)
+                distances = 2 * _EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+                # Filter: only show events within 300-500 km; dicts are
+                # built only for surviving rows
+                keep = np.nonzero((distances >= 300) & (distances <= 500))[0]
+                if keep.size:
+                    # Event ages in one datetime64 subtraction over the
+                    # epoch-ms column, instead of a datetime construction
+                    # and timedelta walk per event
+                    times_ms = np.array(
+                        [features[i].get('properties', {}).get('time', 0)
+                         for i in keep],
+                        dtype=np.int64)
+                    age_minutes = (
+                        (np.datetime64('now', 'ms') - times_ms.astype('datetime64[ms]'))
+                        .astype('timedelta64[m]').astype(np.int64))
+
+                    for row, idx in enumerate(keep):
+                        props = features[idx].get('properties', {})
+                        distance_km = float(distances[idx])
+                        # fromtimestamp keeps the local-time ISO string the
+                        # API has always returned
+                        event_time = datetime.fromtimestamp(times_ms[row] / 1000)
+
+                        earthquakes.append({
+                            'type': 'earthquake',
+                            'title': f"Earthquake M{props.get('mag', 0):.1f}",
+                            'severity': self._get_earthquake_severity(props.get('mag', 0)),
+                            'distance_km': round(distance_km, 0),
+                            'time': self._format_age_minutes(int(age_minutes[row])),
+                            'source': 'USGS',
+                            'magnitude': props.get('mag', 0),
+                            'timestamp': event_time.isoformat()
+                        })
             
-            if 'features' in data:
-                for feature in data['features']:
-                    props = feature.get('properties', {})
-                    geom = feature.get('geometry', {})
-                    coords = geom.get('coordinates', [])
-                    
-                    if len(coords) >= 2:
-                        eq_lon, eq_lat = coords[0], coords[1]
-                        
-                        # Calculate distance from locality
-                        distance_km = self._calculate_distance(lat, lon, eq_lat, eq_lon)
-                        
-                        # Filter: only show events within 300-500 km
-                        if 300 <= distance_km <= 500:
-                            # Parse time
-                            time_ms = props.get('time', 0)
-                            event_time = datetime.fromtimestamp(time_ms / 1000)
-                            time_ago = self._format_time_ago(event_time)
-                            
-                            earthquakes.append({
-                                'type': 'earthquake',
-                                'title': f"Earthquake M{props.get('mag', 0):.1f}",
-                                'severity': self._get_earthquake_severity(props.get('mag', 0)),
-                                'distance_km': round(distance_km, 0),
-                                'time': time_ago,
-                                'source': 'USGS',
-                                'magnitude': props.get('mag', 0),
-                                'timestamp': event_time.isoformat()
-                            })
-            
+            # Only successful fetches are cached; errors stay uncached so
+            # the next call retries immediately
+            with self._earthquake_cache_lock:
+                self._earthquake_cache[cache_key] = earthquakes
             return earthquakes
-            
+
         except Exception as e:
             # Return empty list on error, don't block the analysis
             return []
@@ -2683,11 +3724,11 @@ class DisasterService:
         """
         try:
             url = "https://www.nhc.noaa.gov/CurrentStorms.json"
-            response = requests.get(url, timeout=10)
+            response = HTTP_SESSION.get(url, timeout=10)
             if response.status_code != 200:
                 return []
             
-            data = response.json()
+            data = orjson.loads(response.content)
             cyclones = []
             
             # NOAA JSON structure may vary, try to parse it
@@ -2748,17 +3789,17 @@ class DisasterService:
                 'exclude': 'minutely,hourly,daily'
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = HTTP_SESSION.get(url, params=params, timeout=10)
             
             # If 3.0 fails, try 2.5 (free tier, but may not have alerts)
             if response.status_code != 200:
                 url = "https://api.openweathermap.org/data/2.5/onecall"
-                response = requests.get(url, params=params, timeout=10)
+                response = HTTP_SESSION.get(url, params=params, timeout=10)
             
             if response.status_code != 200:
                 return []
             
-            data = response.json()
+            data = orjson.loads(response.content)
             alerts = []
             
             if 'alerts' in data and data['alerts']:
@@ -2821,25 +3862,57 @@ class DisasterService:
                 all_disasters.extend(future_weather.result(timeout=10))
             except:
                 pass
-        
+
         return all_disasters
-    
+
+    async def get_all_disasters_async(self, lat: float, lon: float) -> List[Dict]:
+        """
+        Async twin of get_all_disasters for event-loop callers
+
+        The three feeds are independent blocking HTTP calls, so each runs
+        via asyncio.to_thread and the batch is awaited with asyncio.gather
+        — total latency is the slowest feed instead of the sum, without the
+        sync path's private thread pool competing with the loop.
+        """
+        results = await asyncio.gather(
+            asyncio.to_thread(self.get_earthquakes, lat, lon),
+            asyncio.to_thread(self.get_cyclones, lat, lon),
+            asyncio.to_thread(self.get_weather_alerts, lat, lon),
+            return_exceptions=True
+        )
+
+        all_disasters = []
+        for result in results:
+            if isinstance(result, list):
+                all_disasters.extend(result)
+        return all_disasters
+
+
     def _calculate_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """Calculate distance between two points in km using Haversine formula"""
-        from math import radians, sin, cos, sqrt, atan2
-        
         R = 6371  # Earth radius in km
-        
-        lat1_rad = radians(lat1)
-        lat2_rad = radians(lat2)
-        delta_lat = radians(lat2 - lat1)
-        delta_lon = radians(lon2 - lon1)
-        
-        a = sin(delta_lat / 2)**2 + cos(lat1_rad) * cos(lat2_rad) * sin(delta_lon / 2)**2
-        c = 2 * atan2(sqrt(a), sqrt(1 - a))
-        
+
+        lat1_rad = math.radians(lat1)
+        lat2_rad = math.radians(lat2)
+        delta_lat = math.radians(lat2 - lat1)
+        delta_lon = math.radians(lon2 - lon1)
+
+        a = math.sin(delta_lat / 2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2)**2
+        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
         return R * c
     
+    @staticmethod
+    def _format_age_minutes(minutes: int) -> str:
+        """Format an integer age in minutes as 'X minutes/hours/days ago'"""
+        days = minutes // 1440
+        if days > 0:
+            return f"{days} day{'s' if days > 1 else ''} ago"
+        hours = minutes // 60
+        if hours > 0:
+            return f"{hours} hour{'s' if hours > 1 else ''} ago"
+        return f"{minutes} minute{'s' if minutes > 1 else ''} ago"
+
     def _format_time_ago(self, event_time: datetime) -> str:
         """Format time as 'X hours/days ago'"""
         now = datetime.now()
@@ -3132,7 +4205,7 @@ class NewsService:
                 'apiKey': self.api_key
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = HTTP_SESSION.get(url, params=params, timeout=10)
             
             if response.status_code != 200:
                 # Handle rate limiting or errors gracefully
@@ -3142,7 +4215,7 @@ class NewsService:
                     print(f"NewsAPI error: {response.status_code}")
                 return []
             
-            data = response.json()
+            data = orjson.loads(response.content)
             articles = data.get('articles', [])
             
             # Format news headlines
@@ -3194,12 +4267,12 @@ class WeatherService:
             'units': 'metric'
         }
         
-        response = requests.get(url, params=params)
+        response = HTTP_SESSION.get(url, params=params)
         if response.status_code != 200:
             raise RuntimeError(f"OpenWeather API error: {response.status_code} - {response.text}")
         
-        data = response.json()
-        
+        data = orjson.loads(response.content)
+
         # Get precipitation from rain or snow if available
         precipitation = 0.0
         if 'rain' in data:
@@ -3226,11 +4299,11 @@ class WeatherService:
             'units': 'metric'
         }
         
-        response = requests.get(url, params=params)
+        response = HTTP_SESSION.get(url, params=params)
         if response.status_code != 200:
             raise RuntimeError(f"OpenWeather API forecast error: {response.status_code}")
         
-        forecast = response.json()
+        forecast = orjson.loads(response.content)
         return forecast.get('list', [])[:days * 8]  # 8 forecasts per day
     
     def get_air_quality(self, lat: float, lon: float) -> AirQualityData:
@@ -3252,18 +4325,18 @@ class WeatherService:
         }
         
         # Increase timeout to handle slow connections (30 seconds)
-        response = requests.get(url, params=params, timeout=30)
+        response = HTTP_SESSION.get(url, params=params, timeout=30)
         if response.status_code != 200:
             error_msg = f"OpenWeather Air Pollution API error: {response.status_code}"
             try:
-                error_detail = response.json()
+                error_detail = orjson.loads(response.content)
                 error_msg += f" - {error_detail}"
             except:
                 error_msg += f" - {response.text}"
             raise RuntimeError(error_msg)
         
-        data = response.json()
-        
+        data = orjson.loads(response.content)
+
         # Debug: Print response structure if needed
         # print(f"Air Quality API Response: {json.dumps(data, indent=2)}")
         
@@ -4457,7 +5530,6 @@ class GeospatialIntelligenceSystem:
                  supabase_url: Optional[str] = None, supabase_key: Optional[str] = None,
                  newsapi_key: Optional[str] = None, gemini_api_key: Optional[str] = None):
         self.geocoding = GeocodingService(opencage_key)
-        self.ee_service = EarthEngineService(project=earthengine_project)
         self.classifier = LandCoverClassifier()
         self.spectral_classifier = SpectralIndexClassifier()
         self.weather = WeatherService(openweather_key)
@@ -4468,17 +5540,33 @@ class GeospatialIntelligenceSystem:
         self.economic_analyzer = EconomicImpactAnalyzer()
         self.supabase = SupabaseService(supabase_url, supabase_key)
         self.news = NewsService(newsapi_key)
-        
-        # Initialize Gemini service (optional - only if API key provided)
+
+        # Earth Engine and Gemini are deferred to first use (cached_property
+        # below): their auth/config round-trips would otherwise run in every
+        # worker at import time, slowing cold start even for endpoints that
+        # never touch them.
+        self._earthengine_project = earthengine_project
+        self._gemini_api_key = gemini_api_key
+
+    @cached_property
+    def ee_service(self) -> 'EarthEngineService':
+        """Earth Engine service, authenticated lazily on first use"""
+        return EarthEngineService.instance(project=self._earthengine_project)
+
+    @cached_property
+    def crop_recommendation(self) -> Optional['GeminiCropRecommendationService']:
+        """Gemini service, configured lazily on first use (None if unavailable)"""
         try:
-            self.crop_recommendation = GeminiCropRecommendationService(gemini_api_key)
+            return GeminiCropRecommendationService(self._gemini_api_key)
         except (ValueError, ImportError) as e:
             print(f"Warning: Gemini API not available: {e}")
-            self.crop_recommendation = None
-        
-        # Initialize physical feature detector
-        self.feature_detector = PhysicalFeatureDetector(self.ee_service, self.geocoding)
-    
+            return None
+
+    @cached_property
+    def feature_detector(self) -> 'PhysicalFeatureDetector':
+        """Physical feature detector, created on first use (pulls in Earth Engine)"""
+        return PhysicalFeatureDetector(self.ee_service, self.geocoding)
+
     def analyze_locality(self, city_name: str, locality_name: str, 
                         locality_polygon: ee.Geometry, locality_bbox: BoundingBox,
                         start_date: str = None, end_date: str = None) -> Dict:
@@ -4515,7 +5603,7 @@ class GeospatialIntelligenceSystem:
             # Create bbox for fixed AOI (1km × 1km)
             radius_km = 0.5
             radius_degrees_lat = radius_km / 111.0
-            radius_degrees_lon = radius_km / (111.0 * abs(np.cos(np.radians(center_lat))))
+            radius_degrees_lon = radius_km / (111.0 * abs(math.cos(math.radians(center_lat))))
             fixed_bbox = BoundingBox(
                 min_lon=center_lon - radius_degrees_lon,
                 min_lat=center_lat - radius_degrees_lat,
@@ -4860,18 +5948,18 @@ class GeospatialIntelligenceSystem:
                 'exclude': 'minutely,hourly,daily,current'
             }
             
-            response = requests.get(url, params=params, timeout=15)
+            response = HTTP_SESSION.get(url, params=params, timeout=15)
             
             # If 3.0 fails (not subscribed), try 2.5 (may not have alerts)
             if response.status_code != 200:
                 url = "https://api.openweathermap.org/data/2.5/onecall"
-                response = requests.get(url, params=params, timeout=15)
+                response = HTTP_SESSION.get(url, params=params, timeout=15)
             
             if response.status_code != 200:
                 # No alerts available or API error
                 return []
             
-            data = response.json()
+            data = orjson.loads(response.content)
             alerts = []
             
             # Extract alerts from response
@@ -5215,73 +6303,106 @@ class GeospatialIntelligenceSystem:
             'land_cover_summary': land_cover_result['land_cover_percentages']
         }
     
-    def analyze_time_series(self, location: str, buffer_radius_km: float = 2.0,
-                           start_date: str = None, end_date: str = None,
-                           interval_years: int = 1) -> Dict:
+    def iter_time_series(self, location: str, buffer_radius_km: float = 2.0,
+                         start_date: str = None, end_date: str = None,
+                         interval_years: int = 1):
         """
-        Analyze land cover changes over time
-        
+        Yield one land-cover snapshot per analysis interval
+
+        Generator form of analyze_time_series: each interval is yielded as
+        soon as it is computed, so callers can stream results (e.g. NDJSON
+        over HTTP) instead of holding the whole range in memory.
+
         Args:
             location: Location name or coordinates
             buffer_radius_km: Buffer radius in kilometers
             start_date: Start date (YYYY-MM-DD), defaults to 5 years ago
             end_date: End date (YYYY-MM-DD), defaults to now
             interval_years: Analysis interval in years (default 1 year)
-            
-        Returns:
-            Dictionary with time-series data
+
+        Yields:
+            Dictionary per interval with year, date, land_cover and satellite_date
         """
         from datetime import datetime, timedelta
-        
+
         if not end_date:
             end_date = datetime.now().strftime('%Y-%m-%d')
         if not start_date:
             start_date = (datetime.now() - timedelta(days=5*365)).strftime('%Y-%m-%d')
-        
+
         start_dt = datetime.strptime(start_date, '%Y-%m-%d')
         end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-        
-        time_series_data = []
+
         current_date = start_dt
-        
+
         while current_date <= end_dt:
             year_start = current_date.strftime('%Y-%m-%d')
             year_end = (current_date + timedelta(days=365)).strftime('%Y-%m-%d')
-            
+
             try:
                 result = self.analyze_sentinel2(
                     location, buffer_radius_km, year_start, year_end
                 )
-                
-                time_series_data.append({
+
+                yield {
                     'year': current_date.year,
                     'date': year_start,
                     'land_cover': result['land_cover_percentages'],
                     'satellite_date': result.get('methodology_summary', {}).get('satellite_date')
-                })
+                }
             except Exception as e:
                 print(f"Warning: Failed to analyze {year_start}: {str(e)}")
-            
+
             current_date += timedelta(days=365 * interval_years)
-        
-        # Calculate changes
-        changes = {}
-        if len(time_series_data) >= 2:
-            first = time_series_data[0]['land_cover']
-            last = time_series_data[-1]['land_cover']
-            
-            changes = {
-                'urban_change': round(last['urban'] - first['urban'], 2),
-                'forest_change': round(last['forest'] - first['forest'], 2),
-                'vegetation_change': round(last['vegetation'] - first['vegetation'], 2),
-                'water_change': round(last['water'] - first['water'], 2),
-                'period_years': len(time_series_data) - 1
-            }
-        
+
+    @staticmethod
+    def summarize_time_series_changes(time_series_data: List[Dict]) -> Dict:
+        """Compute first-to-last land cover changes for a time series"""
+        if len(time_series_data) < 2:
+            return {}
+
+        first = time_series_data[0]['land_cover']
+        last = time_series_data[-1]['land_cover']
+
+        return {
+            'urban_change': round(last['urban'] - first['urban'], 2),
+            'forest_change': round(last['forest'] - first['forest'], 2),
+            'vegetation_change': round(last['vegetation'] - first['vegetation'], 2),
+            'water_change': round(last['water'] - first['water'], 2),
+            'period_years': len(time_series_data) - 1
+        }
+
+    def analyze_time_series(self, location: str, buffer_radius_km: float = 2.0,
+                           start_date: str = None, end_date: str = None,
+                           interval_years: int = 1) -> Dict:
+        """
+        Analyze land cover changes over time
+
+        Args:
+            location: Location name or coordinates
+            buffer_radius_km: Buffer radius in kilometers
+            start_date: Start date (YYYY-MM-DD), defaults to 5 years ago
+            end_date: End date (YYYY-MM-DD), defaults to now
+            interval_years: Analysis interval in years (default 1 year)
+
+        Returns:
+            Dictionary with time-series data
+        """
+        from datetime import datetime, timedelta
+
+        if not end_date:
+            end_date = datetime.now().strftime('%Y-%m-%d')
+        if not start_date:
+            start_date = (datetime.now() - timedelta(days=5*365)).strftime('%Y-%m-%d')
+
+        time_series_data = list(self.iter_time_series(
+            location, buffer_radius_km, start_date, end_date, interval_years
+        ))
+
         return {
             'location': location,
             'time_series': time_series_data,
-            'changes': changes,
+            'changes': self.summarize_time_series_changes(time_series_data),
             'start_date': start_date,
             'end_date': end_date,
             'interval_years': interval_years
@@ -5479,7 +6600,13 @@ class GeospatialIntelligenceSystem:
             
             # Step 4: Aggregate Dynamic World classes and calculate percentages
             # Use STRICT mapping (NO adaptive logic)
-            land_cover, _ = self.classifier.aggregate_classes(pixel_counts_raw, None, None, None)
+            # For small AOIs, fetch the label raster so the forest rule can
+            # use true patch contiguity instead of the pixel-count proxy
+            label_raster = None
+            if NUMBA_AVAILABLE:
+                label_raster = self.ee_service.get_label_raster(dw_image, city_polygon, scale=30)
+            land_cover, _ = self.classifier.aggregate_classes(
+                pixel_counts_raw, None, None, None, landcover_array=label_raster)
             
             # Step 5: Get weather data
             weather_data = self.weather.get_weather_data(center_lat, center_lon)